@@ -2,10 +2,12 @@
 // use crate::audio_loopback::quality_filter::{estimate_transcription_confidence, is_transcription_quality_ok};
 use anyhow::Result;
 use tauri::{AppHandle, Emitter};
-use base64::prelude::*;
 use serde_json;
 use std::fs::OpenOptions;
-use std::io::Write;
+use std::io::{BufWriter, Write};
+use std::sync::Mutex;
+use std::sync::mpsc::{self, Sender};
+use crate::audio_loopback::resampler::PolyphaseResampler;
 
 // Audio processing for transcription with improved quality filtering
 #[tauri::command]
@@ -17,16 +19,30 @@ pub async fn process_audio_for_transcription(
     // First process the audio through our pipeline to match Python's fast_audio_process
     // println!("[PROCESS] Input: {} bytes, {} Hz", audio_data.len(), sample_rate); // Commented out: Audio loopback is working, reducing console noise for debugging focus
     
-    let processed_samples = process_audio_chunk(
-        &audio_data,
-        16,  // We're receiving PCM16
-        2,   // Stereo input expected
-        sample_rate,
-        16000  // Target Whisper sample rate
-    );
+    // Stays in int16 end to end - the samples go straight back out as PCM16
+    let processed_samples = AudioChunkProcessor::new(sample_rate, 16000)  // Target Whisper sample rate
+        .process(
+            &audio_data,
+            16,  // We're receiving PCM16
+            2,   // Stereo input expected
+        );
     
     // println!("[PROCESS] Output: {} samples at 16kHz", processed_samples.len()); // Commented out: Audio loopback is working, reducing console noise for debugging focus
     
+    let energy = sum_of_squares(&processed_samples);
+    transcribe_loopback_samples(processed_samples, energy, app_handle).await
+}
+
+// Transcribe a window of 16kHz mono PCM16 that has already been through the chunk
+// pipeline, given the window's exact sum of squares. The capture loop's transcription
+// worker calls this directly with the ring buffer contents and the energy the ring
+// already tracks, so the window goes to Whisper without a bytes round trip or another
+// pass over it for the level.
+pub async fn transcribe_loopback_samples(
+    processed_samples: Vec<i16>,
+    sum_of_squares: i64,
+    app_handle: AppHandle
+) -> Result<String, String> {
     // Check minimum audio length (1.5 seconds at 16kHz)
     let min_samples = (16000.0 * 1.5) as usize;
     if processed_samples.len() < min_samples {
@@ -34,9 +50,9 @@ pub async fn process_audio_for_transcription(
         return Ok("".to_string());
     }
     
-    // Calculate RMS on processed samples
-    let rms = (processed_samples.iter().map(|&x| x * x).sum::<f32>() / processed_samples.len() as f32).sqrt();
-    let db_level = if rms > 0.0 { 20.0 * rms.log10() } else { -60.0 };
+    // RMS of the processed samples (normalized to [-1.0, 1.0]) from the known energy
+    let rms = ((sum_of_squares as f64 / processed_samples.len() as f64).sqrt() / 32768.0) as f32;
+    let db_level = audio_level_from_energy(sum_of_squares, processed_samples.len());
     
     // Python checks RMS on int16 samples: rms < 100 
     // For int16, RMS of 100 = 100/32768 = 0.00305 in float32
@@ -45,20 +61,14 @@ pub async fn process_audio_for_transcription(
         return Ok("".to_string());
     }
     
-    // Convert processed samples back to PCM16 bytes for Whisper
-    let pcm16_samples: Vec<i16> = processed_samples.iter()
-        .map(|&sample| (sample * 32767.0).clamp(-32768.0, 32767.0) as i16)
-        .collect();
-    
-    let pcm16_bytes: Vec<u8> = pcm16_samples.iter()
-        .flat_map(|&sample| sample.to_le_bytes())
-        .collect();
-    
-    // SIMPLIFIED APPROACH: Use file-based method with improved quality filtering
-    // The direct method was hanging, so let's use what works and fix the quality filtering
-    log_transcription_debug("[MAIN] Using file-based transcription with improved filtering...", rms, db_level);
+    // Loud enough is not the same as speech - background noise and music beds clear
+    // the RMS gate but would still cost a full Whisper encoder pass
+    if !contains_speech(&processed_samples) {
+        log_transcription_debug("[PROCESS] No speech detected - skipping", rms, db_level);
+        return Ok("".to_string());
+    }
     
-    let audio_base64 = base64::prelude::BASE64_STANDARD.encode(&pcm16_bytes);
+    log_transcription_debug("[MAIN] Using in-memory transcription with improved filtering...", rms, db_level);
     
     // Load settings to get the selected loopback whisper model
     let model_size = match crate::audio_loopback::settings::load_general_settings().await {
@@ -87,7 +97,7 @@ pub async fn process_audio_for_transcription(
         maxSegmentLength: 30,
     };
     
-    match crate::speech::transcribe_audio_base64(audio_base64, config).await {
+    match crate::speech::transcribe_pcm16(&processed_samples, config).await {
         Ok(result) => {
             let text = result.text.trim();
             log_transcription_debug(&format!("[MAIN] Raw Whisper result: '{}'", text), rms, db_level);
@@ -129,189 +139,303 @@ pub async fn process_audio_for_transcription(
     }
 }
 
-// Audio processing functions - matching sandbox implementation
-pub fn process_audio_chunk(
-    audio_data: &[u8],
-    bits_per_sample: u16,
-    channels: u16,
+// How long a stereo channel decision is trusted before the L/R statistics are re-probed
+// (catches the source or device changing mid-session)
+const STEREO_REPROBE_SECONDS: usize = 30;
+
+// Per-capture-session chunk processor. Holds the resampler so its filter is designed
+// once per session and its history carries across consecutive capture buffers, plus
+// scratch buffers that are reused for every chunk.
+pub struct AudioChunkProcessor {
     input_sample_rate: u32,
-    output_sample_rate: u32
-) -> Vec<f32> {
-    if audio_data.is_empty() || channels == 0 || (bits_per_sample != 16 && bits_per_sample != 32) {
-        // println!("[CHUNK] Invalid input: empty={}, channels={}, bits={}", 
-        //          audio_data.is_empty(), channels, bits_per_sample);
-        // Commented out: Audio loopback is working, reducing console noise for debugging focus
-        return Vec::new();
+    output_sample_rate: u32,
+    resampler: Option<PolyphaseResampler>,
+    samples: Vec<i16>,
+    mono: Vec<i16>,
+    // Channel picked by the last stereo probe and how many frames it has been used for
+    stereo_channel: Option<usize>,
+    frames_since_stereo_probe: usize,
+}
+
+impl AudioChunkProcessor {
+    pub fn new(input_sample_rate: u32, output_sample_rate: u32) -> Self {
+        // Every rate change, 48k->16k included, goes through the anti-aliased polyphase
+        // filter; only matching rates pass straight through
+        let resampler = if input_sample_rate == output_sample_rate {
+            None
+        } else {
+            Some(PolyphaseResampler::new(input_sample_rate, output_sample_rate))
+        };
+        
+        Self {
+            input_sample_rate,
+            output_sample_rate,
+            resampler,
+            samples: Vec::new(),
+            mono: Vec::new(),
+            stereo_channel: None,
+            frames_since_stereo_probe: 0,
+        }
     }
     
-    // println!("[CHUNK] Processing: {} bytes, {}bit, {}ch, {}Hz -> {}Hz",
-    //          audio_data.len(), bits_per_sample, channels, input_sample_rate, output_sample_rate);
-    // Commented out: Audio loopback is working, reducing console noise for debugging focus
-    
-    // Step 1: Convert to i16 samples - MATCHING PYTHON EXACTLY
-    let mut i16_samples = Vec::new();
-    
-    match bits_per_sample {
-        32 => {
-            if audio_data.len() % 4 != 0 { return Vec::new(); }
-            for chunk in audio_data.chunks_exact(4) {
-                let sample = f32::from_le_bytes([chunk[0], chunk[1], chunk[2], chunk[3]]);
-                if sample.is_finite() && sample.abs() <= 2.0 {
-                    let sample_i16 = (sample * 32767.0).clamp(-32768.0, 32767.0) as i16;
-                    i16_samples.push(sample_i16);
-                } else {
-                    i16_samples.push(0);
-                }
-            }
-        },
-        16 => {
-            if audio_data.len() % 2 != 0 { return Vec::new(); }
-            for chunk in audio_data.chunks_exact(2) {
-                let sample_i16 = i16::from_le_bytes([chunk[0], chunk[1]]);
-                i16_samples.push(sample_i16);
-            }
-        },
-        _ => return Vec::new()
+    /// Returns mono PCM16 at the output rate. Samples stay int16 so the capture loop can
+    /// buffer, measure and forward them without a float round trip.
+    pub fn process(&mut self, audio_data: &[u8], bits_per_sample: u16, channels: u16) -> Vec<i16> {
+        let mut output = Vec::new();
+        self.process_into(audio_data, bits_per_sample, channels, &mut output);
+        output
     }
     
-    // Step 2: EXACT Python stereo handling logic
-    let mut audio_mono = if channels == 2 {
-        // Reshape into stereo pairs
-        let stereo_pairs: Vec<[i16; 2]> = i16_samples
-            .chunks_exact(2)
-            .map(|chunk| [chunk[0], chunk[1]])
-            .collect();
+    /// Same as `process`, writing into a caller-owned buffer so the capture loop does not
+    /// allocate per chunk. `output` is cleared first.
+    pub fn process_into(&mut self, audio_data: &[u8], bits_per_sample: u16, channels: u16, output: &mut Vec<i16>) {
+        let input_sample_rate = self.input_sample_rate;
+        let output_sample_rate = self.output_sample_rate;
+        output.clear();
         
-        if stereo_pairs.is_empty() {
-            Vec::new()
-        } else {
-            let left_channel: Vec<i16> = stereo_pairs.iter().map(|pair| pair[0]).collect();
-            let right_channel: Vec<i16> = stereo_pairs.iter().map(|pair| pair[1]).collect();
-            
-            // Calculate stereo difference - Python: np.mean(np.abs(left - right))
-            let stereo_diff: f32 = left_channel.iter()
-                .zip(right_channel.iter())
-                .map(|(&l, &r)| ((l as f32) - (r as f32)).abs())
-                .sum::<f32>() / left_channel.len() as f32;
-            
-            if stereo_diff > 200.0 {
-                // True stereo - Python: np.mean(channel**2)
-                let left_rms: f32 = left_channel.iter()
-                    .map(|&s| (s as f32) * (s as f32))
-                    .sum::<f32>() / left_channel.len() as f32;
-                
-                let right_rms: f32 = right_channel.iter()
-                    .map(|&s| (s as f32) * (s as f32))
-                    .sum::<f32>() / right_channel.len() as f32;
-                
-                if left_rms > right_rms { left_channel } else { right_channel }
-            } else {
-                // Mono in stereo format - use left channel
-                left_channel
-            }
+        if audio_data.is_empty() || channels == 0 || (bits_per_sample != 16 && bits_per_sample != 32) {
+            // println!("[CHUNK] Invalid input: empty={}, channels={}, bits={}", 
+            //          audio_data.is_empty(), channels, bits_per_sample);
+            // Commented out: Audio loopback is working, reducing console noise for debugging focus
+            return;
         }
-    } else {
-        i16_samples
-    };
-    
-    // Step 3: DC offset removal - EXACTLY matching Python
-    if !audio_mono.is_empty() {
-        let dc_offset: f32 = audio_mono.iter()
-            .map(|&s| s as f32)
-            .sum::<f32>() / audio_mono.len() as f32;
         
-        // Python checks if abs(dc_offset) > 100
-        if dc_offset.abs() > 100.0 {
-            let dc_offset_i16 = dc_offset as i16;
-            for sample in &mut audio_mono {
-                *sample = sample.saturating_sub(dc_offset_i16);
-            }
-        }
-    }
-    
-    // Step 4: Resampling - MATCHING Python decimation logic
-    if input_sample_rate != output_sample_rate && !audio_mono.is_empty() {
-        audio_mono = match (input_sample_rate, output_sample_rate) {
-            (48000, 16000) => {
-                // Python: audio_mono[::3] - simple 3:1 decimation
-                audio_mono.into_iter().step_by(3).collect()
-            },
-            (44100, 16000) => {
-                // Python approximate decimation
-                let factor = input_sample_rate as f32 / output_sample_rate as f32;
-                let mut resampled = Vec::new();
-                let mut i = 0.0;
-                while i < audio_mono.len() as f32 {
-                    let index = i as usize;
-                    if index < audio_mono.len() {
-                        resampled.push(audio_mono[index]);
+        // println!("[CHUNK] Processing: {} bytes, {}bit, {}ch, {}Hz -> {}Hz",
+        //          audio_data.len(), bits_per_sample, channels, input_sample_rate, output_sample_rate);
+        // Commented out: Audio loopback is working, reducing console noise for debugging focus
+        
+        // Step 1: Convert to i16 samples - MATCHING PYTHON EXACTLY
+        let i16_samples = &mut self.samples;
+        i16_samples.clear();
+        match bits_per_sample {
+            32 => {
+                if audio_data.len() % 4 != 0 { return; }
+                i16_samples.extend(audio_data.chunks_exact(4).map(|chunk| {
+                    let sample = f32::from_le_bytes([chunk[0], chunk[1], chunk[2], chunk[3]]);
+                    if sample.is_finite() && sample.abs() <= 2.0 {
+                        (sample * 32767.0).clamp(-32768.0, 32767.0) as i16
+                    } else {
+                        0
                     }
-                    i += factor;
-                }
-                resampled
+                }));
             },
-            _ => {
-                // For other rates, keep as-is (Python would use scipy.signal.resample)
-                // We'll rely on Whisper to handle the resampling
-                audio_mono
+            16 => {
+                if audio_data.len() % 2 != 0 { return; }
+                i16_samples.extend(audio_data.chunks_exact(2).map(|chunk| i16::from_le_bytes([chunk[0], chunk[1]])));
+            },
+            _ => return
+        }
+        
+        // Steps 2-4 are fused: one statistics pass over the interleaved frames, then one
+        // pass that extracts the chosen channel, removes DC and decimates - no per-channel
+        // or intermediate mono buffers
+        let channels = channels as usize;
+        let frame_count = i16_samples.len() / channels;
+        if frame_count == 0 {
+            return;
+        }
+        
+        // Step 2: EXACT Python stereo handling logic. The L/R relationship of a loopback
+        // source is stable, so the decision is cached and only re-probed periodically;
+        // in between only the chosen channel's sum (for DC removal) is needed
+        let reprobe_after = self.input_sample_rate as usize * STEREO_REPROBE_SECONDS;
+        let cached_channel = match self.stereo_channel {
+            Some(channel) if channels == 2 && self.frames_since_stereo_probe < reprobe_after => Some(channel),
+            _ => None,
+        };
+        
+        let (channel, channel_sum) = if let Some(channel) = cached_channel {
+            self.frames_since_stereo_probe += frame_count;
+            (channel, i16_samples.iter().skip(channel).step_by(2).map(|&s| s as i64).sum::<i64>())
+        } else if channels == 2 {
+            let mut stereo_diff_sum = 0i64;
+            let (mut left_sum, mut right_sum) = (0i64, 0i64);
+            let (mut left_energy, mut right_energy) = (0i64, 0i64);
+            
+            for frame in i16_samples.chunks_exact(2) {
+                let (l, r) = (frame[0] as i32, frame[1] as i32);
+                stereo_diff_sum += (l - r).abs() as i64;
+                left_sum += l as i64;
+                right_sum += r as i64;
+                left_energy += (l * l) as i64;
+                right_energy += (r * r) as i64;
             }
+            
+            // Python: np.mean(np.abs(left - right)) > 200, then the louder channel by
+            // np.mean(channel**2); both compared as exact integer sums
+            let decision = if stereo_diff_sum > 200 * frame_count as i64 && left_energy <= right_energy {
+                (1, right_sum)
+            } else {
+                // Mono in stereo format (or louder left) - use left channel
+                (0, left_sum)
+            };
+            self.stereo_channel = Some(decision.0);
+            self.frames_since_stereo_probe = frame_count;
+            decision
+        } else {
+            // Mono, or multichannel where the first channel is used
+            (0, i16_samples.iter().step_by(channels).map(|&s| s as i64).sum::<i64>())
         };
+        
+        // Step 3: DC offset removal - EXACTLY matching Python
+        // Python checks if abs(dc_offset) > 100
+        let dc_offset = channel_sum as f32 / frame_count as f32;
+        let dc_offset_i16 = if dc_offset.abs() > 100.0 { dc_offset as i16 } else { 0 };
+        
+        let mono = i16_samples.iter()
+            .skip(channel)
+            .step_by(channels)
+            .map(|&sample| sample.saturating_sub(dc_offset_i16));
+        
+        // Step 4: Resampling
+        match self.resampler.as_mut() {
+            Some(resampler) => {
+                // Polyphase FIR (Python: scipy.signal.resample_poly / upfirdn) - anti-
+                // aliased, replaces the nearest-neighbour 44.1k decimation, the unfiltered
+                // 48k [::3] and the pass-through that other device rates used to get
+                self.mono.clear();
+                self.mono.extend(mono);
+                output.reserve(frame_count * output_sample_rate as usize / input_sample_rate as usize + 1);
+                resampler.process(&self.mono, output);
+            },
+            None => output.extend(mono)
+        }
     }
-    
-    // Step 5: Convert to f32 normalized [-1.0, 1.0]
-    audio_mono.iter().map(|&sample| sample as f32 / 32768.0).collect()
 }
 
 
-pub fn calculate_audio_level(audio_data: &[f32]) -> f32 {
-    if audio_data.is_empty() {
+// Level in dBFS, floored at -60. Sum of squares is accumulated exactly in i64 and
+// 10*log10(mean_square) replaces 20*log10(sqrt(mean_square)) - no per-sample float work.
+pub fn calculate_audio_level(audio_data: &[i16]) -> f32 {
+    audio_level_from_energy(sum_of_squares(audio_data), audio_data.len())
+}
+
+// Exact sum of squares of PCM16 samples
+pub fn sum_of_squares(samples: &[i16]) -> i64 {
+    samples.iter().map(|&s| (s as i32 * s as i32) as i64).sum()
+}
+
+// Same level from an already-known sum of squares (transcribe_loopback_samples gets the
+// window's from the capture ring, which tracks it as samples come and go)
+pub fn audio_level_from_energy(sum_of_squares: i64, sample_count: usize) -> f32 {
+    if sum_of_squares <= 0 || sample_count == 0 {
         return -60.0;
     }
     
-    let rms = (audio_data.iter().map(|&x| x * x).sum::<f32>() / audio_data.len() as f32).sqrt();
-    
-    if rms > 0.0 {
-        20.0 * rms.log10().max(-60.0)
-    } else {
-        -60.0
+    let mean_square = sum_of_squares as f64 / sample_count as f64 / (32768.0 * 32768.0);
+    ((10.0 * mean_square.log10()) as f32).max(-60.0)
+}
+
+// Energy + zero-crossing VAD (Python: webrtcvad) over 30ms frames at 16kHz. A frame
+// counts as speech when it is loud enough and its zero-crossing rate sits in the voiced
+// range - below that is hum, above it is broadband noise/hiss.
+const VAD_FRAME_SAMPLES: usize = 480;
+const VAD_MIN_FRAME_RMS: i64 = 300;
+const VAD_MIN_ZERO_CROSSING_RATE: f32 = 0.01;
+const VAD_MAX_ZERO_CROSSING_RATE: f32 = 0.3;
+// Windows with fewer speech frames than this never reach Whisper
+const VAD_MIN_SPEECH_FRACTION: f32 = 0.2;
+
+// Fraction of full 30ms frames in `samples` (16kHz mono) that look like speech
+pub fn speech_frame_fraction(samples: &[i16]) -> f32 {
+    let frame_count = samples.len() / VAD_FRAME_SAMPLES;
+    if frame_count == 0 {
+        return 0.0;
     }
+    
+    let speech_frames = samples.chunks_exact(VAD_FRAME_SAMPLES)
+        .filter(|frame| {
+            let sum_of_squares: i64 = frame.iter()
+                .map(|&s| (s as i32 * s as i32) as i64)
+                .sum();
+            if sum_of_squares <= VAD_MIN_FRAME_RMS * VAD_MIN_FRAME_RMS * VAD_FRAME_SAMPLES as i64 {
+                return false;
+            }
+            
+            let crossings = frame.windows(2)
+                .filter(|pair| (pair[0] < 0) != (pair[1] < 0))
+                .count();
+            let zero_crossing_rate = crossings as f32 / VAD_FRAME_SAMPLES as f32;
+            (VAD_MIN_ZERO_CROSSING_RATE..=VAD_MAX_ZERO_CROSSING_RATE).contains(&zero_crossing_rate)
+        })
+        .count();
+    
+    speech_frames as f32 / frame_count as f32
+}
+
+pub fn contains_speech(samples: &[i16]) -> bool {
+    speech_frame_fraction(samples) >= VAD_MIN_SPEECH_FRACTION
 }
 
 // Debug logging function to file
+lazy_static::lazy_static! {
+    // Entries go to one long-lived writer thread, so the transcription path never
+    // opens, writes or flushes the log file itself
+    static ref DEBUG_LOG_SENDER: Mutex<Sender<String>> = Mutex::new(spawn_debug_log_writer());
+}
+
 fn log_transcription_debug(text: &str, rms: f32, db_level: f32) {
     let timestamp = chrono::Utc::now().format("%H:%M:%S%.3f");
     let log_entry = format!("[{}] RMS: {:.6} ({:.1}dB) | {}\n", timestamp, rms, db_level, text);
     
-    // Get absolute path for log file
-    let log_path = if let Ok(current_dir) = std::env::current_dir() {
-        current_dir.join("transcription_debug.txt")
-    } else {
-        std::path::PathBuf::from("C:\\_dev\\enteract\\transcription_debug.txt")
-    };
-    
     // Also log to console for debugging
     // println!("[DEBUG] {}", log_entry.trim()); // Commented out: Audio loopback is working, reducing console noise for debugging focus
     
-    let file_exists = log_path.exists();
-    
-    if let Ok(mut file) = OpenOptions::new()
-        .create(true)
-        .append(true)
-        .open(&log_path)
-    {
-        if !file_exists {
-            // println!("[DEBUG] Creating debug log at: {:?}", log_path); // Commented out: Audio loopback is working, reducing console noise for debugging focus
-            let header = format!("=== Transcription Debug Log Started: {} ===\n\n", 
-                chrono::Utc::now().format("%Y-%m-%d %H:%M:%S"));
-            let _ = file.write_all(header.as_bytes());
-        }
-        let _ = file.write_all(log_entry.as_bytes());
-        let _ = file.flush();
-    } else {
-        // println!("[DEBUG] Failed to open log file at: {:?}", log_path); // Commented out: Audio loopback is working, reducing console noise for debugging focus
+    if let Ok(sender) = DEBUG_LOG_SENDER.lock() {
+        let _ = sender.send(log_entry);
     }
 }
 
+fn spawn_debug_log_writer() -> Sender<String> {
+    let (sender, receiver) = mpsc::channel::<String>();
+    
+    let _ = std::thread::Builder::new()
+        .name("transcription-debug-log".to_string())
+        .spawn(move || {
+            // Get absolute path for log file
+            let log_path = if let Ok(current_dir) = std::env::current_dir() {
+                current_dir.join("transcription_debug.txt")
+            } else {
+                std::path::PathBuf::from("C:\\_dev\\enteract\\transcription_debug.txt")
+            };
+            
+            let file_exists = log_path.exists();
+            
+            let file = match OpenOptions::new()
+                .create(true)
+                .append(true)
+                .open(&log_path)
+            {
+                Ok(file) => file,
+                Err(_) => {
+                    // println!("[DEBUG] Failed to open log file at: {:?}", log_path); // Commented out: Audio loopback is working, reducing console noise for debugging focus
+                    // Drain and discard so senders never see a closed channel
+                    while receiver.recv().is_ok() {}
+                    return;
+                }
+            };
+            let mut writer = BufWriter::new(file);
+            
+            if !file_exists {
+                // println!("[DEBUG] Creating debug log at: {:?}", log_path); // Commented out: Audio loopback is working, reducing console noise for debugging focus
+                let header = format!("=== Transcription Debug Log Started: {} ===\n\n", 
+                    chrono::Utc::now().format("%Y-%m-%d %H:%M:%S"));
+                let _ = writer.write_all(header.as_bytes());
+            }
+            
+            while let Ok(entry) = receiver.recv() {
+                let _ = writer.write_all(entry.as_bytes());
+                // Write out whatever else is queued, then flush once for the batch
+                while let Ok(entry) = receiver.try_recv() {
+                    let _ = writer.write_all(entry.as_bytes());
+                }
+                let _ = writer.flush();
+            }
+        });
+    
+    sender
+}
+
 // Python-style quality filtering (more lenient)
 fn is_python_style_quality_ok(text: &str, confidence: f32) -> bool {
     if text.len() < 2 {
@@ -406,3 +530,86 @@ fn clean_whisper_output(text: &str) -> String {
     }
 }
 
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_audio_level_silence_and_empty() {
+        assert_eq!(calculate_audio_level(&[]), -60.0);
+        assert_eq!(calculate_audio_level(&[0; 1024]), -60.0);
+        assert_eq!(calculate_audio_level(&[1; 1024]), -60.0);
+    }
+
+    #[test]
+    fn test_audio_level_full_scale() {
+        let square_wave: Vec<i16> = (0..1024).map(|i| if i % 2 == 0 { -32768 } else { 32767 }).collect();
+        assert!(calculate_audio_level(&square_wave).abs() < 0.01);
+
+        let half_scale = vec![16384i16; 1024];
+        assert!((calculate_audio_level(&half_scale) + 6.02).abs() < 0.01);
+    }
+
+    fn stereo_bytes(frames: &[(i16, i16)]) -> Vec<u8> {
+        frames.iter()
+            .flat_map(|&(l, r)| l.to_le_bytes().into_iter().chain(r.to_le_bytes()))
+            .collect()
+    }
+
+    #[test]
+    fn test_stereo_channel_decision_is_cached_until_reprobe() {
+        let mut processor = AudioChunkProcessor::new(16000, 16000);
+
+        // Quiet left, loud right - the probe picks the right channel
+        let right_loud: Vec<(i16, i16)> = (0..1600).map(|i| (10, if i % 2 == 0 { 3000 } else { -3000 })).collect();
+        let output = processor.process(&stereo_bytes(&right_loud), 16, 2);
+        assert_eq!(output[..2], [3000, -3000]);
+
+        // The next chunk would flip the decision, but the cached channel is kept
+        let left_only: Vec<(i16, i16)> = (0..1600).map(|i| (i as i16 % 50, 0)).collect();
+        let output = processor.process(&stereo_bytes(&left_only), 16, 2);
+        assert!(output.iter().all(|&s| s == 0));
+
+        // After the re-probe interval the statistics run again and switch to left
+        for _ in 0..STEREO_REPROBE_SECONDS * 10 {
+            processor.process(&stereo_bytes(&left_only), 16, 2);
+        }
+        let output = processor.process(&stereo_bytes(&left_only), 16, 2);
+        assert_eq!(output[..3], [0, 1, 2]);
+    }
+
+    #[test]
+    fn test_vad_accepts_voiced_audio() {
+        // 200Hz fundamental with a harmonic, like a voiced vowel
+        let voiced: Vec<i16> = (0..16000)
+            .map(|i| {
+                let t = i as f64 / 16000.0;
+                (6000.0 * (2.0 * std::f64::consts::PI * 200.0 * t).sin()
+                    + 2000.0 * (2.0 * std::f64::consts::PI * 600.0 * t).sin()) as i16
+            })
+            .collect();
+        assert!(speech_frame_fraction(&voiced) > 0.9);
+        assert!(contains_speech(&voiced));
+    }
+
+    #[test]
+    fn test_vad_rejects_silence_hum_and_noise() {
+        assert!(!contains_speech(&[]));
+        assert!(!contains_speech(&vec![0i16; 16000]));
+
+        let hum: Vec<i16> = (0..16000)
+            .map(|i| (8000.0 * (2.0 * std::f64::consts::PI * 50.0 * i as f64 / 16000.0).sin()) as i16)
+            .collect();
+        assert!(!contains_speech(&hum));
+
+        // Deterministic white noise from an LCG
+        let mut state = 12345u32;
+        let noise: Vec<i16> = (0..16000)
+            .map(|_| {
+                state = state.wrapping_mul(1664525).wrapping_add(1013904223);
+                ((state >> 16) as i16) / 4
+            })
+            .collect();
+        assert!(!contains_speech(&noise));
+    }
+}
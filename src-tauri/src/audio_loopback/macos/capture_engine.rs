@@ -1,18 +1,19 @@
 // src-tauri/src/audio_loopback/macos/capture_engine.rs
 // macOS Core Audio capture engine implementation
 
-use crate::audio_loopback::audio_processor::{
-    calculate_audio_level, process_audio_chunk, process_audio_for_transcription,
-};
+use crate::audio_loopback::audio_processor::{calculate_audio_level, AudioChunkProcessor};
 use crate::audio_loopback::macos::audio_recorder::AudioRecorder;
 use crate::audio_loopback::macos::device_enumerator::CoreAudioLoopbackEnumerator;
+use crate::audio_loopback::ring_buffer::SampleRingBuffer;
+use crate::audio_loopback::transcription_worker::TranscriptionWorker;
 use crate::audio_loopback::types::*;
 use anyhow::Result;
 use base64::prelude::*;
 use serde_json;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::Arc;
 use std::time::{Duration, Instant};
 use tauri::{AppHandle, Emitter};
-use tokio::sync::mpsc;
 
 #[tauri::command]
 pub async fn start_audio_loopback_capture(
@@ -27,15 +28,16 @@ pub async fn start_audio_loopback_capture(
         }
     }
 
-    // Create stop channel
-    let (stop_tx, stop_rx) = mpsc::channel::<()>(1);
+    // Create stop flag
+    let stop_flag = Arc::new(AtomicBool::new(false));
 
     // Start capture in background thread
     let app_handle_clone = app_handle.clone();
     let device_id_clone = device_id.clone();
+    let stop_flag_clone = stop_flag.clone();
 
     let handle = tokio::task::spawn_blocking(move || {
-        if let Err(_e) = run_audio_capture_loop_sync(device_id_clone, app_handle_clone, stop_rx) {
+        if let Err(_e) = run_audio_capture_loop_sync(device_id_clone, app_handle_clone, stop_flag_clone) {
             // Audio capture error handling
         }
     });
@@ -45,7 +47,7 @@ pub async fn start_audio_loopback_capture(
         let mut state = CAPTURE_STATE.lock().unwrap();
         state.is_capturing = true;
         state.capture_handle = Some(handle);
-        state.stop_tx = Some(stop_tx);
+        state.stop_flag = Some(stop_flag);
     }
 
     Ok("Audio capture started".to_string())
@@ -53,15 +55,15 @@ pub async fn start_audio_loopback_capture(
 
 #[tauri::command]
 pub async fn stop_audio_loopback_capture() -> Result<(), String> {
-    let (stop_tx, handle) = {
+    let (stop_flag, handle) = {
         let mut state = CAPTURE_STATE.lock().unwrap();
         state.is_capturing = false;
-        (state.stop_tx.take(), state.capture_handle.take())
+        (state.stop_flag.take(), state.capture_handle.take())
     };
 
     // Send stop signal
-    if let Some(tx) = stop_tx {
-        let _ = tx.send(()).await;
+    if let Some(flag) = stop_flag {
+        flag.store(true, Ordering::Relaxed);
     }
 
     // Wait for task to complete
@@ -76,7 +78,7 @@ pub async fn stop_audio_loopback_capture() -> Result<(), String> {
 fn run_audio_capture_loop_sync(
     device_id: String,
     app_handle: AppHandle,
-    mut stop_rx: mpsc::Receiver<()>,
+    stop_flag: Arc<AtomicBool>,
 ) -> Result<()> {
     let enumerator = CoreAudioLoopbackEnumerator::new()?;
     let device_info = enumerator
@@ -115,87 +117,60 @@ fn run_audio_capture_loop_sync(
     let mut last_emit = Instant::now();
 
     // Transcription buffer setup (keep existing)
-    let mut transcription_buffer: Vec<f32> = Vec::new();
     let transcription_buffer_duration = 4.0;
     let transcription_buffer_size = (16000.0 * transcription_buffer_duration) as usize;
+    let mut transcription_buffer = SampleRingBuffer::with_capacity(transcription_buffer_size * 2);
     let mut last_transcription = Instant::now();
     let transcription_interval = Duration::from_millis(800);
     let min_audio_length = 1.5;
     let min_audio_samples = (16000.0 * min_audio_length) as usize;
+    let mut chunk_processor = AudioChunkProcessor::new(48000, 16000);
+    let mut processed_audio: Vec<i16> = Vec::new();
+    let transcription_worker = TranscriptionWorker::spawn(app_handle.clone())
+        .map_err(|e| anyhow::anyhow!("Failed to start transcription worker: {}", e))?;
 
     // Replace the simulation loop with:
     loop {
-        if stop_rx.try_recv().is_ok() {
+        if stop_flag.load(Ordering::Relaxed) {
             break;
         }
 
-        // For now, keep the simulation but prepare for real audio
-        let simulated_audio = vec![0.0f32; 1024];
-
         // TODO: Replace with real audio from AudioRecorder
         // let audio_data = audio_recorder.get_audio_chunk()?;
 
         // Process audio (keep existing logic)
-        let processed_audio = process_audio_chunk(
+        chunk_processor.process_into(
             &[], // Empty for now, will be real audio later
             16,
             1,
-            48000,
-            16000,
+            &mut processed_audio,
         );
 
         // Rest of the existing transcription logic stays the same...
         total_samples += processed_audio.len() as u64;
-        transcription_buffer.extend_from_slice(&processed_audio);
-
-        // Trim buffer
-        if transcription_buffer.len() > transcription_buffer_size * 2 {
-            let excess = transcription_buffer.len() - transcription_buffer_size;
-            transcription_buffer.drain(0..excess);
-        }
+        // Oldest samples are overwritten once the ring is full
+        transcription_buffer.push_slice(&processed_audio);
 
         // Try transcription
         let now = Instant::now();
         if transcription_buffer.len() >= min_audio_samples
             && now.duration_since(last_transcription) > transcription_interval
         {
-            let buffer_rms = (transcription_buffer.iter().map(|&x| x * x).sum::<f32>()
-                / transcription_buffer.len() as f32)
-                .sqrt();
-
-            if buffer_rms > 0.00305 {
-                let int16_samples: Vec<i16> = transcription_buffer
-                    .iter()
-                    .map(|&sample| (sample * 32767.0).clamp(-32768.0, 32767.0) as i16)
-                    .collect();
-
-                let mut stereo_pcm16_bytes = Vec::with_capacity(int16_samples.len() * 4);
-                for &sample in &int16_samples {
-                    let bytes = sample.to_le_bytes();
-                    stereo_pcm16_bytes.extend_from_slice(&bytes);
-                    stereo_pcm16_bytes.extend_from_slice(&bytes);
-                }
+            // Running energy from the ring: mean square > 100^2 (Python: RMS > 100)
+            let buffer_energy = transcription_buffer.sum_of_squares();
 
-                let app_handle_clone = app_handle.clone();
-                let audio_bytes_clone = stereo_pcm16_bytes.clone();
-                let sample_rate = 16000;
+            if buffer_energy > 100 * 100 * transcription_buffer.len() as i64 {
+                let mut transcription_window = Vec::with_capacity(transcription_buffer.len());
+                transcription_buffer.copy_into(&mut transcription_window);
 
-                tokio::spawn(async move {
-                    let _ = process_audio_for_transcription(
-                        audio_bytes_clone,
-                        sample_rate,
-                        app_handle_clone,
-                    )
-                    .await;
-                });
+                let submitted = transcription_worker.submit(transcription_window, buffer_energy);
 
                 last_transcription = now;
 
-                let overlap_duration = 1.0;
-                let overlap_size = (16000.0 * overlap_duration) as usize;
-                if transcription_buffer.len() > overlap_size {
-                    let samples_to_remove = transcription_buffer.len() - overlap_size;
-                    transcription_buffer.drain(0..samples_to_remove);
+                if submitted {
+                    let overlap_duration = 1.0;
+                    let overlap_size = (16000.0 * overlap_duration) as usize;
+                    transcription_buffer.retain_latest(overlap_size);
                 }
             }
         }
@@ -203,12 +178,7 @@ fn run_audio_capture_loop_sync(
         // Emit audio chunk periodically
         let now = Instant::now();
         if now.duration_since(last_emit) > Duration::from_millis(100) {
-            let pcm16_data: Vec<i16> = processed_audio
-                .iter()
-                .map(|&sample| (sample * 32767.0).clamp(-32768.0, 32767.0) as i16)
-                .collect();
-
-            let audio_bytes: Vec<u8> = pcm16_data
+            let audio_bytes: Vec<u8> = processed_audio
                 .iter()
                 .flat_map(|&sample| sample.to_le_bytes())
                 .collect();
@@ -5,6 +5,9 @@ pub mod types;
 pub mod audio_processor;
 pub mod quality_filter;
 pub mod settings;
+pub mod ring_buffer;
+pub mod resampler;
+pub mod transcription_worker;
 
 // Platform-specific modules
 #[cfg(target_os = "windows")]
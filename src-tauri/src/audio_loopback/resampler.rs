@@ -0,0 +1,189 @@
+// src-tauri/src/audio_loopback/resampler.rs
+// Streaming polyphase FIR resampler for device rate -> Whisper rate conversion
+
+use std::f64::consts::PI;
+
+// Taps applied per output sample, scaled with the decimation ratio so the
+// transition band stays narrow for high device rates
+const MIN_TAPS_PER_PHASE: usize = 32;
+const TAPS_PER_DECIMATION_STEP: usize = 16;
+// Passband edge as a fraction of the lower Nyquist frequency
+const CUTOFF_ROLLOFF: f64 = 0.9;
+
+/// Rational L/M resampler (Python: scipy.signal.resample_poly). The anti-aliasing
+/// filter is designed once per rate pair and the filter history is carried across
+/// chunks, so consecutive capture buffers resample seamlessly.
+pub struct PolyphaseResampler {
+    up: usize,
+    down: usize,
+    taps_per_phase: usize,
+    // Phase-major coefficients: coeffs[phase * taps_per_phase + k] = h[phase + k * up] * up
+    coeffs: Vec<f32>,
+    // Last taps_per_phase - 1 input samples followed by the current chunk
+    work: Vec<f32>,
+    // Next output sample as an integer phase accumulator: input index into `work`
+    // plus filter phase, advanced by `down` upsampled units per output sample
+    index: usize,
+    phase: usize,
+    index_step: usize,
+    phase_step: usize,
+}
+
+impl PolyphaseResampler {
+    pub fn new(input_rate: u32, output_rate: u32) -> Self {
+        let divisor = gcd(input_rate as usize, output_rate as usize).max(1);
+        let up = (output_rate as usize / divisor).max(1);
+        let down = (input_rate as usize / divisor).max(1);
+        let taps_per_phase = (TAPS_PER_DECIMATION_STEP * down.div_ceil(up)).max(MIN_TAPS_PER_PHASE);
+
+        Self {
+            up,
+            down,
+            taps_per_phase,
+            coeffs: design_polyphase_filter(up, down, taps_per_phase),
+            work: vec![0.0; taps_per_phase - 1],
+            index: taps_per_phase - 1,
+            phase: 0,
+            index_step: down / up,
+            phase_step: down % up,
+        }
+    }
+
+    /// Resample `input`, appending the produced samples to `output`
+    pub fn process(&mut self, input: &[i16], output: &mut Vec<i16>) {
+        let history = self.taps_per_phase - 1;
+        self.work.truncate(history);
+        self.work.extend(input.iter().map(|&s| s as f32));
+
+        output.reserve(input.len() * self.up / self.down + 1);
+
+        while self.index < self.work.len() {
+            let taps = &self.coeffs[self.phase * self.taps_per_phase..(self.phase + 1) * self.taps_per_phase];
+
+            let mut acc = 0.0f32;
+            for (k, &tap) in taps.iter().enumerate() {
+                acc += tap * self.work[self.index - k];
+            }
+            output.push(acc.round().clamp(-32768.0, 32767.0) as i16);
+
+            // Bresenham-style step - no division per output sample
+            self.index += self.index_step;
+            self.phase += self.phase_step;
+            if self.phase >= self.up {
+                self.phase -= self.up;
+                self.index += 1;
+            }
+        }
+
+        // Carry the filter history into the next chunk
+        let consumed = self.work.len() - history;
+        self.work.drain(..consumed);
+        self.index -= consumed;
+    }
+}
+
+fn gcd(mut a: usize, mut b: usize) -> usize {
+    while b != 0 {
+        let t = a % b;
+        a = b;
+        b = t;
+    }
+    a
+}
+
+// Blackman-windowed sinc lowpass at the upsampled rate, split into `up` phases
+fn design_polyphase_filter(up: usize, down: usize, taps_per_phase: usize) -> Vec<f32> {
+    let num_taps = up * taps_per_phase;
+    // Cutoff in cycles per upsampled sample
+    let cutoff = 0.5 * CUTOFF_ROLLOFF / up.max(down) as f64;
+    let center = (num_taps - 1) as f64 / 2.0;
+
+    let prototype: Vec<f64> = (0..num_taps)
+        .map(|n| {
+            let x = n as f64 - center;
+            let sinc = if x == 0.0 {
+                2.0 * cutoff
+            } else {
+                (2.0 * PI * cutoff * x).sin() / (PI * x)
+            };
+            let w = 2.0 * PI * n as f64 / (num_taps - 1) as f64;
+            let window = 0.42 - 0.5 * w.cos() + 0.08 * (2.0 * w).cos();
+            sinc * window
+        })
+        .collect();
+
+    // Normalise for unity DC gain after zero-stuffing by `up`
+    let gain = up as f64 / prototype.iter().sum::<f64>();
+
+    let mut coeffs = vec![0.0f32; num_taps];
+    for phase in 0..up {
+        for k in 0..taps_per_phase {
+            coeffs[phase * taps_per_phase + k] = (prototype[phase + k * up] * gain) as f32;
+        }
+    }
+    coeffs
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn sine(frequency: f64, sample_rate: u32, len: usize) -> Vec<i16> {
+        (0..len)
+            .map(|i| (10000.0 * (2.0 * PI * frequency * i as f64 / sample_rate as f64).sin()) as i16)
+            .collect()
+    }
+
+    #[test]
+    fn test_output_length_and_passband_gain() {
+        let input = sine(1000.0, 44100, 44100);
+        let mut output = Vec::new();
+        PolyphaseResampler::new(44100, 16000).process(&input, &mut output);
+
+        assert_eq!(output.len(), 16000);
+        let peak = output[1000..].iter().map(|s| s.unsigned_abs()).max().unwrap();
+        assert!((9900..=10100).contains(&peak), "unexpected peak {}", peak);
+    }
+
+    #[test]
+    fn test_chunked_matches_single_pass() {
+        let input = sine(440.0, 44100, 20000);
+
+        let mut single = Vec::new();
+        PolyphaseResampler::new(44100, 16000).process(&input, &mut single);
+
+        let mut resampler = PolyphaseResampler::new(44100, 16000);
+        let mut chunked = Vec::new();
+        for chunk in input.chunks(1021) {
+            resampler.process(chunk, &mut chunked);
+        }
+
+        assert_eq!(single, chunked);
+    }
+
+    #[test]
+    fn test_integer_decimation_is_anti_aliased() {
+        // 48k -> 16k: a 10kHz tone would fold to 6kHz under plain [::3] decimation
+        let mut resampler = PolyphaseResampler::new(48000, 16000);
+        let mut output = Vec::new();
+        resampler.process(&sine(10000.0, 48000, 48000), &mut output);
+        assert_eq!(output.len(), 16000);
+        let peak = output[1000..].iter().map(|s| s.unsigned_abs()).max().unwrap();
+        assert!(peak < 100, "aliased peak {}", peak);
+
+        let mut output = Vec::new();
+        PolyphaseResampler::new(48000, 16000).process(&sine(1000.0, 48000, 48000), &mut output);
+        let peak = output[1000..].iter().map(|s| s.unsigned_abs()).max().unwrap();
+        assert!((9900..=10100).contains(&peak), "unexpected peak {}", peak);
+    }
+
+    #[test]
+    fn test_rejects_content_above_output_nyquist() {
+        let input = sine(11000.0, 44100, 44100);
+        let mut output = Vec::new();
+        PolyphaseResampler::new(44100, 16000).process(&input, &mut output);
+
+        let peak = output[1000..].iter().map(|s| s.unsigned_abs()).max().unwrap();
+        assert!(peak < 100, "aliased peak {}", peak);
+    }
+}
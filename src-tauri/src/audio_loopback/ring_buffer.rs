@@ -0,0 +1,174 @@
+// src-tauri/src/audio_loopback/ring_buffer.rs
+// Fixed-capacity PCM16 ring buffer used by the capture engines for the transcription window
+
+use crate::audio_loopback::audio_processor::sum_of_squares;
+
+/// Preallocated ring of PCM16 samples. Writes overwrite the oldest samples once the
+/// ring is full, so the capture loop never reallocates or shifts memory. The sum of
+/// squares of the buffered samples is tracked as samples enter and leave, so the
+/// silence gate never has to walk the window.
+pub struct SampleRingBuffer {
+    data: Vec<i16>,
+    write_pos: usize,
+    filled: usize,
+    sum_of_squares: i64,
+}
+
+impl SampleRingBuffer {
+    pub fn with_capacity(capacity: usize) -> Self {
+        Self {
+            data: vec![0; capacity.max(1)],
+            write_pos: 0,
+            filled: 0,
+            sum_of_squares: 0,
+        }
+    }
+
+    pub fn len(&self) -> usize {
+        self.filled
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.filled == 0
+    }
+
+    /// Exact sum of squares of the buffered samples
+    pub fn sum_of_squares(&self) -> i64 {
+        self.sum_of_squares
+    }
+
+    /// Append samples, overwriting the oldest ones when the ring is full
+    pub fn push_slice(&mut self, samples: &[i16]) {
+        let capacity = self.data.len();
+
+        // Only the newest `capacity` samples can survive the write
+        let samples = if samples.len() > capacity {
+            &samples[samples.len() - capacity..]
+        } else {
+            samples
+        };
+
+        // Samples about to be overwritten leave the running energy
+        let overwritten = (self.filled + samples.len()).saturating_sub(capacity);
+        if overwritten > 0 {
+            self.sum_of_squares -= self.energy(self.oldest_pos(), overwritten);
+        }
+
+        let first = samples.len().min(capacity - self.write_pos);
+        self.data[self.write_pos..self.write_pos + first].copy_from_slice(&samples[..first]);
+        let rest = samples.len() - first;
+        self.data[..rest].copy_from_slice(&samples[first..]);
+
+        self.sum_of_squares += sum_of_squares(samples);
+        self.write_pos = (self.write_pos + samples.len()) % capacity;
+        self.filled = (self.filled + samples.len()).min(capacity);
+    }
+
+    /// Copy the buffered samples, oldest first, into `out` (at most two memcpys)
+    pub fn copy_into(&self, out: &mut Vec<i16>) {
+        out.clear();
+        let capacity = self.data.len();
+        let start = self.oldest_pos();
+
+        if start + self.filled <= capacity {
+            out.extend_from_slice(&self.data[start..start + self.filled]);
+        } else {
+            out.extend_from_slice(&self.data[start..]);
+            out.extend_from_slice(&self.data[..self.write_pos]);
+        }
+    }
+
+    /// Keep only the newest `count` samples - nothing is moved; the running energy is
+    /// updated from whichever side (discarded or kept) is shorter
+    pub fn retain_latest(&mut self, count: usize) {
+        if count >= self.filled {
+            return;
+        }
+
+        let start = self.oldest_pos();
+        let discarded = self.filled - count;
+        if discarded <= count {
+            self.sum_of_squares -= self.energy(start, discarded);
+        } else {
+            self.sum_of_squares = self.energy((start + discarded) % self.data.len(), count);
+        }
+        self.filled = count;
+    }
+
+    pub fn clear(&mut self) {
+        self.write_pos = 0;
+        self.filled = 0;
+        self.sum_of_squares = 0;
+    }
+
+    fn oldest_pos(&self) -> usize {
+        let capacity = self.data.len();
+        (self.write_pos + capacity - self.filled) % capacity
+    }
+
+    fn energy(&self, start: usize, count: usize) -> i64 {
+        let first = count.min(self.data.len() - start);
+        sum_of_squares(&self.data[start..start + first]) + sum_of_squares(&self.data[..count - first])
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn contents(ring: &SampleRingBuffer) -> Vec<i16> {
+        let mut out = Vec::new();
+        ring.copy_into(&mut out);
+        out
+    }
+
+    #[test]
+    fn test_push_wraps_and_overwrites_oldest() {
+        let mut ring = SampleRingBuffer::with_capacity(5);
+        ring.push_slice(&[1, 2, 3]);
+        assert_eq!(contents(&ring), vec![1, 2, 3]);
+
+        ring.push_slice(&[4, 5, 6, 7]);
+        assert_eq!(ring.len(), 5);
+        assert_eq!(contents(&ring), vec![3, 4, 5, 6, 7]);
+
+        // A write larger than the ring keeps only its newest samples
+        ring.push_slice(&(10..30).collect::<Vec<i16>>());
+        assert_eq!(contents(&ring), vec![25, 26, 27, 28, 29]);
+    }
+
+    #[test]
+    fn test_retain_latest_keeps_overlap_across_wrap() {
+        let mut ring = SampleRingBuffer::with_capacity(6);
+        ring.push_slice(&[1, 2, 3, 4, 5, 6, 7, 8]);
+
+        ring.retain_latest(3);
+        assert_eq!(contents(&ring), vec![6, 7, 8]);
+
+        // New audio continues after the retained overlap
+        ring.push_slice(&[9, 10]);
+        assert_eq!(contents(&ring), vec![6, 7, 8, 9, 10]);
+
+        // Retaining more than is buffered is a no-op
+        ring.retain_latest(100);
+        assert_eq!(ring.len(), 5);
+
+        ring.clear();
+        assert!(ring.is_empty());
+        assert!(contents(&ring).is_empty());
+    }
+
+    #[test]
+    fn test_running_energy_matches_contents() {
+        let mut ring = SampleRingBuffer::with_capacity(7);
+        let chunks: [&[i16]; 5] = [&[100, -200, 300], &[-32768, 32767], &[5; 6], &[-1, 2], &[7; 20]];
+
+        for (i, chunk) in chunks.iter().enumerate() {
+            ring.push_slice(chunk);
+            assert_eq!(ring.sum_of_squares(), sum_of_squares(&contents(&ring)));
+
+            ring.retain_latest(if i % 2 == 0 { 2 } else { 6 });
+            assert_eq!(ring.sum_of_squares(), sum_of_squares(&contents(&ring)));
+        }
+    }
+}
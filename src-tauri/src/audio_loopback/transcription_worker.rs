@@ -0,0 +1,99 @@
+// src-tauri/src/audio_loopback/transcription_worker.rs
+// Persistent transcription worker shared by the platform capture engines
+
+use crate::audio_loopback::audio_processor::transcribe_loopback_samples;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::mpsc::{self, Receiver, SyncSender, TrySendError};
+use std::sync::Arc;
+use tauri::AppHandle;
+
+// Windows waiting for the worker. Triggers come every 0.8s and a window takes longer
+// than that to transcribe on slow machines, so keep one queued and drop the rest
+// rather than letting latency grow without bound.
+const MAX_PENDING_WINDOWS: usize = 1;
+
+// 16kHz mono PCM16, straight from the capture ring buffer, with the sum of squares
+// the ring tracked for it
+struct TranscriptionJob {
+    samples: Vec<i16>,
+    sum_of_squares: i64,
+}
+
+/// One long-lived thread per capture session that runs Whisper on the windows the
+/// capture loop hands over. Replaces spawning a task per trigger: no per-trigger
+/// startup cost, inference never runs concurrently with itself, and the blocking
+/// Whisper call stays off the async runtime's worker threads. Audio buffers are moved
+/// through the channel, never copied.
+///
+/// Dropping the worker (when capture stops) never waits for Whisper: it cancels the
+/// window still queued, closes the channel and detaches the thread. A window already
+/// being transcribed finishes in the background and its result is still emitted, as
+/// the per-trigger tasks did; the thread then exits on its own.
+pub struct TranscriptionWorker {
+    sender: Option<SyncSender<TranscriptionJob>>,
+    cancelled: Arc<AtomicBool>,
+}
+
+impl TranscriptionWorker {
+    /// Must be called from within the tokio runtime (the capture loops run under
+    /// spawn_blocking), whose handle drives the async transcription pipeline.
+    pub fn spawn(app_handle: AppHandle) -> std::io::Result<Self> {
+        let (sender, receiver) = mpsc::sync_channel(MAX_PENDING_WINDOWS);
+        let runtime = tokio::runtime::Handle::current();
+        let cancelled = Arc::new(AtomicBool::new(false));
+        let worker_cancelled = Arc::clone(&cancelled);
+
+        // Detached: the handle is dropped, so nothing ever joins the thread
+        std::thread::Builder::new()
+            .name("loopback-transcription".to_string())
+            .spawn(move || run_worker(receiver, runtime, app_handle, worker_cancelled))?;
+
+        Ok(Self {
+            sender: Some(sender),
+            cancelled,
+        })
+    }
+
+    /// Queue a window, and its exact sum of squares, for transcription. Returns false
+    /// if the worker is still busy and the window was dropped.
+    pub fn submit(&self, samples: Vec<i16>, sum_of_squares: i64) -> bool {
+        let Some(sender) = &self.sender else {
+            return false;
+        };
+
+        match sender.try_send(TranscriptionJob { samples, sum_of_squares }) {
+            Ok(()) => true,
+            Err(TrySendError::Full(_)) | Err(TrySendError::Disconnected(_)) => false,
+        }
+    }
+}
+
+impl Drop for TranscriptionWorker {
+    fn drop(&mut self) {
+        // Don't block capture stop on an in-flight Whisper run: skip whatever is still
+        // queued and close the channel, and the worker exits after its current window
+        self.cancelled.store(true, Ordering::Release);
+        self.sender.take();
+    }
+}
+
+fn run_worker(
+    receiver: Receiver<TranscriptionJob>,
+    runtime: tokio::runtime::Handle,
+    app_handle: AppHandle,
+    cancelled: Arc<AtomicBool>,
+) {
+    while let Ok(job) = receiver.recv() {
+        if cancelled.load(Ordering::Acquire) {
+            break;
+        }
+        match runtime.block_on(transcribe_loopback_samples(job.samples, job.sum_of_squares, app_handle.clone())) {
+            Ok(text) => {
+                if !text.is_empty() {
+                    // println!("[CAPTURE] Transcription result: '{}'", text); // Commented out: Audio loopback is working, reducing console noise for debugging focus
+                }
+            },
+            Err(_e) => {} // println!("[CAPTURE] Transcription error: {}", e) // Commented out: Audio loopback is working, reducing console noise for debugging focus
+        }
+    }
+}
@@ -1,7 +1,7 @@
 // src-tauri/src/audio_loopback/types.rs
 use serde::{Deserialize, Serialize};
 use std::sync::{Arc, Mutex};
-use tokio::sync::mpsc;
+use std::sync::atomic::AtomicBool;
 
 // Audio capture state management
 lazy_static::lazy_static! {
@@ -12,7 +12,8 @@ lazy_static::lazy_static! {
 pub struct CaptureState {
     pub is_capturing: bool,
     pub capture_handle: Option<tokio::task::JoinHandle<()>>,
-    pub stop_tx: Option<mpsc::Sender<()>>,
+    // Polled by the capture thread on every iteration - a plain flag, not a channel
+    pub stop_flag: Option<Arc<AtomicBool>>,
 }
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -1,12 +1,15 @@
 // src-tauri/src/audio_loopback/windows/capture_engine.rs
 use crate::audio_loopback::types::*;
 use crate::audio_loopback::windows::device_enumerator::WASAPILoopbackEnumerator;
-use crate::audio_loopback::audio_processor::{process_audio_for_transcription, process_audio_chunk, calculate_audio_level};
+use crate::audio_loopback::audio_processor::{calculate_audio_level, AudioChunkProcessor};
+use crate::audio_loopback::ring_buffer::SampleRingBuffer;
+use crate::audio_loopback::transcription_worker::TranscriptionWorker;
 use anyhow::Result;
+use std::sync::Arc;
+use std::sync::atomic::{AtomicBool, Ordering};
 use std::time::{Duration, Instant};
 use tauri::{AppHandle, Emitter};
-use tokio::sync::mpsc;
-use wasapi::{DeviceCollection, Direction, Device, ShareMode, initialize_mta};
+use wasapi::{Direction, ShareMode, initialize_mta};
 use base64::prelude::*;
 use serde_json;
 
@@ -25,15 +28,16 @@ pub async fn start_audio_loopback_capture(
     
     // println!("🎤 Starting audio capture for device: {}", device_id); // Commented out: Audio loopback is working, reducing console noise for debugging focus
     
-    // Create stop channel
-    let (stop_tx, stop_rx) = mpsc::channel::<()>(1);
+    // Create stop flag
+    let stop_flag = Arc::new(AtomicBool::new(false));
     
     // Start capture in background thread
     let app_handle_clone = app_handle.clone();
     let device_id_clone = device_id.clone();
+    let stop_flag_clone = stop_flag.clone();
     
     let handle = tokio::task::spawn_blocking(move || {
-        if let Err(e) = run_audio_capture_loop_sync(device_id_clone, app_handle_clone, stop_rx) {
+        if let Err(e) = run_audio_capture_loop_sync(device_id_clone, app_handle_clone, stop_flag_clone) {
             // eprintln!("Audio capture error: {}", e); // Commented out: Audio loopback is working, reducing console noise for debugging focus
         }
     });
@@ -43,7 +47,7 @@ pub async fn start_audio_loopback_capture(
         let mut state = CAPTURE_STATE.lock().unwrap();
         state.is_capturing = true;
         state.capture_handle = Some(handle);
-        state.stop_tx = Some(stop_tx);
+        state.stop_flag = Some(stop_flag);
     }
     
     Ok("Audio capture started".to_string())
@@ -53,15 +57,15 @@ pub async fn start_audio_loopback_capture(
 pub async fn stop_audio_loopback_capture() -> Result<(), String> {
     // println!("⏹️ Stopping audio capture"); // Commented out: Audio loopback is working, reducing console noise for debugging focus
     
-    let (stop_tx, handle) = {
+    let (stop_flag, handle) = {
         let mut state = CAPTURE_STATE.lock().unwrap();
         state.is_capturing = false;
-        (state.stop_tx.take(), state.capture_handle.take())
+        (state.stop_flag.take(), state.capture_handle.take())
     };
     
     // Send stop signal
-    if let Some(tx) = stop_tx {
-        let _ = tx.send(()).await;
+    if let Some(flag) = stop_flag {
+        flag.store(true, Ordering::Relaxed);
     }
     
     // Wait for task to complete
@@ -76,7 +80,7 @@ pub async fn stop_audio_loopback_capture() -> Result<(), String> {
 fn run_audio_capture_loop_sync(
     device_id: String,
     app_handle: AppHandle,
-    mut stop_rx: mpsc::Receiver<()>
+    stop_flag: Arc<AtomicBool>
 ) -> Result<()> {
     initialize_mta().map_err(|_| anyhow::anyhow!("Failed to initialize COM"))?;
     
@@ -84,7 +88,7 @@ fn run_audio_capture_loop_sync(
     let device_info = enumerator.find_device_by_id(&device_id)?
         .ok_or_else(|| anyhow::anyhow!("Device not found"))?;
     
-    let wasapi_device = find_wasapi_device(&device_info)?;
+    let wasapi_device = enumerator.find_wasapi_device(&device_info)?;
     
     // Setup audio client
     let mut audio_client = wasapi_device.get_iaudioclient()
@@ -137,7 +141,6 @@ fn run_audio_capture_loop_sync(
     // Validate format
     let bits_per_sample = format.get_bitspersample();
     let channels = format.get_nchannels();
-    let _sample_rate = format.get_samplespersec();  // Unused variable warning fix
     
     if bits_per_sample != 16 && bits_per_sample != 32 {
         return Err(anyhow::anyhow!("Unsupported bits per sample: {}", bits_per_sample));
@@ -155,18 +158,28 @@ fn run_audio_capture_loop_sync(
     let mut error_count = 0u32;
     
     // Transcription buffer setup - MATCHING PYTHON CONFIG
-    let mut transcription_buffer: Vec<f32> = Vec::new();
     let transcription_buffer_duration = 4.0;  // Python: BUFFER_DURATION = 4.0
     // Important: Buffer size is at 16kHz (Whisper rate), not device rate
     let transcription_buffer_size = (16000.0 * transcription_buffer_duration) as usize;
+    // Ring holds up to 2x the window (Python: deque(maxlen=BUFFER_SIZE * 2))
+    // Samples stay PCM16 from capture to Whisper
+    let mut transcription_buffer = SampleRingBuffer::with_capacity(transcription_buffer_size * 2);
     let mut last_transcription = Instant::now();
     let transcription_interval = Duration::from_millis(800);  // Python: PROCESSING_INTERVAL = 0.8
     let min_audio_length = 1.5;  // Python: MIN_AUDIO_LENGTH = 1.5
     let min_audio_samples = (16000.0 * min_audio_length) as usize;  // At 16kHz
     
+    // Resampler state and scratch buffers live for the whole session
+    let mut chunk_processor = AudioChunkProcessor::new(format.get_samplespersec(), 16000);
+    let mut processed_audio: Vec<i16> = Vec::new();
+    let mut buffer: Vec<u8> = Vec::new();
+    // Whisper runs on one persistent thread per session instead of a task per trigger
+    let transcription_worker = TranscriptionWorker::spawn(app_handle.clone())
+        .map_err(|e| anyhow::anyhow!("Failed to start transcription worker: {}", e))?;
+    
     // Main capture loop with reduced logging
     loop {
-        if stop_rx.try_recv().is_ok() {
+        if stop_flag.load(Ordering::Relaxed) {
             break;
         }
         
@@ -198,9 +211,12 @@ fn run_audio_capture_loop_sync(
         }
         
         let safe_buffer_size = std::cmp::max(calculated_buffer_size, 4096);
-        let mut buffer = vec![0u8; safe_buffer_size];
+        // Reused across reads - only grows when the device hands over a larger packet
+        if buffer.len() < safe_buffer_size {
+            buffer.resize(safe_buffer_size, 0);
+        }
         
-        let (frames_read, flags) = match capture_client.read_from_device(bytes_per_frame as usize, &mut buffer) {
+        let (frames_read, flags) = match capture_client.read_from_device(bytes_per_frame as usize, &mut buffer[..safe_buffer_size]) {
             Ok(result) => {
                 if error_count > 0 {
                     error_count = std::cmp::max(0, error_count - 1);
@@ -230,97 +246,54 @@ fn run_audio_capture_loop_sync(
         
         let audio_data = &buffer[..actual_bytes];
         
-        // Detect completely silent audio
-        let is_completely_silent = audio_data.iter().all(|&b| b == 0);
-        if is_completely_silent && frames_read > 100 {
-            // Only log this occasionally to avoid spam
-            if start_time.elapsed().as_secs() % 30 == 0 {
-                // println!("⚠️ No system audio detected - check device selection"); // Commented out: Audio loopback is working, reducing console noise for debugging focus
-            }
-        }
-        
         // Process audio - MATCHING PYTHON PIPELINE
         // Python always outputs at 16kHz for Whisper
-        let processed_audio = process_audio_chunk(
+        // Always resample to 16kHz for Whisper
+        chunk_processor.process_into(
             audio_data,
             bits_per_sample,
             channels,
-            format.get_samplespersec(),
-            16000  // Always resample to 16kHz for Whisper
+            &mut processed_audio
         );
         
         total_samples += processed_audio.len() as u64;
-        transcription_buffer.extend_from_slice(&processed_audio);
-        
-        // Trim buffer
-        if transcription_buffer.len() > transcription_buffer_size * 2 {
-            let excess = transcription_buffer.len() - transcription_buffer_size;
-            transcription_buffer.drain(0..excess);
-        }
+        // Oldest samples are overwritten once the ring is full
+        transcription_buffer.push_slice(&processed_audio);
         
         // Try transcription
         let now = Instant::now();
         if transcription_buffer.len() >= min_audio_samples && 
            now.duration_since(last_transcription) > transcription_interval {
             
-            // Python checks RMS > 100 for int16, which is ~0.00305 for float32
-            let buffer_rms = (transcription_buffer.iter().map(|&x| x * x).sum::<f32>() / transcription_buffer.len() as f32).sqrt();
-            let buffer_level = calculate_audio_level(&transcription_buffer);
+            // Python checks RMS > 100 for int16, i.e. mean square > 100^2.
+            // The ring tracks its energy as samples come and go, so the gate needs no
+            // pass over the window
+            let buffer_energy = transcription_buffer.sum_of_squares();
             
             // Log buffer state every transcription attempt
-            // println!("[CAPTURE] Buffer: {} samples, RMS: {:.6}, Level: {:.1}dB", 
-            //          transcription_buffer.len(), buffer_rms, buffer_level);
+            // println!("[CAPTURE] Buffer: {} samples", transcription_buffer.len());
             // Commented out: Audio loopback is working, reducing console noise for debugging focus
             
-            if buffer_rms > 0.00305 {  // Match Python's RMS threshold
-                // The transcription buffer already contains mono f32 samples at 16kHz
-                // We need to convert to stereo PCM16 bytes for the transcription function
-                // which expects stereo input (it will convert back to mono)
-                let int16_samples: Vec<i16> = transcription_buffer.iter()
-                    .map(|&sample| (sample * 32767.0).clamp(-32768.0, 32767.0) as i16)
-                    .collect();
-                
-                // Create stereo PCM16 by duplicating mono samples
-                let mut stereo_pcm16_bytes = Vec::with_capacity(int16_samples.len() * 4);
-                for &sample in &int16_samples {
-                    let bytes = sample.to_le_bytes();
-                    stereo_pcm16_bytes.extend_from_slice(&bytes);  // Left channel
-                    stereo_pcm16_bytes.extend_from_slice(&bytes);  // Right channel (duplicate)
-                }
-                let pcm16_bytes = stereo_pcm16_bytes;
+            if buffer_energy > 100 * 100 * transcription_buffer.len() as i64 {  // Match Python's RMS threshold
+                // One copy out of the ring; the window is already 16kHz mono PCM16, so it
+                // goes to the worker (and on to Whisper) as-is - no stereo bytes round trip
+                let mut transcription_window = Vec::with_capacity(transcription_buffer.len());
+                transcription_buffer.copy_into(&mut transcription_window);
                 
-                let app_handle_clone = app_handle.clone();
-                let audio_bytes_clone = pcm16_bytes.clone();
-                // Important: We're passing 16kHz since we already resampled
-                let sample_rate = 16000;
-                
-                // println!("[CAPTURE] Sending {} bytes for transcription (RMS: {:.6})", 
-                //          pcm16_bytes.len(), buffer_rms);
+                // println!("[CAPTURE] Sending {} samples for transcription", transcription_window.len());
                 // Commented out: Audio loopback is working, reducing console noise for debugging focus
                 
-                tokio::spawn(async move {
-                    match process_audio_for_transcription(
-                        audio_bytes_clone,
-                        sample_rate,
-                        app_handle_clone
-                    ).await {
-                        Ok(text) => {
-                            if !text.is_empty() {
-                                // println!("[CAPTURE] Transcription result: '{}'", text); // Commented out: Audio loopback is working, reducing console noise for debugging focus
-                            }
-                        },
-                        Err(e) => {} // println!("[CAPTURE] Transcription error: {}", e) // Commented out: Audio loopback is working, reducing console noise for debugging focus
-                    }
-                });
+                // Window is moved to the session's worker thread, not copied
+                let submitted = transcription_worker.submit(transcription_window, buffer_energy);
                 
                 last_transcription = now;
                 
-                // Keep overlap - Python uses 1.0 second at 16kHz
-                let overlap_duration = 1.0;
-                let overlap_size = (16000.0 * overlap_duration) as usize;
-                if transcription_buffer.len() > overlap_size {
-                    let samples_to_remove = transcription_buffer.len() - overlap_size;
-                    transcription_buffer.drain(0..samples_to_remove);
+                // Keep overlap - Python uses 1.0 second at 16kHz. If the worker was
+                // still busy the window was dropped, so keep the audio for the next try
+                if submitted {
+                    let overlap_duration = 1.0;
+                    let overlap_size = (16000.0 * overlap_duration) as usize;
+                    transcription_buffer.retain_latest(overlap_size);
                 }
             }
         }
@@ -328,11 +301,7 @@ fn run_audio_capture_loop_sync(
         // Emit audio chunk periodically with reduced logging
         let now = Instant::now();
         if now.duration_since(last_emit) > Duration::from_millis(100) {
-            let pcm16_data: Vec<i16> = processed_audio.iter()
-                .map(|&sample| (sample * 32767.0).clamp(-32768.0, 32767.0) as i16)
-                .collect();
-            
-            let audio_bytes: Vec<u8> = pcm16_data.iter()
+            let audio_bytes: Vec<u8> = processed_audio.iter()
                 .flat_map(|&sample| sample.to_le_bytes())
                 .collect();
             
@@ -358,28 +327,3 @@ fn run_audio_capture_loop_sync(
     
     Ok(())
 }
-
-// Helper function to find WASAPI device
-fn find_wasapi_device(device_info: &AudioLoopbackDevice) -> Result<Device> {
-    let direction = match device_info.device_type {
-        DeviceType::Render => Direction::Render,
-        DeviceType::Capture => Direction::Capture,
-    };
-    
-    let device_collection = DeviceCollection::new(&direction)
-        .map_err(|_| anyhow::anyhow!("Failed to create device collection"))?;
-    let device_count = device_collection.get_nbr_devices()
-        .map_err(|_| anyhow::anyhow!("Failed to get device count"))?;
-    
-    for i in 0..device_count {
-        if let Ok(device) = device_collection.get_device_at_index(i) {
-            if let Ok(id) = device.get_id() {
-                if id == device_info.id {
-                    return Ok(device);
-                }
-            }
-        }
-    }
-    
-    Err(anyhow::anyhow!("Could not find device with ID: {}", device_info.id))
-}
\ No newline at end of file
@@ -1,8 +1,16 @@
 // src-tauri/src/audio_loopback/windows/device_enumerator.rs
 use crate::audio_loopback::types::*;
 use anyhow::Result;
+use std::sync::Mutex;
 use wasapi::{DeviceCollection, Direction, Device, ShareMode, get_default_device, initialize_mta};
 
+lazy_static::lazy_static! {
+    // Result of the last full scan. A scan initializes an audio client on every
+    // endpoint, so auto-select, device tests and capture start reuse it; only the
+    // device list command rescans.
+    static ref LOOPBACK_DEVICE_CACHE: Mutex<Option<Vec<AudioLoopbackDevice>>> = Mutex::new(None);
+}
+
 // WASAPI Device Enumerator Implementation
 pub struct WASAPILoopbackEnumerator {
     render_collection: DeviceCollection,
@@ -26,7 +34,26 @@ impl WASAPILoopbackEnumerator {
         })
     }
     
+    /// Rescan all endpoints and refresh the device cache
     pub fn enumerate_loopback_devices(&self) -> Result<Vec<AudioLoopbackDevice>> {
+        let devices = self.scan_loopback_devices()?;
+        if let Ok(mut cache) = LOOPBACK_DEVICE_CACHE.lock() {
+            *cache = Some(devices.clone());
+        }
+        Ok(devices)
+    }
+    
+    /// Devices from the last scan, scanning only if nothing is cached yet
+    pub fn cached_loopback_devices(&self) -> Result<Vec<AudioLoopbackDevice>> {
+        if let Ok(cache) = LOOPBACK_DEVICE_CACHE.lock() {
+            if let Some(devices) = cache.as_ref() {
+                return Ok(devices.clone());
+            }
+        }
+        self.enumerate_loopback_devices()
+    }
+    
+    fn scan_loopback_devices(&self) -> Result<Vec<AudioLoopbackDevice>> {
         // println!("🔍 Scanning for loopback devices..."); // Commented out: Audio loopback is working, reducing console noise for debugging focus
         
         let mut loopback_devices = Vec::new();
@@ -44,15 +71,11 @@ impl WASAPILoopbackEnumerator {
         }
         
         // Strategy 2: Try capture devices that might be loopback
+        // Strategy 3: Look for stereo mix and similar devices
         if let Ok(capture_devices) = self.scan_capture_devices(&default_capture_id) {
             loopback_devices.extend(capture_devices);
         }
         
-        // Strategy 3: Look for stereo mix and similar devices
-        if let Ok(stereo_devices) = self.scan_stereo_mix_devices(&default_capture_id) {
-            loopback_devices.extend(stereo_devices);
-        }
-        
         // Remove duplicates by ID
         loopback_devices.sort_by(|a, b| a.id.cmp(&b.id));
         loopback_devices.dedup_by(|a, b| a.id == b.id);
@@ -79,6 +102,9 @@ impl WASAPILoopbackEnumerator {
         Ok(devices)
     }
     
+    // One pass over the capture endpoints covers both loopback-style capture devices
+    // and stereo mix devices, so each endpoint is opened at most once. A device that
+    // matches both keeps the capture-device entry, as the ID dedup did before.
     fn scan_capture_devices(&self, default_id: &str) -> Result<Vec<AudioLoopbackDevice>> {
         let device_count = self.capture_collection.get_nbr_devices()
             .map_err(|_| anyhow::anyhow!("Failed to get capture device count"))?;
@@ -87,34 +113,18 @@ impl WASAPILoopbackEnumerator {
         for i in 0..device_count {
             if let Ok(device) = self.capture_collection.get_device_at_index(i) {
                 if let Ok(name) = device.get_friendlyname() {
-                    if self.is_potential_loopback_capture_device(&name) {
-                        if let Ok(device_info) = self.create_capture_device_info(&device, default_id) {
-                            if self.test_capture_device_capability(&device) {
-                                devices.push(device_info);
-                            }
-                        }
-                    }
-                }
-            }
-        }
-        
-        Ok(devices)
-    }
-    
-    fn scan_stereo_mix_devices(&self, default_id: &str) -> Result<Vec<AudioLoopbackDevice>> {
-        let device_count = self.capture_collection.get_nbr_devices()
-            .map_err(|_| anyhow::anyhow!("Failed to get stereo mix device count"))?;
-        let mut devices = Vec::new();
-        
-        for i in 0..device_count {
-            if let Ok(device) = self.capture_collection.get_device_at_index(i) {
-                if let Ok(name) = device.get_friendlyname() {
-                    if self.is_stereo_mix_device(&name) {
-                        if let Ok(mut device_info) = self.create_capture_device_info(&device, default_id) {
-                            device_info.loopback_method = LoopbackMethod::StereoMix;
-                            if self.test_capture_device_capability(&device) {
-                                devices.push(device_info);
-                            }
+                    let loopback_method = if self.is_potential_loopback_capture_device(&name) {
+                        LoopbackMethod::CaptureDevice
+                    } else if self.is_stereo_mix_device(&name) {
+                        LoopbackMethod::StereoMix
+                    } else {
+                        continue;
+                    };
+                    
+                    if let Ok(mut device_info) = self.create_capture_device_info(&device, default_id) {
+                        device_info.loopback_method = loopback_method;
+                        if self.test_capture_device_capability(&device) {
+                            devices.push(device_info);
                         }
                     }
                 }
@@ -262,7 +272,20 @@ impl WASAPILoopbackEnumerator {
     }
     
     pub fn auto_select_best_device(&self) -> Result<Option<AudioLoopbackDevice>> {
-        let devices = self.enumerate_loopback_devices()?;
+        let mut devices = self.cached_loopback_devices()?;
+        
+        // The cached is_default flags date from the last scan. If the user has since
+        // switched output device, rescan so the new default is picked.
+        let default_render_id = get_default_device(&Direction::Render)
+            .ok()
+            .and_then(|d| d.get_id().ok())
+            .unwrap_or_default();
+        let default_is_current = devices.iter().any(|d| {
+            d.is_default && matches!(d.device_type, DeviceType::Render) && d.id == default_render_id
+        });
+        if !default_is_current {
+            devices = self.enumerate_loopback_devices()?;
+        }
         
         if devices.is_empty() {
             return Ok(None);
@@ -309,9 +332,37 @@ impl WASAPILoopbackEnumerator {
     }
     
     pub fn find_device_by_id(&self, device_id: &str) -> Result<Option<AudioLoopbackDevice>> {
+        if let Some(device) = self.cached_loopback_devices()?.into_iter().find(|d| d.id == device_id) {
+            return Ok(Some(device));
+        }
+        
+        // Not in the cache - the device may have been plugged in since the last scan
         let devices = self.enumerate_loopback_devices()?;
         Ok(devices.into_iter().find(|d| d.id == device_id))
     }
+    
+    /// Resolve a device from the collections this enumerator already holds
+    pub fn find_wasapi_device(&self, device_info: &AudioLoopbackDevice) -> Result<Device> {
+        let device_collection = match device_info.device_type {
+            DeviceType::Render => &self.render_collection,
+            DeviceType::Capture => &self.capture_collection,
+        };
+        
+        let device_count = device_collection.get_nbr_devices()
+            .map_err(|_| anyhow::anyhow!("Failed to get device count"))?;
+        
+        for i in 0..device_count {
+            if let Ok(device) = device_collection.get_device_at_index(i) {
+                if let Ok(id) = device.get_id() {
+                    if id == device_info.id {
+                        return Ok(device);
+                    }
+                }
+            }
+        }
+        
+        Err(anyhow::anyhow!("Could not find device with ID: {}", device_info.id))
+    }
 }
 
 // Tauri Commands
@@ -347,37 +398,12 @@ pub async fn test_audio_device(device_id: String) -> Result<bool, String> {
         Ok(enumerator) => {
             match enumerator.find_device_by_id(&device_id) {
                 Ok(Some(device_info)) => {
-                    let result = match device_info.device_type {
-                        DeviceType::Render => {
-                            if let Ok(device_collection) = DeviceCollection::new(&Direction::Render) {
-                                let device_count = device_collection.get_nbr_devices().unwrap_or(0);
-                                for i in 0..device_count {
-                                    if let Ok(device) = device_collection.get_device_at_index(i) {
-                                        if let Ok(id) = device.get_id() {
-                                            if id == device_id {
-                                                return Ok(enumerator.test_render_loopback_capability(&device));
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                            false
+                    let result = match enumerator.find_wasapi_device(&device_info) {
+                        Ok(device) => match device_info.device_type {
+                            DeviceType::Render => enumerator.test_render_loopback_capability(&device),
+                            DeviceType::Capture => enumerator.test_capture_device_capability(&device),
                         },
-                        DeviceType::Capture => {
-                            if let Ok(device_collection) = DeviceCollection::new(&Direction::Capture) {
-                                let device_count = device_collection.get_nbr_devices().unwrap_or(0);
-                                for i in 0..device_count {
-                                    if let Ok(device) = device_collection.get_device_at_index(i) {
-                                        if let Ok(id) = device.get_id() {
-                                            if id == device_id {
-                                                return Ok(enumerator.test_capture_device_capability(&device));
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                            false
-                        }
+                        Err(_) => false
                     };
                     
                     Ok(result)
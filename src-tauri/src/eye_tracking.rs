@@ -1,20 +1,116 @@
 use std::process::{Command, Stdio, Child};
 use std::io::{BufRead, BufReader};
-use std::sync::{Arc, Mutex};
+use std::cell::RefCell;
+use std::sync::{Arc, Mutex, OnceLock};
 use serde_json;
 use std::time::{SystemTime, UNIX_EPOCH};
+use tauri::{AppHandle, Emitter};
 
 #[derive(Debug, Clone, serde::Serialize, serde::Deserialize)]
 pub struct MLGazeData {
     pub x: f64,
     pub y: f64,
     pub confidence: f32,
-    pub left_eye_landmarks: Vec<(f32, f32)>,
-    pub right_eye_landmarks: Vec<(f32, f32)>,
+    // Flat [x0, y0, x1, y1, ...] per eye
+    #[serde(deserialize_with = "deserialize_flat_points")]
+    pub left_eye_landmarks: Vec<f32>,
+    #[serde(deserialize_with = "deserialize_flat_points")]
+    pub right_eye_landmarks: Vec<f32>,
     pub head_pose: HeadPose,
     pub timestamp: u64,
 }
 
+// The tracker prints landmarks as [[x, y], ...] pairs. They are read straight into
+// one flat buffer per eye, already in the layout the frontend gets (one JS array per
+// eye rather than one per landmark), so sending a sample is a plain f32 sequence with
+// no per-point conversion. Each coordinate is parsed directly onto the end of the
+// buffer; no per-point value is built in between.
+fn deserialize_flat_points<'de, D: serde::Deserializer<'de>>(deserializer: D) -> Result<Vec<f32>, D::Error> {
+    struct FlatPoints;
+
+    impl<'de> serde::de::Visitor<'de> for FlatPoints {
+        type Value = Vec<f32>;
+
+        fn expecting(&self, formatter: &mut std::fmt::Formatter) -> std::fmt::Result {
+            formatter.write_str("a sequence of [x, y] points")
+        }
+
+        fn visit_seq<A: serde::de::SeqAccess<'de>>(self, mut seq: A) -> Result<Vec<f32>, A::Error> {
+            let mut points = take_landmark_buffer(seq.size_hint().unwrap_or(0) * 2);
+            while seq.next_element_seed(AppendPoint(&mut points))?.is_some() {}
+            Ok(points)
+        }
+    }
+
+    // One [x, y] point, appended to the flat buffer as it is parsed
+    struct AppendPoint<'a>(&'a mut Vec<f32>);
+
+    impl<'de, 'a> serde::de::DeserializeSeed<'de> for AppendPoint<'a> {
+        type Value = ();
+
+        fn deserialize<D: serde::Deserializer<'de>>(self, deserializer: D) -> Result<(), D::Error> {
+            deserializer.deserialize_seq(self)
+        }
+    }
+
+    impl<'de, 'a> serde::de::Visitor<'de> for AppendPoint<'a> {
+        type Value = ();
+
+        fn expecting(&self, formatter: &mut std::fmt::Formatter) -> std::fmt::Result {
+            formatter.write_str("an [x, y] point")
+        }
+
+        fn visit_seq<A: serde::de::SeqAccess<'de>>(self, mut seq: A) -> Result<(), A::Error> {
+            use serde::de::Error;
+
+            let x = seq.next_element::<f32>()?.ok_or_else(|| A::Error::invalid_length(0, &self))?;
+            let y = seq.next_element::<f32>()?.ok_or_else(|| A::Error::invalid_length(1, &self))?;
+            if seq.next_element::<serde::de::IgnoredAny>()?.is_some() {
+                return Err(A::Error::invalid_length(3, &self));
+            }
+            self.0.push(x);
+            self.0.push(y);
+            Ok(())
+        }
+    }
+
+    deserializer.deserialize_seq(FlatPoints)
+}
+
+// Landmark buffers of samples that nothing holds any more. The reader thread parses
+// the next sample into them, so in steady state a frame allocates no landmark Vecs
+// (and a reused buffer already has the capacity a fresh one would grow into).
+const MAX_SPARE_LANDMARK_BUFFERS: usize = 4;
+
+thread_local! {
+    static SPARE_LANDMARK_BUFFERS: RefCell<Vec<Vec<f32>>> = RefCell::new(Vec::new());
+}
+
+fn take_landmark_buffer(capacity: usize) -> Vec<f32> {
+    let mut buffer = SPARE_LANDMARK_BUFFERS
+        .with(|spare| spare.borrow_mut().pop())
+        .unwrap_or_default();
+    buffer.clear();
+    buffer.reserve(capacity);
+    buffer
+}
+
+fn recycle_landmark_buffer(buffer: Vec<f32>) {
+    SPARE_LANDMARK_BUFFERS.with(|spare| {
+        let mut spare = spare.borrow_mut();
+        if spare.len() < MAX_SPARE_LANDMARK_BUFFERS {
+            spare.push(buffer);
+        }
+    });
+}
+
+// Strip leading/trailing ASCII whitespace (including the line terminator)
+fn trim_line(line: &[u8]) -> &[u8] {
+    let start = line.iter().position(|b| !b.is_ascii_whitespace()).unwrap_or(line.len());
+    let end = line.iter().rposition(|b| !b.is_ascii_whitespace()).map_or(start, |i| i + 1);
+    &line[start..end]
+}
+
 #[derive(Debug, Clone, serde::Serialize, serde::Deserialize)]
 pub struct HeadPose {
     pub yaw: f32,
@@ -53,6 +149,14 @@ pub struct MLEyeTrackingConfig {
     pub adaptive_smoothing: bool,
 }
 
+// Samples kept for get_ml_gaze_batch between drains (~8 frames at 30 FPS covers a
+// frontend that falls a few frames behind); older ones are dropped
+const MAX_PENDING_GAZE_SAMPLES: usize = 8;
+
+// Emitted (without payload) whenever a burst of samples has been queued, so the
+// frontend reacts as samples arrive instead of polling on a timer
+const GAZE_READY_EVENT: &str = "ml-gaze-ready";
+
 // Global eye tracker instance
 lazy_static::lazy_static! {
     static ref EYE_TRACKER: Arc<Mutex<MLEyeTracker>> = Arc::new(Mutex::new(MLEyeTracker::new()));
@@ -62,13 +166,39 @@ fn get_eye_tracker() -> &'static Arc<Mutex<MLEyeTracker>> {
     &EYE_TRACKER
 }
 
+// Interpreter that answered `--version`, resolved on the first successful start.
+// Probing spawns up to two processes, which every restart would otherwise pay again.
+// A failed probe isn't cached, so installing Python doesn't need an app restart.
+static PYTHON_COMMAND: OnceLock<&'static str> = OnceLock::new();
+
+fn resolve_python_command() -> Result<&'static str, String> {
+    if let Some(python_cmd) = PYTHON_COMMAND.get() {
+        return Ok(python_cmd);
+    }
+
+    let candidates = if cfg!(target_os = "windows") {
+        ["python", "python3"]
+    } else {
+        ["python3", "python"]
+    };
+    let python_cmd = candidates
+        .into_iter()
+        .find(|candidate| Command::new(candidate).arg("--version").output().is_ok())
+        .ok_or_else(|| "Python not found. Please install Python 3.8+ and add it to PATH".to_string())?;
+
+    Ok(PYTHON_COMMAND.get_or_init(|| python_cmd))
+}
+
 pub struct MLEyeTracker {
     process: Option<Child>,
     is_tracking: bool,
     is_calibrating: bool,
     stats: MLTrackingStats,
     calibration_points: Vec<CalibrationPoint>,
-    last_gaze_data: Option<MLGazeData>,
+    // Shared with get_ml_gaze_data so a poll only bumps a refcount under the lock
+    last_gaze_data: Option<Arc<MLGazeData>>,
+    // Samples received since the last get_ml_gaze_batch call, oldest first
+    pending_gaze_data: Vec<Arc<MLGazeData>>,
     config: Option<MLEyeTrackingConfig>,
 }
 
@@ -87,11 +217,12 @@ impl MLEyeTracker {
             },
             calibration_points: Vec::new(),
             last_gaze_data: None,
+            pending_gaze_data: Vec::with_capacity(MAX_PENDING_GAZE_SAMPLES),
             config: None,
         }
     }
 
-    pub fn start(&mut self, config: MLEyeTrackingConfig) -> Result<(), String> {
+    pub fn start(&mut self, config: MLEyeTrackingConfig, app_handle: AppHandle) -> Result<(), String> {
         if self.is_tracking {
             return Err("ML eye tracking is already running".to_string());
         }
@@ -118,15 +249,7 @@ impl MLEyeTracker {
         }
 
         // Find Python executable
-        let python_cmd = if cfg!(target_os = "windows") {
-            if Command::new("python").arg("--version").output().is_ok() { "python" } 
-            else if Command::new("python3").arg("--version").output().is_ok() { "python3" } 
-            else { return Err("Python not found. Please install Python 3.8+ and add it to PATH".to_string()); }
-        } else {
-            if Command::new("python3").arg("--version").output().is_ok() { "python3" }
-            else if Command::new("python").arg("--version").output().is_ok() { "python" }
-            else { return Err("Python not found. Please install Python 3.8+ and add it to PATH".to_string()); }
-        };
+        let python_cmd = resolve_python_command()?;
 
         // Start Python ML eye tracking process with config
         let mut cmd = Command::new(python_cmd);
@@ -149,25 +272,47 @@ impl MLEyeTracker {
         // Spawn stdout reader thread for gaze data
         if let Some(stdout) = child.stdout.take() {
             std::thread::spawn(move || {
-                let reader = BufReader::new(stdout);
-                for line in reader.lines() {
-                    if let Ok(line) = line {
-                        let trimmed = line.trim();
-                        if trimmed.is_empty() { continue; }
-                        
-                        if trimmed.starts_with("GAZE:") {
-                            if let Ok(gaze_data) = serde_json::from_str::<MLGazeData>(&trimmed[5..]) {
-                                if let Ok(mut tracker) = eye_tracker_clone.lock() {
-                                    tracker.update_gaze_data(gaze_data);
-                                }
-                            }
-                        } else if trimmed.starts_with("CALIBRATION:") {
-                            if let Ok(cal_point) = serde_json::from_str::<CalibrationPoint>(&trimmed[12..]) {
-                                println!("Calibration point: ({:.2}, {:.2})", cal_point.screen_x, cal_point.screen_y);
+                // One line buffer for the life of the process; gaze lines are parsed
+                // straight from the bytes, with no String allocated per frame
+                let mut reader = BufReader::new(stdout);
+                let mut line = Vec::with_capacity(256);
+                let mut received: Vec<MLGazeData> = Vec::with_capacity(MAX_PENDING_GAZE_SAMPLES);
+                loop {
+                    line.clear();
+                    match reader.read_until(b'\n', &mut line) {
+                        Ok(0) | Err(_) => break,
+                        Ok(_) => {}
+                    }
+
+                    let trimmed = trim_line(&line);
+                    if let Some(payload) = trimmed.strip_prefix(b"GAZE:") {
+                        if let Ok(gaze_data) = serde_json::from_slice::<MLGazeData>(payload) {
+                            received.push(gaze_data);
+                        }
+                    } else if let Some(payload) = trimmed.strip_prefix(b"CALIBRATION:") {
+                        if let Ok(cal_point) = serde_json::from_slice::<CalibrationPoint>(payload) {
+                            println!("Calibration point: ({:.2}, {:.2})", cal_point.screen_x, cal_point.screen_y);
+                        }
+                    } else if !trimmed.is_empty() {
+                        println!("ML Debug: {}", String::from_utf8_lossy(trimmed));
+                    }
+
+                    // Publish once no further complete line is already buffered, so a
+                    // burst of samples from one pipe read takes the lock once
+                    if !received.is_empty() && !reader.buffer().contains(&b'\n') {
+                        // One clock read per burst, not per sample
+                        let received_at = SystemTime::now()
+                            .duration_since(UNIX_EPOCH)
+                            .unwrap()
+                            .as_millis() as u64;
+                        if let Ok(mut tracker) = eye_tracker_clone.lock() {
+                            for gaze_data in received.drain(..) {
+                                tracker.update_gaze_data(gaze_data, received_at);
                             }
-                        } else {
-                            println!("ML Debug: {}", trimmed);
                         }
+                        received.clear();
+
+                        let _ = app_handle.emit(GAZE_READY_EVENT, ());
                     }
                 }
             });
@@ -192,6 +337,8 @@ impl MLEyeTracker {
     }
 
     pub fn stop(&mut self) -> Result<(), String> {
+        // The tracker is killed rather than kept warm for the next start: the script
+        // has no pause command, so a live process keeps the camera open after stop
         if let Some(mut process) = self.process.take() {
             process.kill().map_err(|e| format!("Failed to kill ML process: {}", e))?;
             process.wait().map_err(|e| format!("Failed to wait for ML process: {}", e))?;
@@ -200,6 +347,7 @@ impl MLEyeTracker {
         self.is_tracking = false;
         self.is_calibrating = false;
         self.last_gaze_data = None;
+        self.pending_gaze_data.clear();
         
         println!("👁️  Stopped ML eye tracking");
         Ok(())
@@ -280,17 +428,35 @@ impl MLEyeTracker {
         &self.stats
     }
 
-    pub fn get_latest_gaze_data(&self) -> Option<&MLGazeData> {
-        self.last_gaze_data.as_ref()
+    pub fn get_latest_gaze_data(&self) -> Option<Arc<MLGazeData>> {
+        self.last_gaze_data.clone()
     }
 
-    pub fn update_gaze_data(&mut self, gaze_data: MLGazeData) {
-        self.last_gaze_data = Some(gaze_data);
+    /// Take every sample received since the previous call, oldest first
+    pub fn drain_gaze_batch(&mut self) -> Vec<Arc<MLGazeData>> {
+        std::mem::replace(&mut self.pending_gaze_data, Vec::with_capacity(MAX_PENDING_GAZE_SAMPLES))
+    }
+
+    /// Record a sample from the tracker, received at `received_at` (Unix ms)
+    pub fn update_gaze_data(&mut self, gaze_data: MLGazeData, received_at: u64) {
+        let gaze_data = Arc::new(gaze_data);
+
+        // Low-confidence samples are queued too: the frontend's smoothing pipeline
+        // owns the confidence threshold and publishes them so confidence can drop
+        if self.pending_gaze_data.len() == MAX_PENDING_GAZE_SAMPLES {
+            self.pending_gaze_data.remove(0);
+        }
+        self.pending_gaze_data.push(Arc::clone(&gaze_data));
+        // Unless a batch or get_ml_gaze_data still holds it, the previous sample ends
+        // here: hand its landmark buffers back for the next parse on this thread
+        if let Some(previous) = self.last_gaze_data.replace(gaze_data) {
+            if let Ok(previous) = Arc::try_unwrap(previous) {
+                recycle_landmark_buffer(previous.left_eye_landmarks);
+                recycle_landmark_buffer(previous.right_eye_landmarks);
+            }
+        }
         self.stats.total_frames_processed += 1;
-        self.stats.last_update = SystemTime::now()
-            .duration_since(UNIX_EPOCH)
-            .unwrap()
-            .as_millis() as u64;
+        self.stats.last_update = received_at;
     }
 
     pub fn detect_window_drag(&self) -> bool {
@@ -302,10 +468,10 @@ impl MLEyeTracker {
 
 // Tauri command implementations with proper error handling
 #[tauri::command]
-pub async fn start_ml_eye_tracking(config: MLEyeTrackingConfig) -> Result<String, String> {
+pub async fn start_ml_eye_tracking(app_handle: AppHandle, config: MLEyeTrackingConfig) -> Result<String, String> {
     match get_eye_tracker().lock() {
         Ok(mut tracker) => {
-            tracker.start(config)?;
+            tracker.start(config, app_handle)?;
             Ok("ML Eye tracking started successfully".to_string())
         }
         Err(_) => Err("Failed to access eye tracker".to_string())
@@ -324,19 +490,53 @@ pub async fn stop_ml_eye_tracking() -> Result<String, String> {
 }
 
 #[tauri::command]
-pub async fn get_ml_gaze_data() -> Result<Option<MLGazeData>, String> {
+pub async fn get_ml_gaze_data(after: Option<u64>) -> Result<Option<Arc<MLGazeData>>, String> {
+    // Serialization happens after the lock is released, so polling never holds up
+    // the stdout reader thread. A caller that passes the timestamp of the sample it
+    // already has gets None until a new one arrives, so polling faster than the
+    // tracker doesn't re-serialize and re-send the same sample.
     match get_eye_tracker().lock() {
-        Ok(tracker) => {
-            if let Some(gaze_data) = tracker.get_latest_gaze_data() {
-                Ok(Some(gaze_data.clone()))
-            } else {
-                Ok(None)
-            }
-        }
+        Ok(tracker) => Ok(tracker
+            .get_latest_gaze_data()
+            .filter(|gaze_data| after != Some(gaze_data.timestamp))),
         Err(_) => Err("Failed to access eye tracker".to_string())
     }
 }
 
+// The fields the frontend's smoothing pipeline reads. Batches are sent as these rather
+// than full samples, so the landmarks and head pose it never looks at aren't
+// serialized for every frame.
+#[derive(Debug, Clone, serde::Serialize)]
+pub struct GazeSample {
+    pub x: f64,
+    pub y: f64,
+    pub confidence: f32,
+    pub timestamp: u64,
+}
+
+impl From<&MLGazeData> for GazeSample {
+    fn from(gaze_data: &MLGazeData) -> Self {
+        Self {
+            x: gaze_data.x,
+            y: gaze_data.y,
+            confidence: gaze_data.confidence,
+            timestamp: gaze_data.timestamp,
+        }
+    }
+}
+
+// Every sample since the previous call in one round trip, so the frontend's smoothing
+// sees each frame without paying an IPC call per frame. Meant for a single consumer:
+// each call drains what the last one left.
+#[tauri::command]
+pub async fn get_ml_gaze_batch() -> Result<Vec<GazeSample>, String> {
+    let batch = match get_eye_tracker().lock() {
+        Ok(mut tracker) => tracker.drain_gaze_batch(),
+        Err(_) => return Err("Failed to access eye tracker".to_string())
+    };
+    Ok(batch.iter().map(|gaze_data| GazeSample::from(gaze_data.as_ref())).collect())
+}
+
 #[tauri::command]
 pub async fn calibrate_ml_eye_tracking() -> Result<String, String> {
     match get_eye_tracker().lock() {
@@ -31,7 +31,7 @@ use window_manager::{
     get_virtual_desktop_size, get_monitor_layout, set_window_bounds
 };
 use eye_tracking::{
-    start_ml_eye_tracking, stop_ml_eye_tracking, get_ml_gaze_data, calibrate_ml_eye_tracking,
+    start_ml_eye_tracking, stop_ml_eye_tracking, get_ml_gaze_data, get_ml_gaze_batch, calibrate_ml_eye_tracking,
     get_ml_tracking_stats, pause_ml_tracking, resume_ml_tracking, detect_window_drag
 };
 use speech::{
@@ -259,6 +259,7 @@ pub fn run() {
             start_ml_eye_tracking,
             stop_ml_eye_tracking,
             get_ml_gaze_data,
+            get_ml_gaze_batch,
             calibrate_ml_eye_tracking,
             get_ml_tracking_stats,
             pause_ml_tracking,
@@ -1,4 +1,4 @@
-use std::sync::{Arc, Mutex};
+use std::sync::Mutex;
 
 // Whisper-rs imports for transcription
 use std::path::PathBuf;
@@ -6,7 +6,7 @@ use std::fs;
 use base64::{Engine as _, engine::general_purpose};
 use tempfile::NamedTempFile;
 use anyhow::Result;
-use whisper_rs::{WhisperContext, WhisperContextParameters, FullParams, SamplingStrategy};
+use whisper_rs::{WhisperContext, WhisperContextParameters, WhisperState, FullParams, SamplingStrategy};
 
 #[derive(Debug, Clone, serde::Serialize, serde::Deserialize)]
 pub struct AudioConfig {
@@ -73,9 +73,21 @@ pub struct TranscriptionResult {
     pub language: Option<String>,
 }
 
-// Global whisper context
+// A loaded Whisper model and its decoder state (mel buffer, KV cache, compute
+// buffers), kept across calls so a transcription does not reallocate them
+struct LoadedWhisperModel {
+    model_size: String,
+    context: WhisperContext,
+    state: Option<WhisperState>,
+}
+
+// Microphone and system audio each select their own model, so keep one per source
+// loaded rather than reloading on every switch between them
+const MAX_LOADED_WHISPER_MODELS: usize = 2;
+
+// Global whisper contexts, most recently used first
 lazy_static::lazy_static! {
-    pub static ref WHISPER_CONTEXT: Arc<Mutex<Option<WhisperContext>>> = Arc::new(Mutex::new(None));
+    static ref WHISPER_MODELS: Mutex<Vec<LoadedWhisperModel>> = Mutex::new(Vec::new());
     static ref MODEL_CACHE_DIR: PathBuf = {
         let mut cache_dir = std::env::temp_dir();
         cache_dir.push("enteract");
@@ -89,13 +101,23 @@ lazy_static::lazy_static! {
 pub async fn initialize_whisper_model(config: WhisperModelConfig) -> Result<String, String> {
     let model_path = get_or_download_model(&config.modelSize).await?;
     
+    let mut ctx_params = WhisperContextParameters::default();
+    ctx_params.use_gpu(whisper_gpu_enabled());
+    
     let ctx = WhisperContext::new_with_params(
         model_path.to_str().ok_or("Invalid model path")?,
-        WhisperContextParameters::default()
+        ctx_params
     ).map_err(|e| format!("Failed to initialize Whisper context: {}", e))?;
     
-    let mut whisper_ctx = WHISPER_CONTEXT.lock().unwrap();
-    *whisper_ctx = Some(ctx);
+    let mut models = WHISPER_MODELS.lock().unwrap();
+    // A reload replaces the model's old context, and the state that belongs to it
+    models.retain(|model| model.model_size != config.modelSize);
+    models.insert(0, LoadedWhisperModel {
+        model_size: config.modelSize.clone(),
+        context: ctx,
+        state: None,
+    });
+    models.truncate(MAX_LOADED_WHISPER_MODELS);
     
     Ok(format!("Whisper model '{}' initialized successfully", config.modelSize))
 }
@@ -119,22 +141,42 @@ pub async fn transcribe_audio_base64(audioData: String, config: WhisperModelConf
 
 #[tauri::command]
 pub async fn transcribe_audio_file(file_path: String, config: WhisperModelConfig) -> Result<TranscriptionResult, String> {
-    // Ensure model is initialized
+    // Load and preprocess audio
+    let audio_data = load_audio_file(&file_path)?;
+    
+    transcribe_samples(&audio_data, config).await
+}
+
+// In-memory entry point for callers that already hold 16kHz mono PCM16 (the loopback
+// capture), skipping the base64 and temp-file round trip
+pub async fn transcribe_pcm16(samples: &[i16], config: WhisperModelConfig) -> Result<TranscriptionResult, String> {
+    let audio_data: Vec<f32> = samples.iter().map(|&s| s as f32 / 32768.0).collect();
+    
+    transcribe_samples(&audio_data, config).await
+}
+
+async fn transcribe_samples(audio_data: &[f32], config: WhisperModelConfig) -> Result<TranscriptionResult, String> {
+    // Ensure the requested model is initialized - a model changed in settings loads
+    // here on its first use, not at the next restart
     let needs_init = {
-        let whisper_ctx = WHISPER_CONTEXT.lock().unwrap();
-        whisper_ctx.is_none()
+        let models = WHISPER_MODELS.lock().unwrap();
+        !models.iter().any(|model| model.model_size == config.modelSize)
     };
     
     if needs_init {
         initialize_whisper_model(config.clone()).await?;
     }
     
-    // Load and preprocess audio
-    let audio_data = load_audio_file(&file_path)?;
-    
-    // Get Whisper context
-    let whisper_ctx = WHISPER_CONTEXT.lock().unwrap();
-    let ctx = whisper_ctx.as_ref().ok_or("Whisper context not initialized")?;
+    // Get Whisper context, moving it to the front as the most recently used
+    let mut models = WHISPER_MODELS.lock().unwrap();
+    let index = models.iter()
+        .position(|model| model.model_size == config.modelSize)
+        .ok_or("Whisper context not initialized")?;
+    if index > 0 {
+        let model = models.remove(index);
+        models.insert(0, model);
+    }
+    let model = &mut models[0];
     
     // Set up transcription parameters - MATCHING PYTHON SCRIPT
     // Python uses: beam_size=1, best_of=1, temperature=0.0
@@ -162,10 +204,15 @@ pub async fn transcribe_audio_file(file_path: String, config: WhisperModelConfig
     params.set_no_context(true);          // Python: condition_on_previous_text=False
     params.set_temperature(0.0);          // Python: temperature=0.0
     params.set_no_timestamps(true);       // Python: without_timestamps=True
+    params.set_n_threads(whisper_thread_count());
     
-    // Run transcription
-    let mut state = ctx.create_state().map_err(|e| format!("Failed to create state: {}", e))?;
-    state.full(params, &audio_data)
+    // Run transcription on the cached state - whisper_full recomputes the mel into the
+    // existing buffers, so only the first call after a model load allocates
+    if model.state.is_none() {
+        model.state = Some(model.context.create_state().map_err(|e| format!("Failed to create state: {}", e))?);
+    }
+    let state = model.state.as_mut().ok_or("Whisper state not initialized")?;
+    state.full(params, audio_data)
         .map_err(|e| format!("Transcription failed: {}", e))?;
     
     // Extract results
@@ -230,6 +277,10 @@ pub async fn list_available_models() -> Result<Vec<String>, String> {
         "small".to_string(),
         "medium".to_string(),
         "large".to_string(),
+        // INT8-quantized ggml weights (Python: compute_type="int8")
+        "tiny-q8_0".to_string(),
+        "base-q8_0".to_string(),
+        "small-q8_0".to_string(),
     ])
 }
 
@@ -248,6 +299,21 @@ async fn get_or_download_model(model_size: &str) -> Result<PathBuf, String> {
     Ok(model_path)
 }
 
+// Python: cpu_threads=6. Size the pool from the host instead, leaving one core
+// free for the audio capture thread; whisper.cpp stops scaling past ~8 threads.
+fn whisper_thread_count() -> i32 {
+    let available = std::thread::available_parallelism()
+        .map(|n| n.get())
+        .unwrap_or(4);
+    available.saturating_sub(1).clamp(1, 8) as i32
+}
+
+// GPU offload only exists when whisper.cpp was built with a GPU backend (see the
+// whisper-* features in Cargo.toml); CPU builds keep it off
+fn whisper_gpu_enabled() -> bool {
+    cfg!(any(feature = "whisper-cuda", feature = "whisper-metal"))
+}
+
 fn is_valid_model_file(path: &PathBuf) -> bool {
     if let Ok(metadata) = fs::metadata(path) {
         metadata.len() > 1_000_000 // 1MB minimum
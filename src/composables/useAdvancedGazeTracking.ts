@@ -1,5 +1,6 @@
-import { ref, computed, onUnmounted, readonly } from 'vue'
+import { ref, shallowRef, computed, onUnmounted, readonly } from 'vue'
 import { invoke } from '@tauri-apps/api/core'
+import { listen, type UnlistenFn } from '@tauri-apps/api/event'
 
 // Interface definitions for enhanced gaze tracking
 export interface MonitorInfo {
@@ -25,8 +26,9 @@ export interface AdvancedGazeData {
   x: number
   y: number
   confidence: number
-  left_eye_landmarks: number[][]
-  right_eye_landmarks: number[][]
+  // Interleaved [x0, y0, x1, y1, ...]
+  left_eye_landmarks: number[]
+  right_eye_landmarks: number[]
   head_pose: {
     yaw: number
     pitch: number
@@ -75,19 +77,42 @@ export interface CalibrationSession {
   quality_score: number
 }
 
+// Emitted by the backend whenever it records gaze samples
+const GAZE_READY_EVENT = 'ml-gaze-ready'
+
+// gazeScreenPosition is published in whole pixels, and only once the gaze has moved
+// at least this many pixels: sub-pixel jitter from the tracker would otherwise
+// re-render everything bound to it on every sample
+const GAZE_POSITION_MIN_STEP = 2
+
 export function useAdvancedGazeTracking() {
   // Core state
   const isActive = ref(false)
   const isInitialized = ref(false)
   const isCalibrated = ref(false)
-  const currentGaze = ref<AdvancedGazeData | null>(null)
+  // Per-frame values are replaced wholesale, never mutated, so they are shallow refs:
+  // publishing a sample is a plain assignment instead of wrapping it (and its
+  // landmark arrays) in deep reactive proxies
+  const currentGaze = shallowRef<AdvancedGazeData | null>(null)
   const error = ref<string | null>(null)
   const isLoading = ref(false)
 
   // Monitor and spatial awareness
   const monitorMesh = ref<MonitorMesh | null>(null)
   const currentMonitor = ref<MonitorInfo | null>(null)
-  const gazeScreenPosition = ref<{ x: number, y: number } | null>(null)
+  const gazeScreenPosition = shallowRef<{ x: number, y: number } | null>(null)
+
+  // Virtual desktop bounds as plain numbers, for the per-sample maths. They only change
+  // when the mesh is (re)loaded, so they are refreshed there instead of being read
+  // through the reactive mesh on every sample.
+  const meshCache = { left: 0, top: 0, inverseWidth: 0, inverseHeight: 0 }
+
+  const refreshMonitorCache = (mesh: MonitorMesh): void => {
+    meshCache.left = mesh.virtual_left
+    meshCache.top = mesh.virtual_top
+    meshCache.inverseWidth = 1 / mesh.virtual_width
+    meshCache.inverseHeight = 1 / mesh.virtual_height
+  }
 
   // Configuration
   const config = ref<GazeTrackingConfig>({
@@ -122,9 +147,15 @@ export function useAdvancedGazeTracking() {
     quality_score: 0
   })
 
-  // Tracking management
-  let trackingInterval: number | null = null
+  // Tracking management. Gaze is fetched when the backend signals a new sample
+  // (GAZE_READY_EVENT), so updates follow the tracker's own frame rate rather than a
+  // fixed timer that either lags behind it or polls for nothing.
+  let unlistenGazeReady: UnlistenFn | null = null
   let statsInterval: number | null = null
+  // Set while a get_ml_gaze_data call is outstanding so slow IPC never stacks up polls;
+  // a signal arriving meanwhile is folded into one follow-up fetch
+  let pollInFlight = false
+  let pollPending = false
 
   // Computed properties
   const isHighConfidence = computed(() => {
@@ -132,11 +163,12 @@ export function useAdvancedGazeTracking() {
   })
 
   const normalizedGaze = computed(() => {
-    if (!currentGaze.value || !monitorMesh.value) return null
-    
+    const gaze = currentGaze.value
+    if (!gaze || !monitorMesh.value) return null
+
     return {
-      x: (currentGaze.value.x - monitorMesh.value.virtual_left) / monitorMesh.value.virtual_width,
-      y: (currentGaze.value.y - monitorMesh.value.virtual_top) / monitorMesh.value.virtual_height
+      x: (gaze.x - meshCache.left) * meshCache.inverseWidth,
+      y: (gaze.y - meshCache.top) * meshCache.inverseHeight
     }
   })
 
@@ -213,6 +245,7 @@ export function useAdvancedGazeTracking() {
         virtual_top: 0
       }
       
+      refreshMonitorCache(fallbackMesh)
       monitorMesh.value = fallbackMesh
       currentMonitor.value = fallbackMesh.monitors[0]
       
@@ -234,16 +267,16 @@ export function useAdvancedGazeTracking() {
       console.log('▶️ Starting gaze tracking...')
       
       // Start data polling
-      startDataPolling()
-      startStatsMonitoring()
-      
       isActive.value = true
       stats.value.tracking_duration = Date.now()
+      await startDataPolling()
+      startStatsMonitoring()
       
       console.log('✅ Gaze tracking started successfully')
       return true
 
     } catch (err) {
+      isActive.value = false
       error.value = `Failed to start tracking: ${(err as Error).message}`
       console.error('❌ Failed to start gaze tracking:', err)
       return false
@@ -276,38 +309,67 @@ export function useAdvancedGazeTracking() {
     }
   }
 
-  // Start data polling loop
-  const startDataPolling = (): void => {
-    if (trackingInterval) return // Already polling
+  // Fetch the latest gaze sample
+  const pollGazeData = async (): Promise<void> => {
+    if (!isActive.value) return
+    if (pollInFlight) {
+      pollPending = true
+      return
+    }
+    pollInFlight = true
+
+    try {
+      // null while the tracker has nothing newer than the sample already shown
+      const gazeData = await invoke<AdvancedGazeData | null>('get_ml_gaze_data', {
+        after: currentGaze.value?.timestamp ?? null
+      })
+      
+      if (gazeData) {
+        currentGaze.value = gazeData
+        updateGazeMetrics(gazeData)
+        updateCurrentMonitor(gazeData)
+      }
+    } catch (err) {
+      console.error('❌ Error polling for gaze data:', err)
+      error.value = `Gaze polling error: ${(err as Error).message}`
+      // Consider stopping polling on repeated errors
+    } finally {
+      pollInFlight = false
+      if (pollPending && unlistenGazeReady) {
+        pollPending = false
+        pollGazeData()
+      }
+    }
+  }
+
+  // Start following the backend's gaze samples
+  const startDataPolling = async (): Promise<void> => {
+    if (unlistenGazeReady) return // Already polling
 
     console.log('📊 Starting data polling...')
-    
-    trackingInterval = window.setInterval(async () => {
-      try {
-        if (!isActive.value) return
 
-        const gazeData = await invoke<AdvancedGazeData | null>('get_ml_gaze_data')
-        
-        if (gazeData) {
-          currentGaze.value = gazeData
-          updateGazeMetrics(gazeData)
-          updateCurrentMonitor(gazeData)
-        }
-      } catch (err) {
-        console.error('❌ Error polling for gaze data:', err)
-        error.value = `Gaze polling error: ${(err as Error).message}`
-        // Consider stopping polling on repeated errors
-      }
-    }, 33) // ~30 FPS
+    const unlisten = await listen(GAZE_READY_EVENT, () => {
+      pollGazeData()
+    })
+    // Tracking may have been stopped while the listener was being attached
+    if (!isActive.value || unlistenGazeReady) {
+      unlisten()
+      return
+    }
+    unlistenGazeReady = unlisten
+
+    // A sample recorded before the listener was attached
+    pollGazeData()
   }
 
   // Stop data polling
   const stopDataPolling = (): void => {
-    if (trackingInterval) {
-      clearInterval(trackingInterval)
-      trackingInterval = null
+    if (unlistenGazeReady) {
+      unlistenGazeReady()
+      unlistenGazeReady = null
       console.log('📊 Stopped data polling')
     }
+    pollPending = false
   }
 
   // Start statistics monitoring
@@ -340,7 +402,18 @@ export function useAdvancedGazeTracking() {
   // Update gaze metrics and screen position
   const updateGazeMetrics = (gaze: AdvancedGazeData): void => {
     // Update screen position
-    gazeScreenPosition.value = { x: gaze.x, y: gaze.y }
+    const x = Math.round(gaze.x)
+    const y = Math.round(gaze.y)
+    const last = gazeScreenPosition.value
+    if (last) {
+      const dx = x - last.x
+      const dy = y - last.y
+      if (dx * dx + dy * dy >= GAZE_POSITION_MIN_STEP * GAZE_POSITION_MIN_STEP) {
+        gazeScreenPosition.value = { x, y }
+      }
+    } else {
+      gazeScreenPosition.value = { x, y }
+    }
     
     // Update rolling average confidence
     stats.value.average_confidence = (stats.value.average_confidence * 0.95) + (gaze.confidence * 0.05)
@@ -1,8 +1,9 @@
 import { ref, reactive, onUnmounted, readonly, computed, watch } from 'vue'
+import { VERBOSE_TRACKING_LOGS } from '../lib/debugFlags'
 
 // Types based on the implementation plan
 interface CameraConfig {
-  width: number          // 1280x720 recommended
+  width: number          // 640x480 default; analysis runs at 320 wide
   height: number
   frameRate: number      // 30 FPS target
   facingMode: 'user'     // Front-facing camera
@@ -32,10 +33,40 @@ export function useCameraManager() {
   })
 
   const videoElement = ref<HTMLVideoElement | null>(null)
+
+  // Frame grab surfaces, created on first use and reused for every frame. Full
+  // resolution grabs read back every pixel they draw, so that surface keeps its
+  // backing store in CPU memory. Downscaled grabs use a GPU-backed surface instead:
+  // the video frame is scaled on the GPU and only the small result is read back.
+  interface FrameSurface {
+    canvas: HTMLCanvasElement
+    context: CanvasRenderingContext2D | null
+  }
+  const frameSurfaces: { full: FrameSurface | null, scaled: FrameSurface | null } = {
+    full: null,
+    scaled: null
+  }
+
+  const getFrameSurface = (scaled: boolean): FrameSurface => {
+    const key = scaled ? 'scaled' : 'full'
+    let surface = frameSurfaces[key]
+    if (!surface) {
+      const canvas = document.createElement('canvas')
+      surface = {
+        canvas,
+        context: canvas.getContext('2d', { willReadFrequently: !scaled })
+      }
+      frameSurfaces[key] = surface
+    }
+    return surface
+  }
   const availableDevices = ref<CameraDevice[]>([])
+  // Capture at 640x480: frames are downscaled to ~320 wide for analysis anyway, and a
+  // smaller mode is cheaper to capture, decode and composite, so frames reach the
+  // pipeline sooner
   const currentConfig = ref<CameraConfig>({
-    width: 1280,
-    height: 720,
+    width: 640,
+    height: 480,
     frameRate: 30,
     facingMode: 'user'
   })
@@ -116,25 +147,38 @@ export function useCameraManager() {
       }
       console.log('Camera config:', currentConfig.value)
 
-      // Check permissions first
-      if (state.permissions !== 'granted') {
-        console.log('Requesting camera permissions...')
-        const hasPermission = await requestPermissions()
-        if (!hasPermission) {
+      // Build constraints and start stream. getUserMedia doubles as the permission
+      // prompt, so the camera is opened once rather than via a throwaway test stream
+      const constraints = buildConstraints(currentConfig.value)
+      console.log('Camera constraints:', constraints)
+      
+      let stream: MediaStream
+      try {
+        stream = await navigator.mediaDevices.getUserMedia(constraints)
+      } catch (error) {
+        if (error instanceof DOMException && error.name === 'NotAllowedError') {
+          state.permissions = 'denied'
+          state.error = `Camera permission denied: ${error.message}`
           console.error('Camera permission denied')
           return false
         }
+        throw error
       }
-
-      // Build constraints and start stream
-      const constraints = buildConstraints(currentConfig.value)
-      console.log('Camera constraints:', constraints)
-      
-      const stream = await navigator.mediaDevices.getUserMedia(constraints)
       console.log('Got media stream:', stream)
+
+      // Frames are grabbed from a video element. With no preview attached by the UI,
+      // use a detached one: it decodes the stream for capture without ever being laid
+      // out, painted or composited
+      if (!videoElement.value) {
+        const video = document.createElement('video')
+        video.muted = true
+        video.playsInline = true
+        videoElement.value = video
+      }
       
       state.stream = stream
       state.isActive = true
+      state.permissions = 'granted'
       state.error = null
 
       // Video element attachment will be handled by the watch function
@@ -286,9 +330,21 @@ export function useCameraManager() {
     }
   })
 
-  const getCurrentFrame = (): ImageData | null => {
+  // Size of a grabbed frame: the video size, downscaled to maxWidth if it is wider
+  const getFrameSize = (video: HTMLVideoElement, maxWidth?: number) => {
+    const scale = maxWidth && video.videoWidth > maxWidth ? maxWidth / video.videoWidth : 1
+    return {
+      frameWidth: Math.round(video.videoWidth * scale),
+      frameHeight: Math.round(video.videoHeight * scale),
+      scaled: scale < 1
+    }
+  }
+
+  // maxWidth downscales the frame while it is drawn, so callers that do not need the
+  // full camera resolution never read back or walk the extra pixels
+  const getCurrentFrame = (maxWidth?: number): ImageData | null => {
     if (!videoElement.value || !state.isActive) {
-      console.log('getCurrentFrame: No video element or not active')
+      if (VERBOSE_TRACKING_LOGS) console.log('getCurrentFrame: No video element or not active')
       return null
     }
 
@@ -297,29 +353,33 @@ export function useCameraManager() {
       
       // Check if video is ready
       if (video.readyState < 2) { // HAVE_CURRENT_DATA
-        console.log('getCurrentFrame: Video not ready, readyState:', video.readyState)
+        if (VERBOSE_TRACKING_LOGS) console.log('getCurrentFrame: Video not ready, readyState:', video.readyState)
         return null
       }
       
       if (video.videoWidth === 0 || video.videoHeight === 0) {
-        console.log('getCurrentFrame: Video dimensions not available')
+        if (VERBOSE_TRACKING_LOGS) console.log('getCurrentFrame: Video dimensions not available')
         return null
       }
 
-      const canvas = document.createElement('canvas')
-      const ctx = canvas.getContext('2d')
+      const { frameWidth, frameHeight, scaled } = getFrameSize(video, maxWidth)
+
+      const { canvas, context: ctx } = getFrameSurface(scaled)
       if (!ctx) {
-        console.log('getCurrentFrame: Could not get canvas context')
+        if (VERBOSE_TRACKING_LOGS) console.log('getCurrentFrame: Could not get canvas context')
         return null
       }
 
-      canvas.width = video.videoWidth
-      canvas.height = video.videoHeight
+      // Resizing reallocates the backing store, so only do it when the size changes
+      if (canvas.width !== frameWidth || canvas.height !== frameHeight) {
+        canvas.width = frameWidth
+        canvas.height = frameHeight
+      }
 
-      ctx.drawImage(video, 0, 0)
+      ctx.drawImage(video, 0, 0, frameWidth, frameHeight)
       const imageData = ctx.getImageData(0, 0, canvas.width, canvas.height)
       
-      console.log('getCurrentFrame: Successfully captured frame', canvas.width, 'x', canvas.height)
+      if (VERBOSE_TRACKING_LOGS) console.log('getCurrentFrame: Successfully captured frame', canvas.width, 'x', canvas.height)
       return imageData
     } catch (error) {
       console.error('Failed to get current frame:', error)
@@ -327,6 +387,61 @@ export function useCameraManager() {
     }
   }
 
+  // Like getCurrentFrame, but the browser scales the frame (on the GPU where it can)
+  // into an ImageBitmap, which can be transferred to a worker and read back there
+  // without its pixels ever touching this thread
+  const getCurrentFrameBitmap = async (maxWidth?: number): Promise<ImageBitmap | null> => {
+    const video = videoElement.value
+    if (!video || !state.isActive || video.readyState < 2 || video.videoWidth === 0 || video.videoHeight === 0) {
+      return null
+    }
+
+    try {
+      const { frameWidth, frameHeight } = getFrameSize(video, maxWidth)
+      return await createImageBitmap(video, {
+        resizeWidth: frameWidth,
+        resizeHeight: frameHeight,
+        resizeQuality: 'low'
+      })
+    } catch (error) {
+      console.error('Failed to capture frame bitmap:', error)
+      return null
+    }
+  }
+
+  // Monotonic count of frames the video element has presented, or null when the
+  // browser doesn't report it. Lets timer-paced callers tell a new frame from one
+  // they have already captured.
+  const getPresentedFrameCount = (): number | null => {
+    const video = videoElement.value
+    if (!video || typeof video.getVideoPlaybackQuality !== 'function') return null
+    return video.getVideoPlaybackQuality().totalVideoFrames
+  }
+
+  // Call `callback` as each new camera frame is presented (requestVideoFrameCallback)
+  // until the returned stop function is called. null when the video element isn't in
+  // the document or the browser can't report frame arrival.
+  const watchVideoFrames = (callback: () => void): (() => void) | null => {
+    // Detached elements aren't composited, so frame callbacks may never fire for them
+    const video = videoElement.value
+    if (!video || !video.isConnected || typeof video.requestVideoFrameCallback !== 'function') {
+      return null
+    }
+
+    let stopped = false
+    const onFrame = (): void => {
+      if (stopped) return
+      callback()
+      handle = video.requestVideoFrameCallback(onFrame)
+    }
+    let handle = video.requestVideoFrameCallback(onFrame)
+
+    return () => {
+      stopped = true
+      video.cancelVideoFrameCallback(handle)
+    }
+  }
+
   // Setup device change listener
   navigator.mediaDevices?.addEventListener?.('devicechange', handleDeviceChange)
 
@@ -355,6 +470,9 @@ export function useCameraManager() {
     recoverFromError,
     attachVideoElement,
     getCurrentFrame,
+    getCurrentFrameBitmap,
+    getPresentedFrameCount,
+    watchVideoFrames,
 
     // Computed
     isActive: computed(() => state.isActive),
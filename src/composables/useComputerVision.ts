@@ -2,10 +2,17 @@ import { ref, reactive, onMounted, onUnmounted, readonly, computed } from 'vue'
 import type { 
   FaceBox, 
   EyePair, 
-  EyeRegion, 
+  EyeRegion,
   GazeVector, 
   EyeTrackingResult,
 } from '../types/eyeTracking'
+import type { FrameData, ProcessedFrame } from '../lib/vision/frameAnalysis'
+
+// The frame analysis code only runs on the main thread when the analysis worker is
+// unavailable, so it is loaded on demand by initializeOpenCV rather than parsed and
+// evaluated with the app bundle
+type FrameAnalysisModule = typeof import('../lib/vision/frameAnalysis')
+let frameAnalysis: FrameAnalysisModule | null = null
 
 interface OpenCVState {
   isLoaded: boolean
@@ -32,9 +39,9 @@ export function useComputerVision() {
       
       // For Phase 1, we'll use a simplified approach without external OpenCV
       // This ensures the demo works reliably while we develop the full CV pipeline
-      
-      // Simulate OpenCV loading
-      await new Promise(resolve => setTimeout(resolve, 500))
+      if (!frameAnalysis) {
+        frameAnalysis = await import('../lib/vision/frameAnalysis')
+      }
       
       state.isLoaded = true
       state.version = 'Demo Computer Vision v1.0'
@@ -57,335 +64,48 @@ export function useComputerVision() {
   //   console.log('Classifiers loaded (demo mode)')
   // }
 
-  // Process ImageData (simplified for Phase 1 demo)
-  const processImageData = (imageData: ImageData): any => {
-    if (!state.isLoaded) {
-      throw new Error('Computer vision not initialized')
-    }
-
-    // For Phase 1 demo, we'll analyze the image data directly
-    // This gives us basic image analysis without external dependencies
-    
-    return {
-      width: imageData.width,
-      height: imageData.height,
-      data: imageData.data,
-      // Add some basic image statistics
-      brightness: calculateBrightness(imageData),
-      variation: calculateVariation(imageData)
-    }
-  }
-
-  // Calculate average brightness of image
-  const calculateBrightness = (imageData: ImageData): number => {
-    let total = 0
-    const data = imageData.data
-    
-    for (let i = 0; i < data.length; i += 4) {
-      // Calculate grayscale value
-      const gray = (data[i] + data[i + 1] + data[i + 2]) / 3
-      total += gray
-    }
-    
-    return total / (data.length / 4)
-  }
-
-  // Calculate variation in image (indicator of content)
-  const calculateVariation = (imageData: ImageData): number => {
-    const data = imageData.data
-    const brightness = calculateBrightness(imageData)
-    let variance = 0
-    
-    for (let i = 0; i < data.length; i += 4) {
-      const gray = (data[i] + data[i + 1] + data[i + 2]) / 3
-      variance += Math.pow(gray - brightness, 2)
-    }
-    
-    return Math.sqrt(variance / (data.length / 4))
-  }
+  // Defined here, not in frameAnalysis: it is needed before that module is loaded
+  const emptyEyeRegion = (): EyeRegion => ({
+    boundingBox: { x: 0, y: 0, width: 0, height: 0 },
+    pupilCenter: { x: 0, y: 0 },
+    confidence: 0,
+    isOpen: false
+  })
 
   // Detect faces in the image (simplified demo implementation)
-  const detectFaces = (processedImage: any): FaceBox[] => {
-    if (!state.isLoaded) {
+  const detectFaces = (processedImage: ProcessedFrame): FaceBox[] => {
+    if (!state.isLoaded || !frameAnalysis) {
       return []
     }
 
-    try {
-      // Get image dimensions
-      const height = processedImage.height
-      const width = processedImage.width
-      
-      // For Phase 1 demo: simulate face detection by assuming face is in center portion
-      // This ensures we always have a "face" detected for testing
-      const faceWidth = Math.floor(width * 0.4)  // 40% of image width
-      const faceHeight = Math.floor(height * 0.5) // 50% of image height
-      const faceX = Math.floor((width - faceWidth) / 2)   // Center horizontally
-      const faceY = Math.floor((height - faceHeight) / 3) // Upper third
-      
-      // Use the calculated variation as confidence indicator
-      const variation = processedImage.variation
-      
-      // If there's sufficient variation, assume a face is present
-      if (variation > 20) { // Threshold for variation
-        return [{
-          x: faceX,
-          y: faceY,
-          width: faceWidth,
-          height: faceHeight,
-          confidence: Math.min(0.9, variation / 100) // Scale confidence based on variation
-        }]
-      }
-      
-      return []
-        
-    } catch (error) {
-      console.error('Face detection error:', error)
-      return []
-    }
+    return frameAnalysis.detectFaces(processedImage)
   }
 
   // Detect eyes within a face region (simplified for Phase 1 demo)
-  const detectEyes = (_processedImage: any, faceBox: FaceBox): EyePair => {
-    if (!state.isLoaded) {
+  const detectEyes = (_processedImage: ProcessedFrame, faceBox: FaceBox): EyePair => {
+    if (!state.isLoaded || !frameAnalysis) {
       return {
-        left: createEmptyEyeRegion(),
-        right: createEmptyEyeRegion(),
+        left: emptyEyeRegion(),
+        right: emptyEyeRegion(),
         isValid: false
       }
     }
 
-    try {
-      // Eye regions are typically in the upper half of the face
-      const eyeRegionHeight = Math.floor(faceBox.height * 0.4)
-      const eyeRegionY = Math.floor(faceBox.height * 0.2)
-      
-      // Left eye region (right side of image due to camera mirror)
-      const leftEyeBox = {
-        x: faceBox.x + Math.floor(faceBox.width * 0.1),
-        y: faceBox.y + eyeRegionY,
-        width: Math.floor(faceBox.width * 0.4),
-        height: eyeRegionHeight
-      }
-      
-      // Right eye region
-      const rightEyeBox = {
-        x: faceBox.x + Math.floor(faceBox.width * 0.5),
-        y: faceBox.y + eyeRegionY,
-        width: Math.floor(faceBox.width * 0.4),
-        height: eyeRegionHeight
-      }
-
-      // Simulate pupil detection - use center of eye regions with some offset
-      const leftPupil = {
-        x: leftEyeBox.width / 2,
-        y: leftEyeBox.height / 2,
-        confidence: 0.8
-      }
-      
-      const rightPupil = {
-        x: rightEyeBox.width / 2,
-        y: rightEyeBox.height / 2,
-        confidence: 0.8
-      }
-
-      // Convert to global coordinates
-      const leftEye: EyeRegion = {
-        boundingBox: leftEyeBox,
-        pupilCenter: {
-          x: leftEyeBox.x + leftPupil.x,
-          y: leftEyeBox.y + leftPupil.y
-        },
-        confidence: leftPupil.confidence,
-        isOpen: leftPupil.confidence > 0.3
-      }
-
-      const rightEye: EyeRegion = {
-        boundingBox: rightEyeBox,
-        pupilCenter: {
-          x: rightEyeBox.x + rightPupil.x,
-          y: rightEyeBox.y + rightPupil.y
-        },
-        confidence: rightPupil.confidence,
-        isOpen: rightPupil.confidence > 0.3
-      }
-
-      return {
-        left: leftEye,
-        right: rightEye,
-        isValid: leftEye.confidence > 0.3 && rightEye.confidence > 0.3
-      }
-
-    } catch (error) {
-      console.error('Eye detection error:', error)
-      return {
-        left: createEmptyEyeRegion(),
-        right: createEmptyEyeRegion(),
-        isValid: false
-      }
-    }
+    return frameAnalysis.detectEyes(faceBox)
   }
 
-  // Simplified pupil detection for Phase 1 demo
-  // Unused in current implementation - removed to fix TypeScript error
-  // const findPupilCenter = (eyeRegion: any): Point2D & { confidence: number } => {
-  //   // For Phase 1 demo, return center of eye region
-  //   return {
-  //     x: eyeRegion.width / 2,
-  //     y: eyeRegion.height / 2,
-  //     confidence: 0.8
-  //   }
-  // }
-
   // Calculate basic gaze vector from eye positions and image analysis
-  const calculateGaze = (eyes: EyePair, faceBox: FaceBox, processedImage?: any): GazeVector => {
-    if (!eyes.isValid) {
-      return {
-        x: 0,
-        y: 0,
-        confidence: 0,
-        timestamp: Date.now()
-      }
-    }
-
-    try {
-      // If we have processed image data, use it to influence gaze calculation
-      if (processedImage) {
-        // Analyze the face region for brightness variations that might indicate gaze direction
-        const faceData = extractFaceRegion(processedImage, faceBox)
-        const gazeInfluence = analyzeGazeDirection(faceData)
-        
-        // Combine eye position with image analysis
-        const baseX = (eyes.left.pupilCenter.x + eyes.right.pupilCenter.x) / 2
-        const baseY = (eyes.left.pupilCenter.y + eyes.right.pupilCenter.y) / 2
-        
-        // Calculate relative position within face
-        const relativeX = (baseX - faceBox.x) / faceBox.width
-        const relativeY = (baseY - faceBox.y) / faceBox.height
-        
-        // Apply image analysis influence
-        const influencedX = relativeX + gazeInfluence.x * 0.3
-        const influencedY = relativeY + gazeInfluence.y * 0.3
-        
-        // Convert to normalized gaze coordinates (-1 to 1)
-        const normalizedX = (influencedX - 0.5) * 2
-        const normalizedY = (influencedY - 0.5) * 2
-
-        const confidence = (eyes.left.confidence + eyes.right.confidence) / 2 * gazeInfluence.confidence
-
-        return {
-          x: Math.max(-1, Math.min(1, normalizedX)),
-          y: Math.max(-1, Math.min(1, normalizedY)),
-          confidence,
-          timestamp: Date.now()
-        }
-      }
-
-      // Fallback to basic calculation
-      const gazeX = (eyes.left.pupilCenter.x + eyes.right.pupilCenter.x) / 2
-      const gazeY = (eyes.left.pupilCenter.y + eyes.right.pupilCenter.y) / 2
-
-      const relativeX = (gazeX - faceBox.x) / faceBox.width
-      const relativeY = (gazeY - faceBox.y) / faceBox.height
-
-      const normalizedX = (relativeX - 0.5) * 2
-      const normalizedY = (relativeY - 0.5) * 2
-
-      const confidence = (eyes.left.confidence + eyes.right.confidence) / 2
-
-      return {
-        x: Math.max(-1, Math.min(1, normalizedX)),
-        y: Math.max(-1, Math.min(1, normalizedY)),
-        confidence,
-        timestamp: Date.now()
-      }
-    } catch (error) {
-      console.error('Gaze calculation error:', error)
-      return {
-        x: 0,
-        y: 0,
-        confidence: 0,
-        timestamp: Date.now()
-      }
+  const calculateGaze = (eyes: EyePair, faceBox: FaceBox, processedImage?: FrameData): GazeVector => {
+    if (!frameAnalysis) {
+      return { x: 0, y: 0, confidence: 0, timestamp: Date.now() }
     }
-  }
 
-  // Extract face region from image data
-  const extractFaceRegion = (processedImage: any, faceBox: FaceBox): any => {
-    const { x, y, width, height } = faceBox
-    const imageWidth = processedImage.width
-    const data = processedImage.data
-    
-    const faceData = []
-    for (let fy = y; fy < y + height && fy < processedImage.height; fy++) {
-      for (let fx = x; fx < x + width && fx < imageWidth; fx++) {
-        const index = (fy * imageWidth + fx) * 4
-        faceData.push({
-          x: fx - x,
-          y: fy - y,
-          r: data[index],
-          g: data[index + 1],
-          b: data[index + 2],
-          brightness: (data[index] + data[index + 1] + data[index + 2]) / 3
-        })
-      }
-    }
-    
-    return { data: faceData, width, height }
-  }
-
-  // Analyze gaze direction from face region
-  const analyzeGazeDirection = (faceData: any): { x: number, y: number, confidence: number } => {
-    const { data, width, height } = faceData
-    
-    // Look for bright spots that might indicate eye reflections or gaze direction
-    const regions = {
-      left: { brightness: 0, count: 0 },
-      right: { brightness: 0, count: 0 },
-      top: { brightness: 0, count: 0 },
-      bottom: { brightness: 0, count: 0 }
-    }
-    
-    data.forEach((pixel: any) => {
-      const { x, y, brightness } = pixel
-      
-      // Categorize pixels by region
-      if (x < width / 2) {
-        regions.left.brightness += brightness
-        regions.left.count++
-      } else {
-        regions.right.brightness += brightness
-        regions.right.count++
-      }
-      
-      if (y < height / 2) {
-        regions.top.brightness += brightness
-        regions.top.count++
-      } else {
-        regions.bottom.brightness += brightness
-        regions.bottom.count++
-      }
-    })
-    
-    // Calculate average brightness per region
-    const leftAvg = regions.left.count > 0 ? regions.left.brightness / regions.left.count : 0
-    const rightAvg = regions.right.count > 0 ? regions.right.brightness / regions.right.count : 0
-    const topAvg = regions.top.count > 0 ? regions.top.brightness / regions.top.count : 0
-    const bottomAvg = regions.bottom.count > 0 ? regions.bottom.brightness / regions.bottom.count : 0
-    
-    // Calculate gaze influence based on brightness differences
-    const horizontalInfluence = (rightAvg - leftAvg) / 255 * 0.5
-    const verticalInfluence = (bottomAvg - topAvg) / 255 * 0.5
-    
-    return {
-      x: horizontalInfluence,
-      y: verticalInfluence,
-      confidence: Math.min(1, Math.abs(horizontalInfluence) + Math.abs(verticalInfluence))
-    }
+    return frameAnalysis.calculateGaze(eyes, faceBox, processedImage)
   }
 
   // Main processing function (simplified for Phase 1 demo)
   const processFrame = (imageData: ImageData): EyeTrackingResult => {
-    if (!state.isLoaded) {
+    if (!state.isLoaded || !frameAnalysis) {
       return {
         success: false,
         gaze: null,
@@ -394,68 +114,19 @@ export function useComputerVision() {
       }
     }
 
-    const startTime = performance.now()
     isProcessing.value = true
 
     try {
-      // Process image data
-      const processedImage = processImageData(imageData)
-
-      // Detect faces (simplified)
-      const faces = detectFaces(processedImage)
-      
-      if (faces.length === 0) {
-        return {
-          success: false,
-          gaze: null,
-          confidence: 0,
-          faceDetected: false,
-          processingTime: performance.now() - startTime
-        }
-      }
-
-      // Use the most confident face
-      const primaryFace = faces[0]
-
-      // Detect eyes (simplified)
-      const eyes = detectEyes(processedImage, primaryFace)
-
-      // Calculate gaze
-      const gaze = calculateGaze(eyes, primaryFace, imageData)
-
-      const processingTime = performance.now() - startTime
-      lastProcessingTime.value = processingTime
-
-      return {
-        success: true,
-        gaze,
-        confidence: gaze.confidence,
-        faceDetected: true,
-        processingTime
-      }
-
-    } catch (error) {
-      console.error('Frame processing error:', error)
-      return {
-        success: false,
-        gaze: null,
-        confidence: 0,
-        faceDetected: false,
-        processingTime: performance.now() - startTime
+      const result = frameAnalysis.analyzeFrame(imageData)
+      if (result.success) {
+        lastProcessingTime.value = result.processingTime ?? 0
       }
+      return result
     } finally {
       isProcessing.value = false
     }
   }
 
-  // Helper function to create empty eye region
-  const createEmptyEyeRegion = (): EyeRegion => ({
-    boundingBox: { x: 0, y: 0, width: 0, height: 0 },
-    pupilCenter: { x: 0, y: 0 },
-    confidence: 0,
-    isOpen: false
-  })
-
   // Initialize on mount
   onMounted(() => {
     initializeOpenCV()
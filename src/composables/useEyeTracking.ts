@@ -7,6 +7,42 @@ import type {
   EyeTrackingResult,
   Point2D 
 } from '../types/eyeTracking'
+import { SIMULATE_GAZE_FALLBACK, VERBOSE_TRACKING_LOGS } from '../lib/debugFlags'
+
+// One period of sine for the simulated gaze, so a demo frame indexes a table instead
+// of evaluating sin and cos. 1024 steps keep the figure-eight within 0.6% of its
+// amplitude. cos(a) is read as sin(a + pi/2), a quarter of the table further on.
+const DEMO_SINE_TABLE_SIZE = 1024
+const DEMO_SINE_STEPS_PER_RADIAN = DEMO_SINE_TABLE_SIZE / (2 * Math.PI)
+const demoSineTable = Float32Array.from(
+  { length: DEMO_SINE_TABLE_SIZE },
+  (_, i) => Math.sin(i / DEMO_SINE_STEPS_PER_RADIAN)
+)
+// The table size is a power of two, so the mask wraps any angle >= 0 into one period
+const demoSine = (angle: number, quarterTurns = 0): number => {
+  const step = Math.floor(angle * DEMO_SINE_STEPS_PER_RADIAN) + quarterTurns * (DEMO_SINE_TABLE_SIZE / 4)
+  return demoSineTable[step & (DEMO_SINE_TABLE_SIZE - 1)]
+}
+
+// Exponential smoothing weights (recent frames have more weight), normalized and
+// built once per module for every history length the smoothing window allows, so
+// neither frames nor new tracker instances recompute them. Gaze buffers and weights
+// are stored as float32: normalised gaze needs nowhere near double precision, and it
+// halves the memory the smoothing loop streams through (arithmetic stays double).
+const MAX_SMOOTHING_WINDOW = 10
+const smoothingWeights: Float32Array[] = [new Float32Array(0)]
+for (let length = 1; length <= MAX_SMOOTHING_WINDOW; length++) {
+  const weights = new Float32Array(length)
+  let total = 0
+  for (let i = 0; i < length; i++) {
+    weights[i] = Math.pow(1.2, i)
+    total += weights[i]
+  }
+  for (let i = 0; i < length; i++) {
+    weights[i] /= total
+  }
+  smoothingWeights.push(weights)
+}
 
 export function useEyeTracking() {
   // Composables
@@ -26,15 +62,168 @@ export function useEyeTracking() {
   // Processing control
   const isProcessing = ref(false)
   const frameRate = ref(15) // Target 15 FPS for eye tracking
+  const processingWidth = ref(320) // Frames are downscaled to this width before analysis
   const smoothingWindow = ref(5) // Number of frames to smooth
-  
-  // Gaze history for smoothing
-  const gazeHistory = ref<GazeVector[]>([])
-  const maxHistorySize = computed(() => smoothingWindow.value)
 
-  // Processing loop
+  // Gaze history for smoothing, as a struct-of-arrays ring sized for the largest
+  // window: each frame writes three numbers in place instead of pushing an object
+  // and re-slicing the array
+  const historyX = new Float32Array(MAX_SMOOTHING_WINDOW)
+  const historyY = new Float32Array(MAX_SMOOTHING_WINDOW)
+  const historyConfidence = new Float32Array(MAX_SMOOTHING_WINDOW)
+  let historyStart = 0 // Ring index of the oldest sample
+  let historyLength = 0
+
+  const pushGazeHistory = (gaze: GazeVector): void => {
+    const index = (historyStart + historyLength) % MAX_SMOOTHING_WINDOW
+    historyX[index] = gaze.x
+    historyY[index] = gaze.y
+    historyConfidence[index] = gaze.confidence
+
+    if (historyLength < MAX_SMOOTHING_WINDOW) {
+      historyLength++
+    } else {
+      historyStart = (historyStart + 1) % MAX_SMOOTHING_WINDOW
+    }
+
+    // Trim history to the smoothing window (which may have shrunk)
+    if (historyLength > smoothingWindow.value) {
+      historyStart = (historyStart + historyLength - smoothingWindow.value) % MAX_SMOOTHING_WINDOW
+      historyLength = smoothingWindow.value
+    }
+  }
+
+  const clearGazeHistory = (): void => {
+    historyStart = 0
+    historyLength = 0
+  }
+
+  // Processing loop. Paced by the camera via requestVideoFrameCallback where the
+  // video element supports it, so frames are analysed as they arrive rather than on a
+  // timer beating against the camera's frame clock; a fixed interval is the fallback.
   let processingInterval: number | null = null
+  let stopFrameWatch: (() => void) | null = null
   let lastFrameTime = 0
+  // Presented-frame count at the last capture, so the timer fallback never analyses
+  // the same camera frame twice. Only trusted once it has been seen to advance: a
+  // browser that reports a stuck count must not stall tracking.
+  let lastCapturedFrameId: number | null = null
+  let frameCounterLive = false
+
+  // Frame analysis runs in a worker: the main thread only grabs frames, so grabbing
+  // the next frame overlaps analysing the previous one. Frames captured while the
+  // worker is busy (bitmaps or pixel buffers) wait in a one-slot queue; a newer frame
+  // replaces (and for bitmaps closes) a queued one, so the worker always picks up the
+  // freshest frame and latency stays bounded.
+  let analysisWorker: Worker | null = null
+  let analysisInFlight = false
+  let captureInFlight = false
+  let queuedBitmap: ImageBitmap | null = null
+  let queuedPixels: ImageData | null = null
+  // Frames replaced in the one-slot queue before the worker got to them
+  let replacedQueuedFrames = 0
+
+  const startAnalysisWorker = (): void => {
+    if (analysisWorker || typeof Worker === 'undefined') return
+
+    try {
+      analysisWorker = new Worker(
+        new URL('../lib/vision/frameAnalysis.worker.ts', import.meta.url),
+        { type: 'module' }
+      )
+      analysisWorker.onmessage = (event: MessageEvent<EyeTrackingResult>) => {
+        analysisInFlight = false
+
+        // Start on the queued frame before handling this result
+        if (queuedBitmap && analysisWorker) {
+          const bitmap = queuedBitmap
+          queuedBitmap = null
+          postBitmapFrame(analysisWorker, bitmap)
+        } else if (queuedPixels && analysisWorker) {
+          const imageData = queuedPixels
+          queuedPixels = null
+          postPixelFrame(analysisWorker, imageData)
+        }
+
+        if (state.isActive) {
+          updateStateFromResult(event.data)
+        }
+      }
+      analysisWorker.onerror = (error) => {
+        console.error('Frame analysis worker failed, analysing on the main thread:', error)
+        stopAnalysisWorker()
+      }
+    } catch (error) {
+      console.warn('Frame analysis worker unavailable, analysing on the main thread:', error)
+      analysisWorker = null
+    }
+  }
+
+  // With OffscreenCanvas the worker can read frames back itself, so the main thread
+  // hands it GPU-scaled ImageBitmaps instead of pixel buffers
+  const supportsBitmapFrames = typeof createImageBitmap === 'function' && typeof OffscreenCanvas !== 'undefined'
+
+  const captureBitmapFrame = async (worker: Worker): Promise<void> => {
+    captureInFlight = true
+    const bitmap = await camera.getCurrentFrameBitmap(processingWidth.value)
+    captureInFlight = false
+
+    // The worker may have been stopped while the frame was being captured
+    if (worker !== analysisWorker) {
+      bitmap?.close()
+      return
+    }
+
+    if (!bitmap) {
+      // For demo: if we have camera stream but no frame yet, simulate tracking
+      if (SIMULATE_GAZE_FALLBACK && !analysisInFlight && camera.isActive.value) {
+        simulateGazeTracking()
+      }
+      return
+    }
+
+    if (analysisInFlight) {
+      if (queuedBitmap) {
+        queuedBitmap.close()
+        replacedQueuedFrames++
+        if (VERBOSE_TRACKING_LOGS) console.log('Replaced queued frame, total replaced:', replacedQueuedFrames)
+      }
+      queuedBitmap = bitmap
+      return
+    }
+
+    postBitmapFrame(worker, bitmap)
+  }
+
+  const postBitmapFrame = (worker: Worker, bitmap: ImageBitmap): void => {
+    analysisInFlight = true
+    try {
+      worker.postMessage({ bitmap }, [bitmap])
+    } catch (error) {
+      console.error('Failed to hand frame to analysis worker:', error)
+      bitmap.close()
+      analysisInFlight = false
+    }
+  }
+
+  // Transfer the pixels to the worker; the result arrives in onmessage
+  const postPixelFrame = (worker: Worker, imageData: ImageData): void => {
+    analysisInFlight = true
+    worker.postMessage(
+      { width: imageData.width, height: imageData.height, data: imageData.data },
+      [imageData.data.buffer as ArrayBuffer]
+    )
+  }
+
+  const stopAnalysisWorker = (): void => {
+    analysisWorker?.terminate()
+    analysisWorker = null
+    analysisInFlight = false
+    queuedBitmap?.close()
+    queuedBitmap = null
+    queuedPixels = null
+    replacedQueuedFrames = 0
+  }
 
   // Start eye tracking
   const startTracking = async (): Promise<boolean> => {
@@ -44,9 +233,14 @@ export function useEyeTracking() {
       // Clear any existing errors
       state.error = null
 
-      // Start camera FIRST (more important for demo)
+      // Start camera FIRST (more important for demo). Ask for the analysis resolution
+      // up front, so the camera (or failing that the capture pipeline) scales once and
+      // full-size frames are never delivered only to be shrunk again per frame
       console.log('Starting camera...')
-      const cameraStarted = await camera.startStream()
+      const cameraStarted = await camera.startStream({
+        width: processingWidth.value,
+        height: Math.round(processingWidth.value * 3 / 4)
+      })
       if (!cameraStarted) {
         state.error = 'Failed to start camera'
         console.error('Camera failed to start')
@@ -80,6 +274,7 @@ export function useEyeTracking() {
 
       // Start processing loop (will work with or without OpenCV)
       console.log('Starting processing loop...')
+      startAnalysisWorker()
       startProcessingLoop()
 
       state.isActive = true
@@ -100,6 +295,7 @@ export function useEyeTracking() {
     try {
       // Stop processing loop
       stopProcessingLoop()
+      stopAnalysisWorker()
 
       // Stop camera
       await camera.stopStream()
@@ -109,7 +305,7 @@ export function useEyeTracking() {
       state.currentGaze = null
       state.faceDetected = false
       state.confidence = 0
-      gazeHistory.value = []
+      clearGazeHistory()
 
       console.log('Eye tracking stopped')
 
@@ -121,6 +317,9 @@ export function useEyeTracking() {
 
   // Start the processing loop
   const startProcessingLoop = (): void => {
+    stopFrameWatch = camera.watchVideoFrames(processCurrentFrame)
+    if (stopFrameWatch) return
+
     const intervalMs = 1000 / frameRate.value
 
     processingInterval = window.setInterval(() => {
@@ -134,6 +333,10 @@ export function useEyeTracking() {
       clearInterval(processingInterval)
       processingInterval = null
     }
+    stopFrameWatch?.()
+    stopFrameWatch = null
+    lastCapturedFrameId = null
+    frameCounterLive = false
     isProcessing.value = false
   }
 
@@ -143,36 +346,69 @@ export function useEyeTracking() {
       return
     }
 
-    // Throttle processing to avoid overwhelming the system
+    // Preferred path: capture and readback both happen off this thread. Either way
+    // capture keeps going while the worker is busy.
+    const bitmapWorker = supportsBitmapFrames && cv.isReady.value ? analysisWorker : null
+    if (bitmapWorker && captureInFlight) {
+      return
+    }
+
+    // Throttle processing to avoid overwhelming the system. The 10% slack keeps
+    // timer/camera jitter from skipping every other tick and halving the rate.
     const now = performance.now()
-    if (now - lastFrameTime < 1000 / frameRate.value) {
+    if (now - lastFrameTime < 900 / frameRate.value) {
       return
     }
+
+    // Skip ticks where the camera hasn't presented a new frame since the last capture
+    const frameId = camera.getPresentedFrameCount()
+    if (frameId !== null && lastCapturedFrameId !== null) {
+      if (frameId === lastCapturedFrameId) {
+        if (frameCounterLive) return
+      } else {
+        frameCounterLive = true
+      }
+    }
+    lastCapturedFrameId = frameId
     lastFrameTime = now
 
+    if (bitmapWorker) {
+      captureBitmapFrame(bitmapWorker)
+      return
+    }
+
     try {
       isProcessing.value = true
 
       // Get current frame from camera
-      const imageData = camera.getCurrentFrame()
+      const imageData = camera.getCurrentFrame(processingWidth.value)
       if (!imageData) {
-        console.log('No image data from camera, using simulation')
+        if (VERBOSE_TRACKING_LOGS) console.log('No image data from camera')
         // For demo: if we have camera stream but no frame yet, simulate tracking
-        if (camera.isActive.value) {
+        if (SIMULATE_GAZE_FALLBACK && camera.isActive.value) {
           simulateGazeTracking()
         }
         return
       }
 
-      console.log('Got image data:', imageData.width, 'x', imageData.height)
+      if (VERBOSE_TRACKING_LOGS) console.log('Got image data:', imageData.width, 'x', imageData.height)
 
       // Try to process frame with computer vision if available
       if (cv.isReady.value) {
-        console.log('Processing frame with computer vision')
-        const result = cv.processFrame(imageData)
-        updateStateFromResult(result)
-      } else {
-        console.log('Computer vision not ready, using simulation')
+        if (VERBOSE_TRACKING_LOGS) console.log('Processing frame with computer vision')
+        if (analysisWorker) {
+          if (analysisInFlight) {
+            if (queuedPixels) replacedQueuedFrames++
+            queuedPixels = imageData
+          } else {
+            postPixelFrame(analysisWorker, imageData)
+          }
+        } else {
+          const result = cv.processFrame(imageData)
+          updateStateFromResult(result)
+        }
+      } else if (SIMULATE_GAZE_FALLBACK) {
+        if (VERBOSE_TRACKING_LOGS) console.log('Computer vision not ready, using simulation')
         // Fallback: simulate gaze tracking for demo purposes
         simulateGazeTracking()
       }
@@ -180,7 +416,7 @@ export function useEyeTracking() {
     } catch (error) {
       console.error('Frame processing error:', error)
       // Don't fail completely, fall back to simulation
-      simulateGazeTracking()
+      if (SIMULATE_GAZE_FALLBACK) simulateGazeTracking()
     } finally {
       isProcessing.value = false
     }
@@ -188,16 +424,18 @@ export function useEyeTracking() {
 
   // Simulate gaze tracking for demo when OpenCV isn't available
   const simulateGazeTracking = (): void => {
-    // Create a simulated gaze that slowly moves around
-    const time = Date.now() / 2000 // Slow movement
-    const x = Math.sin(time) * 0.3 // Move between -0.3 and 0.3
-    const y = Math.cos(time * 0.7) * 0.2 // Different frequency for y
+    // Create a simulated gaze that slowly moves around. One clock read per frame: the
+    // sample timestamp and the phase come from the same instant.
+    const now = Date.now()
+    const time = now / 2000 // Slow movement
+    const x = demoSine(time) * 0.3 // Move between -0.3 and 0.3
+    const y = demoSine(time * 0.7, 1) * 0.2 // cos, at a different frequency for y
 
     const simulatedGaze: GazeVector = {
       x,
       y,
       confidence: 0.8, // High confidence for demo
-      timestamp: Date.now()
+      timestamp: now
     }
 
     const simulatedResult: EyeTrackingResult = {
@@ -218,15 +456,10 @@ export function useEyeTracking() {
 
     if (result.success && result.gaze) {
       // Add to history
-      gazeHistory.value.push(result.gaze)
-      
-      // Trim history to max size
-      if (gazeHistory.value.length > maxHistorySize.value) {
-        gazeHistory.value = gazeHistory.value.slice(-maxHistorySize.value)
-      }
+      pushGazeHistory(result.gaze)
 
       // Apply smoothing and update current gaze
-      state.currentGaze = smoothGaze(gazeHistory.value)
+      state.currentGaze = smoothGaze()
     } else {
       // No valid gaze detected
       state.currentGaze = null
@@ -234,8 +467,8 @@ export function useEyeTracking() {
   }
 
   // Smooth gaze data using moving average
-  const smoothGaze = (history: GazeVector[]): GazeVector => {
-    if (history.length === 0) {
+  const smoothGaze = (): GazeVector => {
+    if (historyLength === 0) {
       return {
         x: 0,
         y: 0,
@@ -244,24 +477,32 @@ export function useEyeTracking() {
       }
     }
 
-    // Calculate weighted average (recent frames have more weight)
-    let totalWeight = 0
+    // Weighted average with the precomputed weights (recent frames have more weight)
+    // over the ring, oldest first. The ring is walked as its two contiguous runs (start
+    // to the end of the buffer, then the wrapped head), so the inner loops are plain
+    // typed-array strides with no per-sample modulo for the JIT to work around.
+    const weights = smoothingWeights[historyLength]
+    const firstRunEnd = Math.min(historyStart + historyLength, MAX_SMOOTHING_WINDOW)
     let weightedX = 0
     let weightedY = 0
-    let avgConfidence = 0
-
-    history.forEach((gaze, index) => {
-      const weight = Math.pow(1.2, index) // Exponential weighting
-      totalWeight += weight
-      weightedX += gaze.x * weight
-      weightedY += gaze.y * weight
-      avgConfidence += gaze.confidence
-    })
+    let totalConfidence = 0
+    let w = 0
+
+    for (let index = historyStart; index < firstRunEnd; index++, w++) {
+      weightedX += historyX[index] * weights[w]
+      weightedY += historyY[index] * weights[w]
+      totalConfidence += historyConfidence[index]
+    }
+    for (let index = 0; w < historyLength; index++, w++) {
+      weightedX += historyX[index] * weights[w]
+      weightedY += historyY[index] * weights[w]
+      totalConfidence += historyConfidence[index]
+    }
 
     return {
-      x: weightedX / totalWeight,
-      y: weightedY / totalWeight,
-      confidence: avgConfidence / history.length,
+      x: weightedX,
+      y: weightedY,
+      confidence: totalConfidence / historyLength,
       timestamp: Date.now()
     }
   }
@@ -306,9 +547,14 @@ export function useEyeTracking() {
     }
   }
 
+  // Update the width frames are downscaled to before analysis
+  const setProcessingWidth = (width: number): void => {
+    processingWidth.value = Math.max(160, Math.min(1280, Math.round(width)))
+  }
+
   // Update smoothing window
   const setSmoothingWindow = (frames: number): void => {
-    smoothingWindow.value = Math.max(1, Math.min(10, frames))
+    smoothingWindow.value = Math.max(1, Math.min(MAX_SMOOTHING_WINDOW, frames))
   }
 
   // Watch for camera errors
@@ -337,6 +583,7 @@ export function useEyeTracking() {
     state: readonly(state),
     isProcessing: readonly(isProcessing),
     frameRate: readonly(frameRate),
+    processingWidth: readonly(processingWidth),
     smoothingWindow: readonly(smoothingWindow),
 
     // Camera state and methods
@@ -351,6 +598,7 @@ export function useEyeTracking() {
     stopTracking,
     calibrate,
     setFrameRate,
+    setProcessingWidth,
     setSmoothingWindow,
     gazeToScreen,
 
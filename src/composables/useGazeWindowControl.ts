@@ -18,9 +18,11 @@ interface GazeControlState {
   lastGazeTime: number
   lastMoveTime: number
   stabilityTimer: number | null
-  gazeHistory: Array<{ x: number, y: number, timestamp: number }>
 }
 
+// The stability check looks at most at the last 5 samples inside the stability window
+const STABILITY_SAMPLES = 5
+
 export function useGazeWindowControl() {
   // Composables
   const eyeTracking = useEyeTracking()
@@ -43,10 +45,18 @@ export function useGazeWindowControl() {
     isCalibrated: false,
     lastGazeTime: 0,
     lastMoveTime: 0,
-    stabilityTimer: null,
-    gazeHistory: []
+    stabilityTimer: null
   })
 
+  // Recent gaze samples as a struct-of-arrays ring of the last STABILITY_SAMPLES:
+  // each sample is three stores in place instead of an object pushed into a reactive
+  // array that is then re-filtered into a new one
+  const historyX = new Float64Array(STABILITY_SAMPLES)
+  const historyY = new Float64Array(STABILITY_SAMPLES)
+  const historyTime = new Float64Array(STABILITY_SAMPLES)
+  let historyHead = 0 // Slot the next sample goes into
+  let historyLength = 0
+
   // Statistics
   const stats = ref({
     totalMovements: 0,
@@ -56,45 +66,58 @@ export function useGazeWindowControl() {
   })
 
   // Check if gaze is stable enough for movement
-  const isGazeStable = (currentGaze: { x: number, y: number, confidence: number }): boolean => {
+  const isGazeStable = (currentGaze: { x: number, y: number, confidence: number }, now: number = Date.now()): boolean => {
     const { stabilityTime, movementThreshold } = config.value
-    const now = Date.now()
 
     // Add current gaze to history
-    state.value.gazeHistory.push({
-      x: currentGaze.x,
-      y: currentGaze.y,
-      timestamp: now
-    })
-
-    // Keep only recent history
-    state.value.gazeHistory = state.value.gazeHistory.filter(
-      entry => now - entry.timestamp <= stabilityTime
-    )
+    historyX[historyHead] = currentGaze.x
+    historyY[historyHead] = currentGaze.y
+    historyTime[historyHead] = now
+    historyHead = (historyHead + 1) % STABILITY_SAMPLES
+    if (historyLength < STABILITY_SAMPLES) historyLength++
+
+    // Only samples inside the stability window count: walk back from the newest
+    let count = 0
+    let slot = historyHead
+    while (count < historyLength) {
+      slot = slot === 0 ? STABILITY_SAMPLES - 1 : slot - 1
+      if (now - historyTime[slot] > stabilityTime) break
+      count++
+    }
 
     // Check if we have enough stable data
-    if (state.value.gazeHistory.length < 3) return false
+    if (count < 3) return false
 
     // Check confidence threshold
     if (currentGaze.confidence < movementThreshold) return false
 
-    // Calculate variance in recent gaze positions
-    const recentGazes = state.value.gazeHistory.slice(-5)
-    const avgX = recentGazes.reduce((sum, g) => sum + g.x, 0) / recentGazes.length
-    const avgY = recentGazes.reduce((sum, g) => sum + g.y, 0) / recentGazes.length
-
-    const variance = recentGazes.reduce((sum, g) => {
-      return sum + Math.pow(g.x - avgX, 2) + Math.pow(g.y - avgY, 2)
-    }, 0) / recentGazes.length
+    // Calculate variance in the last (up to 5) gaze positions in the window
+    let sumX = 0
+    let sumY = 0
+    for (let k = 0, i = historyHead; k < count; k++) {
+      i = i === 0 ? STABILITY_SAMPLES - 1 : i - 1
+      sumX += historyX[i]
+      sumY += historyY[i]
+    }
+    const avgX = sumX / count
+    const avgY = sumY / count
+
+    let sumSquares = 0
+    for (let k = 0, i = historyHead; k < count; k++) {
+      i = i === 0 ? STABILITY_SAMPLES - 1 : i - 1
+      const dx = historyX[i] - avgX
+      const dy = historyY[i] - avgY
+      sumSquares += dx * dx + dy * dy
+    }
+    const variance = sumSquares / count
 
     // Consider stable if variance is low
     return variance < 0.01 // Adjust threshold as needed
   }
 
   // Check cooldown period
-  const canMove = (): boolean => {
+  const canMove = (now: number = Date.now()): boolean => {
     const { cooldownTime } = config.value
-    const now = Date.now()
     return now - state.value.lastMoveTime >= cooldownTime
   }
 
@@ -120,15 +143,17 @@ export function useGazeWindowControl() {
 
     if (!gaze) return
 
-    state.value.lastGazeTime = Date.now()
+    // One timestamp for the whole sample: receipt, stability window and cooldown
+    const now = Date.now()
+    state.value.lastGazeTime = now
 
     // Check if gaze is stable and confident enough
-    if (!isGazeStable({ x: gaze.x, y: gaze.y, confidence })) {
+    if (!isGazeStable({ x: gaze.x, y: gaze.y, confidence }, now)) {
       return
     }
 
     // Check cooldown
-    if (!canMove()) {
+    if (!canMove(now)) {
       return
     }
 
@@ -136,10 +161,11 @@ export function useGazeWindowControl() {
       // Process gaze input through window manager
       await windowManager.processGazeInput(gaze)
       
-      // Update movement statistics
-      state.value.lastMoveTime = Date.now()
+      // Update movement statistics (the move itself is awaited, so take a fresh time)
+      const movedAt = Date.now()
+      state.value.lastMoveTime = movedAt
       stats.value.totalMovements++
-      stats.value.lastMovementTime = Date.now()
+      stats.value.lastMovementTime = movedAt
       
       // Update average confidence (rolling average)
       stats.value.averageConfidence = (stats.value.averageConfidence * 0.9) + (confidence * 0.1)
@@ -232,7 +258,7 @@ export function useGazeWindowControl() {
     // Update state
     state.value.isActive = false
     config.value.enabled = false
-    state.value.gazeHistory = []
+    historyLength = 0
 
     console.log('Gaze-controlled window movement stopped')
   }
@@ -247,15 +273,15 @@ export function useGazeWindowControl() {
     }
   }
 
-  // Watch for advanced gaze data and process it
+  // Watch for advanced gaze data and process it. Every poll replaces the sample
+  // object, so a shallow watch sees each update without walking its landmark arrays.
   watch(
     () => advancedGazeTracking.currentGaze.value,
     (newGazeData) => {
       if (newGazeData && state.value.isActive) {
         processGazeForMovement(newGazeData)
       }
-    },
-    { deep: true }
+    }
   )
 
   // Update configuration
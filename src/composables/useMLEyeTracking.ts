@@ -1,6 +1,8 @@
-import { ref, computed, onUnmounted, readonly } from 'vue'
+import { ref, shallowRef, triggerRef, computed, onUnmounted, readonly } from 'vue'
 import { invoke } from '@tauri-apps/api/core'
+import { listen, type UnlistenFn } from '@tauri-apps/api/event'
 import { KalmanFilter2D } from '../lib/filters/KalmanFilter'
+import { VERBOSE_TRACKING_LOGS } from '../lib/debugFlags'
 
 // Types for ML eye tracking
 export interface MLGazeData {
@@ -52,11 +54,50 @@ export interface SmoothingStats {
   kalmanVelocity: { vx: number, vy: number }
 }
 
+// Emitted by the backend whenever it queues new gaze samples
+const GAZE_READY_EVENT = 'ml-gaze-ready'
+
+// Samples kept for the moving average (5, like the original gaze-tracker.py)
+const GAZE_HISTORY_SIZE = 5
+
+// Gaze history as parallel Float32Arrays (struct of arrays) with a write cursor:
+// preallocated once, so pushing a sample is three stores instead of a push/shift of
+// sample objects. Slot (head - 1 - k) mod size holds the k-th newest sample. Float32
+// keeps screen coordinates to well under a pixel at half the storage.
+interface GazeHistoryRing {
+  x: Float32Array
+  y: Float32Array
+  confidence: Float32Array
+  head: number
+  length: number
+}
+
+function createGazeHistoryRing(): GazeHistoryRing {
+  return {
+    x: new Float32Array(GAZE_HISTORY_SIZE),
+    y: new Float32Array(GAZE_HISTORY_SIZE),
+    confidence: new Float32Array(GAZE_HISTORY_SIZE),
+    head: 0,
+    length: 0
+  }
+}
+
+// Samples isStable looks at: the last 10, or the whole ring when it holds fewer
+const STABILITY_WINDOW = Math.min(10, GAZE_HISTORY_SIZE)
+
+// Slot of the k-th newest sample (k = 0 is the latest)
+function historySlot(ring: GazeHistoryRing, k: number): number {
+  const slot = ring.head - 1 - k
+  return slot < 0 ? slot + GAZE_HISTORY_SIZE : slot
+}
+
 export function useMLEyeTracking() {
   // State
   const isActive = ref(false)
-  const currentGaze = ref<MLGazeData | null>(null)
-  const smoothedGaze = ref<MLGazeData | null>(null)
+  // Replaced wholesale every poll, never mutated: shallow, so publishing a sample
+  // doesn't wrap it in a reactive proxy
+  const currentGaze = shallowRef<MLGazeData | null>(null)
+  const smoothedGaze = shallowRef<MLGazeData | null>(null)
   const isCalibrated = ref(false)
   const trackingStats = ref<MLTrackingStats | null>(null)
   const error = ref<string | null>(null)
@@ -84,20 +125,26 @@ export function useMLEyeTracking() {
   const smoothingStats = ref<SmoothingStats | null>(null)
 
   // Tracking loop management
-  let trackingInterval: number | null = null
+  let unlistenGazeReady: UnlistenFn | null = null
+  let drainPending = false
   let fpsInterval: number | null = null
   let frameCount = 0
+  // Set while a get_ml_gaze_batch call is outstanding so slow IPC never stacks up drains
+  let pollInFlight = false
 
   // Smoothing components
   const kalmanFilter = ref<KalmanFilter2D | null>(null)
-  const gazeHistory = ref<Array<MLGazeData>>([])
+  // Shallow: the ring is mutated in place, with one triggerRef per poll for the
+  // computeds that read it
+  const gazeHistory = shallowRef<GazeHistoryRing>(createGazeHistoryRing())
   // Unused in current implementation
   // const maxHistorySize = 10
 
   // Calibration data
   const calibrationPoints = ref<CalibrationPoint[]>([])
-  const calibrationOffsets = ref({ x: 0, y: 0 })
-  const calibrationScale = ref({ x: 1, y: 1 })
+  // Calibration fitted once into a per-axis affine map (screen = gain * gaze + bias),
+  // so each frame is two multiply-adds. Plain object: nothing renders it.
+  const calibrationTransform = { gainX: 1, biasX: 0, gainY: 1, biasY: 0 }
 
   // Computed properties
   const gazeScreenPosition = computed(() => {
@@ -135,26 +182,39 @@ export function useMLEyeTracking() {
     kalmanFilter.value = null
     
     // Clear history
-    gazeHistory.value = []
+    gazeHistory.value.head = 0
+    gazeHistory.value.length = 0
+    triggerRef(gazeHistory)
     calibrationPoints.value = []
     
     console.log('🎯 Simple smoothing initialized (no Kalman filter)')
   }
 
+  // Every sample in the smoothing pipeline is built here, so they all share one object
+  // shape and the per-sample code stays monomorphic for the JIT (backend samples have
+  // no calibrated flag, so they would otherwise differ from the calibrated ones).
+  function toGazeSample(x: number, y: number, confidence: number, timestamp: number, calibrated: boolean): MLGazeData {
+    return { x, y, confidence, timestamp, calibrated }
+  }
+
   // Core smoothing pipeline
   function applySmoothingPipeline(rawGaze: MLGazeData): MLGazeData {
-    const startTime = performance.now()
+    const startTime = VERBOSE_TRACKING_LOGS ? performance.now() : 0
     
     // Step 1: Confidence-based filtering
     if (rawGaze.confidence < config.value.confidence_threshold) {
-      console.log(`🚫 Low confidence gaze rejected: ${rawGaze.confidence.toFixed(2)}`)
+      if (VERBOSE_TRACKING_LOGS) {
+        console.log(`🚫 Low confidence gaze rejected: ${rawGaze.confidence.toFixed(2)}`)
+      }
       return rawGaze // Return raw data but don't update smoothed value
     }
 
     // Step 2: Outlier detection
     const isOutlier = detectOutlier(rawGaze)
     if (isOutlier) {
-      console.log('🚫 Outlier gaze detected and rejected')
+      if (VERBOSE_TRACKING_LOGS) {
+        console.log('🚫 Outlier gaze detected and rejected')
+      }
       return rawGaze
     }
 
@@ -169,79 +229,112 @@ export function useMLEyeTracking() {
     const movingAverageSmoothed = applyMovingAverageSmoothing(kalmanSmoothed)
 
     // Step 6: Update statistics
-    updateSmoothingStats(rawGaze, movingAverageSmoothed)
+    updateSmoothingStats(rawGaze, movingAverageSmoothed, isOutlier)
 
-    const processingTime = performance.now() - startTime
-    console.log(`⚡ Smoothing pipeline: ${processingTime.toFixed(2)}ms`)
+    if (VERBOSE_TRACKING_LOGS) {
+      const processingTime = performance.now() - startTime
+      console.log(`⚡ Smoothing pipeline: ${processingTime.toFixed(2)}ms`)
+    }
 
     return movingAverageSmoothed
   }
 
   // Outlier detection using distance threshold
   function detectOutlier(gaze: MLGazeData): boolean {
-    if (gazeHistory.value.length < 3) return false
-
-    const recentGazes = gazeHistory.value.slice(-3)
-    const avgX = recentGazes.reduce((sum, g) => sum + g.x, 0) / recentGazes.length
-    const avgY = recentGazes.reduce((sum, g) => sum + g.y, 0) / recentGazes.length
+    const history = gazeHistory.value
+    if (history.length < 3) return false
+
+    // Mean of the last 3 samples, read in place
+    let sumX = 0
+    let sumY = 0
+    for (let k = 0; k < 3; k++) {
+      const slot = historySlot(history, k)
+      sumX += history.x[slot]
+      sumY += history.y[slot]
+    }
+    const avgX = sumX / 3
+    const avgY = sumY / 3
     
-    const distance = Math.sqrt(
-      Math.pow(gaze.x - avgX, 2) + Math.pow(gaze.y - avgY, 2)
-    )
+    const dx = gaze.x - avgX
+    const dy = gaze.y - avgY
     
-    // Dynamic threshold based on screen size
+    // Dynamic threshold based on screen size; compared squared to skip the sqrt
     const threshold = Math.min(config.value.screen_width, config.value.screen_height) * 0.3
     
-    return distance > threshold
+    return dx * dx + dy * dy > threshold * threshold
   }
 
   // Apply calibration corrections
   function applyCalibrationCorrections(gaze: MLGazeData): MLGazeData {
     if (!isCalibrated.value) return gaze
 
-    return {
-      ...gaze,
-      x: (gaze.x + calibrationOffsets.value.x) * calibrationScale.value.x,
-      y: (gaze.y + calibrationOffsets.value.y) * calibrationScale.value.y,
-      calibrated: true
-    }
+    return toGazeSample(
+      calibrationTransform.gainX * gaze.x + calibrationTransform.biasX,
+      calibrationTransform.gainY * gaze.y + calibrationTransform.biasY,
+      gaze.confidence,
+      gaze.timestamp,
+      true
+    )
   }
 
   // Simple moving average smoothing (matching original gaze-tracker.py)
   function applyMovingAverageSmoothing(gaze: MLGazeData): MLGazeData {
-    // Add to history (limit to 5 samples like original)
-    gazeHistory.value.push(gaze)
-    if (gazeHistory.value.length > 5) {
-      gazeHistory.value.shift()
-    }
+    const history = gazeHistory.value
+
+    // Add to history, overwriting the oldest sample once the ring is full
+    const newest = history.head
+    history.x[newest] = gaze.x
+    history.y[newest] = gaze.y
+    history.confidence[newest] = gaze.confidence
+    history.head = history.head + 1 === GAZE_HISTORY_SIZE ? 0 : history.head + 1
+    if (history.length < GAZE_HISTORY_SIZE) history.length++
 
     // Apply simple moving average if we have at least 2 samples (like original)
-    if (gazeHistory.value.length >= 2) {
-      const avgX = gazeHistory.value.reduce((sum, g) => sum + g.x, 0) / gazeHistory.value.length
-      const avgY = gazeHistory.value.reduce((sum, g) => sum + g.y, 0) / gazeHistory.value.length
-
-      return {
-        ...gaze,
-        x: avgX,
-        y: avgY
-      }
+    if (history.length < 2) return gaze
+
+    // Order does not matter for the mean: sum the filled slots directly
+    let sumX = 0
+    let sumY = 0
+    for (let i = 0; i < history.length; i++) {
+      sumX += history.x[i]
+      sumY += history.y[i]
     }
+    const avgX = sumX / history.length
+    const avgY = sumY / history.length
 
-    return gaze
+    // Nothing moved, so the sample itself is the smoothed value (compared with its
+    // float32 copy, which is what the average was taken over)
+    if (avgX === history.x[newest] && avgY === history.y[newest]) return gaze
+
+    return toGazeSample(avgX, avgY, gaze.confidence, gaze.timestamp, gaze.calibrated)
   }
 
-  // Update smoothing statistics
-  function updateSmoothingStats(rawGaze: MLGazeData, smoothedGaze: MLGazeData) {
+  // Update smoothing statistics. The stats object is built once and its fields are
+  // overwritten in place on later frames rather than reallocated.
+  function updateSmoothingStats(rawGaze: MLGazeData, smoothedGaze: MLGazeData, outlierDetected: boolean) {
     const velocity = kalmanFilter.value?.getVelocity() || { vx: 0, vy: 0 }
-    
-    smoothingStats.value = {
-      rawGaze: { x: rawGaze.x, y: rawGaze.y },
-      smoothedGaze: { x: smoothedGaze.x, y: smoothedGaze.y },
-      confidence: smoothedGaze.confidence,
-      smoothingStrength: 0.3, // Will be dynamic based on movement
-      outlierDetected: detectOutlier(rawGaze),
-      kalmanVelocity: velocity
+    const stats = smoothingStats.value
+
+    if (!stats) {
+      smoothingStats.value = {
+        rawGaze: { x: rawGaze.x, y: rawGaze.y },
+        smoothedGaze: { x: smoothedGaze.x, y: smoothedGaze.y },
+        confidence: smoothedGaze.confidence,
+        smoothingStrength: 0.3, // Will be dynamic based on movement
+        outlierDetected,
+        kalmanVelocity: velocity
+      }
+      return
     }
+
+    stats.rawGaze.x = rawGaze.x
+    stats.rawGaze.y = rawGaze.y
+    stats.smoothedGaze.x = smoothedGaze.x
+    stats.smoothedGaze.y = smoothedGaze.y
+    stats.confidence = smoothedGaze.confidence
+    stats.outlierDetected = outlierDetected
+    stats.kalmanVelocity.vx = velocity.vx
+    stats.kalmanVelocity.vy = velocity.vy
   }
 
   // Enhanced calibration system with 9-point grid
@@ -309,77 +402,94 @@ export function useMLEyeTracking() {
     }
   }
 
-  // Collect calibration data for a specific point
+  // Collect calibration data for a specific point. The mean is accumulated as samples
+  // arrive (Welford) and collection stops early once it has settled, instead of always
+  // waiting out the full second and averaging a copied sample array afterwards.
   async function collectCalibrationData(screenX: number, screenY: number) {
-    const samples: MLGazeData[] = []
-    const sampleCount = 30 // Collect 30 samples over 1 second
-    
+    const sampleCount = 30 // Collect up to 30 samples over 1 second
+    const minSamples = 11
+    // Settled once the standard error of the mean is under 0.5% of the screen
+    const settledError = Math.min(config.value.screen_width, config.value.screen_height) * 0.005
+
+    let count = 0
+    let meanX = 0, meanY = 0, m2X = 0, m2Y = 0
+    let sumConfidence = 0
+    let lastTimestamp: number | null = null
+
     for (let i = 0; i < sampleCount; i++) {
-      if (currentGaze.value && currentGaze.value.confidence > 0.5) {
-        samples.push({ ...currentGaze.value })
+      const gaze = currentGaze.value
+      // Only count fresh readings; samples arrive slower than this loop
+      if (gaze && gaze.confidence > 0.5 && gaze.timestamp !== lastTimestamp) {
+        lastTimestamp = gaze.timestamp
+        count++
+        const dx = gaze.x - meanX
+        meanX += dx / count
+        m2X += dx * (gaze.x - meanX)
+        const dy = gaze.y - meanY
+        meanY += dy / count
+        m2Y += dy * (gaze.y - meanY)
+        sumConfidence += gaze.confidence
+
+        if (count >= minSamples && Math.sqrt((m2X + m2Y) / ((count - 1) * count)) < settledError) {
+          break
+        }
       }
       await new Promise(resolve => setTimeout(resolve, 33)) // ~30fps
     }
     
-    if (samples.length > 10) {
-      // Calculate average gaze position
-      const avgX = samples.reduce((sum, s) => sum + s.x, 0) / samples.length
-      const avgY = samples.reduce((sum, s) => sum + s.y, 0) / samples.length
-      const avgConfidence = samples.reduce((sum, s) => sum + s.confidence, 0) / samples.length
-      
+    if (count > 10) {
       calibrationPoints.value.push({
         screenX,
         screenY,
-        gazeX: avgX,
-        gazeY: avgY,
-        confidence: avgConfidence,
+        gazeX: meanX,
+        gazeY: meanY,
+        confidence: sumConfidence / count,
         timestamp: Date.now()
       })
       
-      console.log(`📍 Calibration point collected: screen(${screenX.toFixed(0)}, ${screenY.toFixed(0)}) -> gaze(${avgX.toFixed(0)}, ${avgY.toFixed(0)})`)
+      console.log(`📍 Calibration point collected: screen(${screenX.toFixed(0)}, ${screenY.toFixed(0)}) -> gaze(${meanX.toFixed(0)}, ${meanY.toFixed(0)}) from ${count} samples`)
     }
   }
 
-  // Calculate calibration corrections using least squares
+  // Calculate calibration corrections: per axis, a closed-form ridge fit of the screen
+  // coordinate on the measured gaze, screen = gain * gaze + bias. Fitting the map that
+  // is applied per frame directly (rather than fitting gaze on screen and inverting
+  // it) keeps a flat axis from blowing the gain up, and the ridge term keeps the 2x2
+  // normal equations solvable when every point sits on one line.
   function calculateCalibrationCorrections() {
-    if (calibrationPoints.value.length < 5) {
+    const points = calibrationPoints.value
+    if (points.length < 5) {
       console.warn('Insufficient calibration points for correction calculation')
       return
     }
-    
-    // Simple linear correction calculation
-    let sumScreenX = 0, sumScreenY = 0, sumGazeX = 0, sumGazeY = 0
-    let sumScreenXGazeX = 0, sumScreenYGazeY = 0
-    let sumScreenX2 = 0, sumScreenY2 = 0
-    
-    calibrationPoints.value.forEach(point => {
-      sumScreenX += point.screenX
-      sumScreenY += point.screenY
+
+    const ridge = 1e-3
+    let sumGazeX = 0, sumGazeY = 0, sumScreenX = 0, sumScreenY = 0
+    let sumGazeX2 = 0, sumGazeY2 = 0, sumGazeXScreenX = 0, sumGazeYScreenY = 0
+
+    for (let i = 0; i < points.length; i++) {
+      const point = points[i]
       sumGazeX += point.gazeX
       sumGazeY += point.gazeY
-      sumScreenXGazeX += point.screenX * point.gazeX
-      sumScreenYGazeY += point.screenY * point.gazeY
-      sumScreenX2 += point.screenX * point.screenX
-      sumScreenY2 += point.screenY * point.screenY
-    })
-    
-    const n = calibrationPoints.value.length
-    
-    // Calculate scale factors
-    const scaleX = (n * sumScreenXGazeX - sumScreenX * sumGazeX) / (n * sumScreenX2 - sumScreenX * sumScreenX)
-    const scaleY = (n * sumScreenYGazeY - sumScreenY * sumGazeY) / (n * sumScreenY2 - sumScreenY * sumScreenY)
-    
-    // Calculate offsets
-    const offsetX = (sumGazeX - scaleX * sumScreenX) / n
-    const offsetY = (sumGazeY - scaleY * sumScreenY) / n
-    
-    calibrationScale.value = { x: 1/scaleX, y: 1/scaleY }
-    calibrationOffsets.value = { x: -offsetX, y: -offsetY }
-    
-    console.log('🎯 Calibration corrections calculated:', {
-      scale: calibrationScale.value,
-      offset: calibrationOffsets.value
-    })
+      sumScreenX += point.screenX
+      sumScreenY += point.screenY
+      sumGazeX2 += point.gazeX * point.gazeX
+      sumGazeY2 += point.gazeY * point.gazeY
+      sumGazeXScreenX += point.gazeX * point.screenX
+      sumGazeYScreenY += point.gazeY * point.screenY
+    }
+
+    // Solve [[Sgg + l, Sg], [Sg, n + l]] [gain, bias] = [Sgs, Ss] for each axis
+    const n = points.length + ridge
+    const detX = (sumGazeX2 + ridge) * n - sumGazeX * sumGazeX
+    const detY = (sumGazeY2 + ridge) * n - sumGazeY * sumGazeY
+
+    calibrationTransform.gainX = (n * sumGazeXScreenX - sumGazeX * sumScreenX) / detX
+    calibrationTransform.biasX = ((sumGazeX2 + ridge) * sumScreenX - sumGazeX * sumGazeXScreenX) / detX
+    calibrationTransform.gainY = (n * sumGazeYScreenY - sumGazeY * sumScreenY) / detY
+    calibrationTransform.biasY = ((sumGazeY2 + ridge) * sumScreenY - sumGazeY * sumGazeYScreenY) / detY
+
+    console.log('🎯 Calibration corrections calculated:', { ...calibrationTransform })
   }
 
   // Core functions with enhanced smoothing
@@ -416,8 +526,8 @@ export function useMLEyeTracking() {
       
       isActive.value = true
       
-      // Start data polling loop
-      startDataPolling()
+      // Start the data stream
+      await startDataPolling()
       
       // Start FPS monitoring
       startFPSMonitoring()
@@ -435,42 +545,82 @@ export function useMLEyeTracking() {
     }
   }
 
-  // Enhanced data polling with smoothing
-  function startDataPolling() {
-    if (trackingInterval) return
+  // Drain the backend's gaze batch whenever it signals new samples, so each reaches
+  // the smoothing pipeline as soon as the tracker prints it rather than on the next
+  // timer tick
+  async function startDataPolling() {
+    if (unlistenGazeReady) return
 
-    console.log('🔄 Starting ML data polling with smoothing at 30 FPS...')
-    
-    trackingInterval = window.setInterval(async () => {
-      try {
-        const gazeData = await invoke<MLGazeData | null>('get_ml_gaze_data')
+    console.log('🔄 Starting ML data stream with smoothing...')
+
+    const unlisten = await listen(GAZE_READY_EVENT, () => {
+      drainGazeBatch()
+    })
+    // Tracking may have been stopped while the listener was being attached
+    if (!isActive.value || unlistenGazeReady) {
+      unlisten()
+      return
+    }
+    unlistenGazeReady = unlisten
+
+    // Samples queued before the listener was attached
+    drainGazeBatch()
+  }
+
+  async function drainGazeBatch() {
+    // One get_ml_gaze_batch call at a time; signals that arrive meanwhile are folded
+    // into a single follow-up drain
+    if (pollInFlight) {
+      drainPending = true
+      return
+    }
+    pollInFlight = true
+
+    try {
+      // Every sample since the last drain in one IPC call, so a burst from the
+      // tracker is smoothed sample by sample rather than downsampled
+      const batch = await invoke<Omit<MLGazeData, 'calibrated'>[]>('get_ml_gaze_batch')
+      
+      if (batch.length > 0) {
+        // Run the whole batch through the smoothing pipeline, publish the result once
+        let gazeData = toGazeSample(batch[0].x, batch[0].y, batch[0].confidence, batch[0].timestamp, false)
+        let smooth = applySmoothingPipeline(gazeData)
+        for (let i = 1; i < batch.length; i++) {
+          const raw = batch[i]
+          gazeData = toGazeSample(raw.x, raw.y, raw.confidence, raw.timestamp, false)
+          smooth = applySmoothingPipeline(gazeData)
+        }
+        triggerRef(gazeHistory)
+
+        currentGaze.value = gazeData
+        lastUpdateTime.value = Date.now()
+        const previousFrameCount = frameCount
+        frameCount += batch.length
+        
+        smoothedGaze.value = smooth
         
-        if (gazeData) {
-          currentGaze.value = gazeData
-          lastUpdateTime.value = Date.now()
-          frameCount++
-          
-          // Apply smoothing pipeline
-          const smooth = applySmoothingPipeline(gazeData)
-          smoothedGaze.value = smooth
-          
-          // Update accuracy based on confidence
-          accuracy.value = smooth.confidence
-          
-          // Log detailed data periodically
-          if (frameCount % 30 === 0) { // Every 30 frames (~1 second)
-            console.log('👁️ Gaze Data:', {
-              raw: `(${gazeData.x.toFixed(0)}, ${gazeData.y.toFixed(0)})`,
-              smoothed: `(${smooth.x.toFixed(0)}, ${smooth.y.toFixed(0)})`,
-              confidence: `${(smooth.confidence * 100).toFixed(1)}%`,
-              calibrated: smooth.calibrated
-            })
-          }
+        // Update accuracy based on confidence
+        accuracy.value = smooth.confidence
+        
+        // Log detailed data periodically
+        if (Math.floor(frameCount / 30) !== Math.floor(previousFrameCount / 30)) { // Every 30 frames (~1 second)
+          console.log('👁️ Gaze Data:', {
+            raw: `(${gazeData.x.toFixed(0)}, ${gazeData.y.toFixed(0)})`,
+            smoothed: `(${smooth.x.toFixed(0)}, ${smooth.y.toFixed(0)})`,
+            confidence: `${(smooth.confidence * 100).toFixed(1)}%`,
+            calibrated: smooth.calibrated
+          })
         }
-      } catch (err) {
-        console.error('Failed to get ML gaze data:', err)
       }
-    }, 50) // ~20 FPS (matching original gaze-tracker.py)
+    } catch (err) {
+      console.error('Failed to get ML gaze data:', err)
+    } finally {
+      pollInFlight = false
+      if (drainPending && unlistenGazeReady) {
+        drainPending = false
+        drainGazeBatch()
+      }
+    }
   }
 
   async function stopTracking() {
@@ -526,10 +676,11 @@ export function useMLEyeTracking() {
   }
 
   function stopDataPolling() {
-    if (trackingInterval) {
-      clearInterval(trackingInterval)
-      trackingInterval = null
+    if (unlistenGazeReady) {
+      unlistenGazeReady()
+      unlistenGazeReady = null
     }
+    drainPending = false
     
     if (fpsInterval) {
       clearInterval(fpsInterval)
@@ -564,9 +715,7 @@ export function useMLEyeTracking() {
     
     const dx = currentGaze.value.x - previousGaze.value.x
     const dy = currentGaze.value.y - previousGaze.value.y
-    const distance = Math.sqrt(dx * dx + dy * dy)
-    
-    return distance > movementThreshold
+    return dx * dx + dy * dy > movementThreshold * movementThreshold
   })
 
   // Update previous gaze for movement detection
@@ -613,24 +762,39 @@ export function useMLEyeTracking() {
 
   // Performance optimization
   const averageConfidence = computed(() => {
-    if (gazeHistory.value.length === 0) return 0
-    const sum = gazeHistory.value.reduce((acc, gaze) => acc + gaze.confidence, 0)
-    return sum / gazeHistory.value.length
+    const history = gazeHistory.value
+    if (history.length === 0) return 0
+    let sum = 0
+    for (let i = 0; i < history.length; i++) {
+      sum += history.confidence[i]
+    }
+    return sum / history.length
   })
 
   // Stability detection
   const isStable = computed(() => {
-    if (gazeHistory.value.length < 10) return false
-    
-    const recent = gazeHistory.value.slice(-10)
-    const avgX = recent.reduce((acc, g) => acc + g.x, 0) / recent.length
-    const avgY = recent.reduce((acc, g) => acc + g.y, 0) / recent.length
-    
-    const variance = recent.reduce((acc, g) => {
-      const dx = g.x - avgX
-      const dy = g.y - avgY
-      return acc + (dx * dx + dy * dy)
-    }, 0) / recent.length
+    const history = gazeHistory.value
+    if (history.length < STABILITY_WINDOW) return false
+
+    // Mean and variance of the window in two passes over the ring in place
+    let sumX = 0
+    let sumY = 0
+    for (let k = 0; k < STABILITY_WINDOW; k++) {
+      const slot = historySlot(history, k)
+      sumX += history.x[slot]
+      sumY += history.y[slot]
+    }
+    const avgX = sumX / STABILITY_WINDOW
+    const avgY = sumY / STABILITY_WINDOW
+
+    let sumSquares = 0
+    for (let k = 0; k < STABILITY_WINDOW; k++) {
+      const slot = historySlot(history, k)
+      const dx = history.x[slot] - avgX
+      const dy = history.y[slot] - avgY
+      sumSquares += dx * dx + dy * dy
+    }
+    const variance = sumSquares / STABILITY_WINDOW
     
     return variance < 1000 // Threshold for stability
   })
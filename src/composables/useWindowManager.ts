@@ -74,7 +74,47 @@ export function useWindowManager() {
   // Movement smoothing
   const targetPosition = ref<Point2D>({ x: 0, y: 0 })
   const movementHistory = ref<Point2D[]>([])
-  const smoothingQueue = ref<Point2D[]>([])
+
+  // Normalized smoothing weights for every queue length, oldest position first. They
+  // only depend on config.smoothing, so they are rebuilt when it changes rather than
+  // recomputed per update. Float32 is ample for weights that sum to one.
+  const MAX_SMOOTHING_HISTORY = 5
+  let smoothingWeights: Float32Array[] = []
+  let smoothingWeightsFactor = NaN
+
+  const getSmoothingWeights = (length: number): Float32Array => {
+    const { smoothing } = config.value
+    if (smoothing !== smoothingWeightsFactor) {
+      smoothingWeights = [new Float32Array(0)]
+      for (let size = 1; size <= MAX_SMOOTHING_HISTORY; size++) {
+        const weights = new Float32Array(size)
+        let total = 0
+        for (let i = 0; i < size; i++) {
+          weights[i] = Math.pow(smoothing, size - i - 1)
+          total += weights[i]
+        }
+        for (let i = 0; i < size; i++) {
+          weights[i] /= total
+        }
+        smoothingWeights.push(weights)
+      }
+      smoothingWeightsFactor = smoothing
+    }
+    return smoothingWeights[length]
+  }
+
+  // Recent target positions for smoothing, as a struct-of-arrays ring: each update
+  // writes two numbers in place instead of pushing/shifting point objects through a
+  // reactive array (nothing renders the queue)
+  const queueX = new Float32Array(MAX_SMOOTHING_HISTORY)
+  const queueY = new Float32Array(MAX_SMOOTHING_HISTORY)
+  let queueStart = 0 // Ring index of the oldest position
+  let queueLength = 0
+
+  const clearSmoothingQueue = (): void => {
+    queueStart = 0
+    queueLength = 0
+  }
 
   const initializeWindow = async () => {
     try {
@@ -212,10 +252,91 @@ export function useWindowManager() {
   }
 
   // Monitor management functions
+  // Monitor rectangles as parallel arrays of edges (struct of arrays), rebuilt whenever
+  // the layout is loaded. getMonitorAt runs for every gaze sample and scans these
+  // instead of reading four fields off each reactive monitor object.
+  let monitorLeft = new Float64Array(0)
+  let monitorTop = new Float64Array(0)
+  let monitorRight = new Float64Array(0)
+  let monitorBottom = new Float64Array(0)
+
+  // Coarse grid over the monitors' bounding box, one cell per GRID_CELL_NONE /
+  // GRID_CELL_SHARED / monitor index. Most points resolve with one array read; only
+  // cells crossed by a monitor edge fall back to testing the rectangles.
+  const MONITOR_GRID_SIZE = 64
+  const GRID_CELL_NONE = -1
+  const GRID_CELL_SHARED = -2
+  const monitorGrid = new Int8Array(MONITOR_GRID_SIZE * MONITOR_GRID_SIZE)
+  let gridLeft = 0
+  let gridTop = 0
+  let gridScaleX = 0 // Cells per pixel
+  let gridScaleY = 0
+
+  const refreshMonitorBounds = (monitors: MonitorInfo[]): void => {
+    monitorLeft = new Float64Array(monitors.length)
+    monitorTop = new Float64Array(monitors.length)
+    monitorRight = new Float64Array(monitors.length)
+    monitorBottom = new Float64Array(monitors.length)
+    let left = Infinity
+    let top = Infinity
+    let right = -Infinity
+    let bottom = -Infinity
+    for (let i = 0; i < monitors.length; i++) {
+      const { x, y, width, height } = monitors[i]
+      monitorLeft[i] = x
+      monitorTop[i] = y
+      monitorRight[i] = x + width
+      monitorBottom[i] = y + height
+      left = Math.min(left, x)
+      top = Math.min(top, y)
+      right = Math.max(right, x + width)
+      bottom = Math.max(bottom, y + height)
+    }
+
+    // Int8 cells hold monitor indices, so very large layouts just use the scan
+    monitorGrid.fill(GRID_CELL_SHARED)
+    if (monitors.length === 0 || monitors.length > 127 || right <= left || bottom <= top) {
+      gridScaleX = 0
+      return
+    }
+    gridLeft = left
+    gridTop = top
+    gridScaleX = MONITOR_GRID_SIZE / (right - left)
+    gridScaleY = MONITOR_GRID_SIZE / (bottom - top)
+
+    // Cells are classified slightly oversized, so a point that rounds into a
+    // neighbouring cell in getMonitorAt still lands on the right monitor
+    const cellWidth = (right - left) / MONITOR_GRID_SIZE
+    const cellHeight = (bottom - top) / MONITOR_GRID_SIZE
+    const slackX = cellWidth * 1e-6
+    const slackY = cellHeight * 1e-6
+    for (let row = 0; row < MONITOR_GRID_SIZE; row++) {
+      const cellTop = top + row * cellHeight - slackY
+      const cellBottom = top + (row + 1) * cellHeight + slackY
+      for (let col = 0; col < MONITOR_GRID_SIZE; col++) {
+        const cellLeft = left + col * cellWidth - slackX
+        const cellRight = left + (col + 1) * cellWidth + slackX
+        let cell = GRID_CELL_NONE
+        for (let i = 0; i < monitors.length; i++) {
+          const overlaps = monitorLeft[i] < cellRight && monitorRight[i] > cellLeft &&
+            monitorTop[i] < cellBottom && monitorBottom[i] > cellTop
+          if (!overlaps) continue
+          const covers = monitorLeft[i] <= cellLeft && monitorRight[i] >= cellRight &&
+            monitorTop[i] <= cellTop && monitorBottom[i] >= cellBottom
+          // A cell belongs to a monitor only if that monitor alone touches all of it
+          cell = covers && cell === GRID_CELL_NONE ? i : GRID_CELL_SHARED
+          if (!covers) break
+        }
+        monitorGrid[row * MONITOR_GRID_SIZE + col] = cell
+      }
+    }
+  }
+
   const loadMonitorLayout = async (): Promise<void> => {
     try {
       const monitors = await invoke<MonitorInfo[]>('get_monitor_layout')
       state.value.monitors = monitors
+      refreshMonitorBounds(monitors)
       
       // Find the smallest monitor (home monitor)
       const homeMonitor = monitors.reduce((smallest, monitor) => {
@@ -240,14 +361,29 @@ export function useWindowManager() {
         name: 'Primary'
       }]
       state.value.homeMonitor = state.value.monitors[0]
+      refreshMonitorBounds(state.value.monitors)
     }
   }
 
   const getMonitorAt = (x: number, y: number): MonitorInfo | null => {
-    return state.value.monitors.find(monitor => 
-      x >= monitor.x && x < monitor.x + monitor.width &&
-      y >= monitor.y && y < monitor.y + monitor.height
-    ) || null
+    if (gridScaleX > 0) {
+      const col = Math.floor((x - gridLeft) * gridScaleX)
+      const row = Math.floor((y - gridTop) * gridScaleY)
+      // Outside the bounding box of all monitors (written so NaN lands here too)
+      if (!(col >= 0 && col < MONITOR_GRID_SIZE && row >= 0 && row < MONITOR_GRID_SIZE)) {
+        return null
+      }
+      const cell = monitorGrid[row * MONITOR_GRID_SIZE + col]
+      if (cell === GRID_CELL_NONE) return null
+      if (cell !== GRID_CELL_SHARED) return state.value.monitors[cell]
+    }
+
+    for (let i = 0; i < monitorLeft.length; i++) {
+      if (x >= monitorLeft[i] && x < monitorRight[i] && y >= monitorTop[i] && y < monitorBottom[i]) {
+        return state.value.monitors[i]
+      }
+    }
+    return null
   }
 
   const moveToHomePosition = async (): Promise<void> => {
@@ -287,13 +423,14 @@ export function useWindowManager() {
 
   // Convert gaze coordinates (-1 to 1) to screen coordinates
   const gazeToScreenCoordinates = (gaze: Point2D): Point2D => {
-    const { screenSize } = state.value
-    
-    // Convert normalized gaze (-1 to 1) to screen coordinates (0 to screen size)
-    const screenX = ((gaze.x + 1) / 2) * screenSize.width
-    const screenY = ((gaze.y + 1) / 2) * screenSize.height
-    
-    return { x: screenX, y: screenY }
+    const { width, height } = state.value.screenSize
+
+    // Convert normalized gaze (-1 to 1) to screen coordinates (0 to screen size) as
+    // one multiply-add per axis: (g + 1) / 2 * size = g * size/2 + size/2
+    const halfWidth = width * 0.5
+    const halfHeight = height * 0.5
+
+    return { x: gaze.x * halfWidth + halfWidth, y: gaze.y * halfHeight + halfHeight }
   }
 
   // Calculate target window position based on gaze
@@ -301,22 +438,22 @@ export function useWindowManager() {
     const { size, screenSize } = state.value
     const { edgeBuffer } = config.value
 
-    // Center the window on the gaze point
-    let targetX = gazeScreenPos.x - (size.width / 2)
-    let targetY = gazeScreenPos.y - (size.height / 2)
-
-    // Apply screen boundaries with edge buffer
-    targetX = Math.max(edgeBuffer, Math.min(targetX, screenSize.width - size.width - edgeBuffer))
-    targetY = Math.max(edgeBuffer, Math.min(targetY, screenSize.height - size.height - edgeBuffer))
+    // Center the window on the gaze point, then clamp to the screen minus the edge
+    // buffer, each axis as a single offset and clamp
+    const maxX = screenSize.width - size.width - edgeBuffer
+    const maxY = screenSize.height - size.height - edgeBuffer
 
-    return { x: Math.round(targetX), y: Math.round(targetY) }
+    return {
+      x: Math.round(Math.max(edgeBuffer, Math.min(gazeScreenPos.x - size.width * 0.5, maxX))),
+      y: Math.round(Math.max(edgeBuffer, Math.min(gazeScreenPos.y - size.height * 0.5, maxY)))
+    }
   }
 
   // Apply dead zone to prevent micro-movements
   const applyDeadZone = (gaze: Point2D): Point2D | null => {
-    const distance = Math.sqrt(gaze.x * gaze.x + gaze.y * gaze.y)
-    
-    if (distance < config.value.deadZone) {
+    // Squared comparison, no sqrt needed
+    const { deadZone } = config.value
+    if (gaze.x * gaze.x + gaze.y * gaze.y < deadZone * deadZone) {
       return null // Within dead zone, no movement
     }
 
@@ -325,30 +462,36 @@ export function useWindowManager() {
 
   // Apply smoothing to reduce jitter
   const applySmoothingFilter = (newPosition: Point2D): Point2D => {
-    const { smoothing } = config.value
-    const maxHistory = 5
-
-    // Add to smoothing queue
-    smoothingQueue.value.push(newPosition)
-    if (smoothingQueue.value.length > maxHistory) {
-      smoothingQueue.value.shift()
+    // Add to smoothing queue, overwriting the oldest position once it is full
+    const index = (queueStart + queueLength) % MAX_SMOOTHING_HISTORY
+    queueX[index] = newPosition.x
+    queueY[index] = newPosition.y
+    if (queueLength < MAX_SMOOTHING_HISTORY) {
+      queueLength++
+    } else {
+      queueStart = (queueStart + 1) % MAX_SMOOTHING_HISTORY
     }
 
-    // Calculate weighted average with recent positions having more weight
+    // Weighted average with the cached weights (recent positions have more weight),
+    // oldest first, walking the ring as its two contiguous runs
+    const weights = getSmoothingWeights(queueLength)
+    const firstRunEnd = Math.min(queueStart + queueLength, MAX_SMOOTHING_HISTORY)
     let weightedX = 0
     let weightedY = 0
-    let totalWeight = 0
+    let w = 0
 
-    smoothingQueue.value.forEach((pos: Point2D, index: number) => {
-      const weight = Math.pow(smoothing, smoothingQueue.value.length - index - 1)
-      weightedX += pos.x * weight
-      weightedY += pos.y * weight
-      totalWeight += weight
-    })
+    for (let i = queueStart; i < firstRunEnd; i++, w++) {
+      weightedX += queueX[i] * weights[w]
+      weightedY += queueY[i] * weights[w]
+    }
+    for (let i = 0; w < queueLength; i++, w++) {
+      weightedX += queueX[i] * weights[w]
+      weightedY += queueY[i] * weights[w]
+    }
 
     return {
-      x: Math.round(weightedX / totalWeight),
-      y: Math.round(weightedY / totalWeight)
+      x: Math.round(weightedX),
+      y: Math.round(weightedY)
     }
   }
 
@@ -357,12 +500,11 @@ export function useWindowManager() {
     const { position } = state.value
     const { minDistance } = config.value
 
-    const distance = Math.sqrt(
-      Math.pow(newPosition.x - position.x, 2) + 
-      Math.pow(newPosition.y - position.y, 2)
-    )
+    const dx = newPosition.x - position.x
+    const dy = newPosition.y - position.y
 
-    return distance >= minDistance
+    // Squared comparison, no sqrt needed
+    return dx * dx + dy * dy >= minDistance * minDistance
   }
 
   // Execute window movement with speed limiting
@@ -414,6 +556,32 @@ export function useWindowManager() {
   }
 
   // Main function to process gaze input and move window
+  // Gaze samples arrive faster than a move_window_to_position round trip, so moves are
+  // coalesced into one loop: a sample that lands while a move is in flight only
+  // replaces the pending target, and the loop then moves once toward the freshest
+  // one instead of issuing a move per sample from a stale position
+  let pendingMoveTarget: Point2D | null = null
+  let moveInFlight = false
+
+  const queueWindowMove = async (target: Point2D): Promise<void> => {
+    pendingMoveTarget = target
+    if (moveInFlight) return
+
+    moveInFlight = true
+    try {
+      while (pendingMoveTarget) {
+        const next = pendingMoveTarget
+        pendingMoveTarget = null
+        // The window may have moved since this target was queued
+        if (shouldMove(next)) {
+          await moveWindow(next)
+        }
+      }
+    } finally {
+      moveInFlight = false
+    }
+  }
+
   const processGazeInput = async (gaze: Point2D): Promise<void> => {
     if (!config.value.enabled) return
 
@@ -442,7 +610,7 @@ export function useWindowManager() {
       if (!shouldMove(smoothedPos)) return
 
       // Execute movement (allows cross-monitor movement)
-      await moveWindow(smoothedPos)
+      await queueWindowMove(smoothedPos)
 
     } catch (error) {
       console.error('Error processing gaze input:', error)
@@ -458,7 +626,8 @@ export function useWindowManager() {
 
   const disableGazeControl = (): void => {
     config.value.enabled = false
-    smoothingQueue.value = []
+    clearSmoothingQueue()
+    pendingMoveTarget = null
     movementHistory.value = []
     console.log('Gaze-controlled window movement disabled')
   }
@@ -485,9 +654,9 @@ export function useWindowManager() {
     for (let i = 1; i < recentMoves.length; i++) {
       const prev = recentMoves[i - 1]
       const curr = recentMoves[i]
-      totalDistance += Math.sqrt(
-        Math.pow(curr.x - prev.x, 2) + Math.pow(curr.y - prev.y, 2)
-      )
+      const dx = curr.x - prev.x
+      const dy = curr.y - prev.y
+      totalDistance += Math.sqrt(dx * dx + dy * dy)
     }
 
     return {
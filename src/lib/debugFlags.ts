@@ -0,0 +1,12 @@
+// Developer switches for the tracking pipeline, in one place. Each is opt-in through a
+// Vite env var (e.g. VITE_VERBOSE_TRACKING_LOGS=true in .env.local). Vite substitutes
+// the values at build time, so in a normal build the gated branches fold away.
+
+// Per-frame / per-sample diagnostics from capture, analysis and smoothing. These run
+// at the tracking frame rate, so they flood the console and are off unless asked for.
+export const VERBOSE_TRACKING_LOGS = import.meta.env.VITE_VERBOSE_TRACKING_LOGS === 'true'
+
+// Synthetic gaze when no frame or vision pipeline is available. Demo only: with it on,
+// a tracker that can't see anything still reports a face and a moving gaze, which
+// the gaze window control would act on.
+export const SIMULATE_GAZE_FALLBACK = import.meta.env.VITE_SIMULATE_GAZE === 'true'
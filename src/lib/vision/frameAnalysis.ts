@@ -0,0 +1,385 @@
+import type {
+  FaceBox,
+  EyePair,
+  EyeRegion,
+  GazeVector,
+  EyeTrackingResult,
+} from '../../types/eyeTracking'
+
+// Pixels to analyze: an ImageData, or the same fields posted to a worker
+export interface FrameData {
+  width: number
+  height: number
+  data: Uint8ClampedArray
+}
+
+// Frame plus the whole-frame statistics face detection keys off
+export interface ProcessedFrame extends FrameData {
+  brightness: number
+  variation: number
+}
+
+// Grayscale face crop in row-major order. Each pixel holds the integer sum of its RGB
+// channels (0-765), i.e. 3x its brightness: exact in 16 bits, half the size of a
+// float plane, and the divide by 3 is folded into the region averages.
+interface FaceRegion {
+  brightness: Uint16Array
+  width: number
+  height: number
+}
+
+// Backing store for the face crop, reused across frames and grown only when a
+// larger face box comes along
+let faceBrightnessBuffer = new Uint16Array(0)
+
+// Pure frame analysis pipeline (no Vue state), so it can run in useComputerVision or
+// in the analysis worker
+export const processImageData = (imageData: FrameData): ProcessedFrame => {
+  // For Phase 1 demo, we'll analyze the image data directly
+  // This gives us basic image analysis without external dependencies
+  const { brightness, variation } = calculateImageStats(imageData)
+
+  return {
+    width: imageData.width,
+    height: imageData.height,
+    data: imageData.data,
+    // Add some basic image statistics
+    brightness,
+    variation
+  }
+}
+
+// Average brightness and its standard deviation (indicator of content) in one pass
+// over the frame. Runs on the CPU over every pixel whenever no platform face detector
+// is available, so it stays in integers: per pixel the 8-bit channels are summed
+// (0-765, i.e. 3x the gray value) and squared, both exact, and the divide by 3 is
+// applied once to the totals. The totals stay well inside 2^53 for any camera frame.
+const calculateImageStats = (imageData: FrameData): { brightness: number, variation: number } => {
+  const data = imageData.data
+  const pixelCount = data.length / 4
+  let sum = 0
+  let sumOfSquares = 0
+
+  for (let i = 0; i < data.length; i += 4) {
+    const channels = data[i] + data[i + 1] + data[i + 2]
+    sum += channels
+    sumOfSquares += channels * channels
+  }
+
+  return statsFromSums(sum, sumOfSquares, pixelCount)
+}
+
+// Brightness and standard deviation from channel-sum totals over pixelCount pixels
+const statsFromSums = (sum: number, sumOfSquares: number, pixelCount: number): { brightness: number, variation: number } => {
+  const brightness = sum / (3 * pixelCount)
+  const variance = Math.max(0, sumOfSquares / (9 * pixelCount) - brightness * brightness)
+
+  return { brightness, variation: Math.sqrt(variance) }
+}
+
+// Brightness variation above which the heuristic assumes a face is present
+const FACE_VARIATION_THRESHOLD = 20
+
+// Cheap presence check for a face box carried over from an earlier frame: the
+// heuristic's variation test over just the box, so a face that has left (or a
+// covered camera) is noticed without a whole-frame detection pass
+export const isFacePresent = (imageData: FrameData, faceBox: FaceBox): boolean => {
+  const { x, y } = faceBox
+  const imageWidth = imageData.width
+  const data = imageData.data
+  const width = Math.max(0, Math.min(faceBox.width, imageWidth - x))
+  const height = Math.max(0, Math.min(faceBox.height, imageData.height - y))
+  if (width === 0 || height === 0) return false
+
+  let sum = 0
+  let sumOfSquares = 0
+  for (let fy = 0; fy < height; fy++) {
+    let index = ((y + fy) * imageWidth + x) * 4
+    for (let fx = 0; fx < width; fx++, index += 4) {
+      const channels = data[index] + data[index + 1] + data[index + 2]
+      sum += channels
+      sumOfSquares += channels * channels
+    }
+  }
+
+  return statsFromSums(sum, sumOfSquares, width * height).variation > FACE_VARIATION_THRESHOLD
+}
+
+// Detect faces in the image (simplified demo implementation). Plain arithmetic on
+// the frame stats; analyzeFrame's guard covers the whole pass, so the stages carry
+// no try/catch of their own.
+export const detectFaces = (processedImage: ProcessedFrame): FaceBox[] => {
+  // Get image dimensions
+  const height = processedImage.height
+  const width = processedImage.width
+  
+  // For Phase 1 demo: simulate face detection by assuming face is in center portion
+  // This ensures we always have a "face" detected for testing
+  const faceWidth = Math.floor(width * 0.4)  // 40% of image width
+  const faceHeight = Math.floor(height * 0.5) // 50% of image height
+  const faceX = Math.floor((width - faceWidth) / 2)   // Center horizontally
+  const faceY = Math.floor((height - faceHeight) / 3) // Upper third
+  
+  // Use the calculated variation as confidence indicator
+  const variation = processedImage.variation
+  
+  // If there's sufficient variation, assume a face is present
+  if (variation > FACE_VARIATION_THRESHOLD) {
+    return [{
+      x: faceX,
+      y: faceY,
+      width: faceWidth,
+      height: faceHeight,
+      confidence: Math.min(0.9, variation / 100) // Scale confidence based on variation
+    }]
+  }
+  
+  return []
+}
+
+// Simulated pupil detection confidence (detection is the centre of each eye region)
+const PUPIL_CONFIDENCE = 0.8
+
+// Detect eyes within a face region (simplified for Phase 1 demo)
+export const detectEyes = (faceBox: FaceBox): EyePair => {
+  // Eye regions are typically in the upper half of the face
+  const eyeRegionHeight = Math.floor(faceBox.height * 0.4)
+  const eyeRegionY = Math.floor(faceBox.height * 0.2)
+  
+  // Left eye region (right side of image due to camera mirror)
+  const leftEyeBox = {
+    x: faceBox.x + Math.floor(faceBox.width * 0.1),
+    y: faceBox.y + eyeRegionY,
+    width: Math.floor(faceBox.width * 0.4),
+    height: eyeRegionHeight
+  }
+  
+  // Right eye region
+  const rightEyeBox = {
+    x: faceBox.x + Math.floor(faceBox.width * 0.5),
+    y: faceBox.y + eyeRegionY,
+    width: Math.floor(faceBox.width * 0.4),
+    height: eyeRegionHeight
+  }
+
+  // Simulate pupil detection - use the center of each eye region, in global coordinates
+  const pupilConfidence = PUPIL_CONFIDENCE
+
+  const leftEye: EyeRegion = {
+    boundingBox: leftEyeBox,
+    pupilCenter: {
+      x: leftEyeBox.x + leftEyeBox.width / 2,
+      y: leftEyeBox.y + leftEyeBox.height / 2
+    },
+    confidence: pupilConfidence,
+    isOpen: pupilConfidence > 0.3
+  }
+
+  const rightEye: EyeRegion = {
+    boundingBox: rightEyeBox,
+    pupilCenter: {
+      x: rightEyeBox.x + rightEyeBox.width / 2,
+      y: rightEyeBox.y + rightEyeBox.height / 2
+    },
+    confidence: pupilConfidence,
+    isOpen: pupilConfidence > 0.3
+  }
+
+  return {
+    left: leftEye,
+    right: rightEye,
+    isValid: leftEye.confidence > 0.3 && rightEye.confidence > 0.3
+  }
+}
+
+// Calculate basic gaze vector from eye positions and image analysis
+export const calculateGaze = (eyes: EyePair, faceBox: FaceBox, processedImage?: FrameData): GazeVector => {
+  if (!eyes.isValid) {
+    return {
+      x: 0,
+      y: 0,
+      confidence: 0,
+      timestamp: Date.now()
+    }
+  }
+
+  return gazeFromPupilMidpoint(
+    (eyes.left.pupilCenter.x + eyes.right.pupilCenter.x) * 0.5,
+    (eyes.left.pupilCenter.y + eyes.right.pupilCenter.y) * 0.5,
+    (eyes.left.confidence + eyes.right.confidence) * 0.5,
+    faceBox,
+    processedImage
+  )
+}
+
+// Both pupil centres detectEyes would report for this face, reduced straight to their
+// midpoint: the same geometry without building the EyePair and its five objects
+const gazeFromFace = (faceBox: FaceBox, processedImage?: FrameData): GazeVector => {
+  const eyeWidth = Math.floor(faceBox.width * 0.4)
+  const midpointX = faceBox.x + (Math.floor(faceBox.width * 0.1) + Math.floor(faceBox.width * 0.5)) * 0.5 + eyeWidth / 2
+  const midpointY = faceBox.y + Math.floor(faceBox.height * 0.2) + Math.floor(faceBox.height * 0.4) / 2
+  return gazeFromPupilMidpoint(midpointX, midpointY, PUPIL_CONFIDENCE, faceBox, processedImage)
+}
+
+// Gaze from the pupil midpoint (global coordinates) and the mean pupil confidence
+const gazeFromPupilMidpoint = (
+  midpointX: number,
+  midpointY: number,
+  pupilConfidence: number,
+  faceBox: FaceBox,
+  processedImage?: FrameData
+): GazeVector => {
+  // Midpoint of the pupils relative to the face box
+  let relativeX = (midpointX - faceBox.x) / faceBox.width
+  let relativeY = (midpointY - faceBox.y) / faceBox.height
+  let confidence = pupilConfidence
+
+  // If we have processed image data, use it to influence gaze calculation
+  if (processedImage) {
+    // Analyze the face region for brightness variations that might indicate gaze direction
+    const faceData = extractFaceRegion(processedImage, faceBox)
+    const gazeInfluence = analyzeGazeDirection(faceData)
+
+    // Apply image analysis influence
+    relativeX += gazeInfluence.x * 0.3
+    relativeY += gazeInfluence.y * 0.3
+    confidence *= gazeInfluence.confidence
+  }
+
+  // Convert to normalized gaze coordinates (-1 to 1)
+  const normalizedX = (relativeX - 0.5) * 2
+  const normalizedY = (relativeY - 0.5) * 2
+
+  return {
+    x: Math.max(-1, Math.min(1, normalizedX)),
+    y: Math.max(-1, Math.min(1, normalizedY)),
+    confidence,
+    timestamp: Date.now()
+  }
+}
+
+// Extract face region from image data as a row-major grayscale plane
+const extractFaceRegion = (processedImage: FrameData, faceBox: FaceBox): FaceRegion => {
+  const { x, y } = faceBox
+  const imageWidth = processedImage.width
+  const data = processedImage.data
+  const width = Math.max(0, Math.min(faceBox.width, imageWidth - x))
+  const height = Math.max(0, Math.min(faceBox.height, processedImage.height - y))
+
+  if (faceBrightnessBuffer.length < width * height) {
+    faceBrightnessBuffer = new Uint16Array(width * height)
+  }
+  const brightness = faceBrightnessBuffer.subarray(0, width * height)
+  for (let fy = 0; fy < height; fy++) {
+    let index = ((y + fy) * imageWidth + x) * 4
+    const row = fy * width
+    for (let fx = 0; fx < width; fx++, index += 4) {
+      brightness[row + fx] = data[index] + data[index + 1] + data[index + 2]
+    }
+  }
+
+  return { brightness, width, height }
+}
+
+// Analyze gaze direction from face region
+const analyzeGazeDirection = (faceData: FaceRegion): { x: number, y: number, confidence: number } => {
+  const { brightness, width, height } = faceData
+
+  // Look for bright spots that might indicate eye reflections or gaze direction.
+  // Pixels left of / above the midline fall in the left / top halves, so the halves
+  // are fixed column and row ranges and the inner loops need no per-pixel branch.
+  const leftColumns = Math.min(width, Math.ceil(width / 2))
+  const topRows = Math.min(height, Math.ceil(height / 2))
+
+  let leftTotal = 0
+  let rightTotal = 0
+  let topTotal = 0
+  let bottomTotal = 0
+
+  for (let py = 0; py < height; py++) {
+    const row = py * width
+    let rowLeft = 0
+    let rowRight = 0
+    for (let px = 0; px < leftColumns; px++) {
+      rowLeft += brightness[row + px]
+    }
+    for (let px = leftColumns; px < width; px++) {
+      rowRight += brightness[row + px]
+    }
+
+    leftTotal += rowLeft
+    rightTotal += rowRight
+    if (py < topRows) {
+      topTotal += rowLeft + rowRight
+    } else {
+      bottomTotal += rowLeft + rowRight
+    }
+  }
+
+  // Calculate average channel sum per region (3x average brightness)
+  const leftCount = leftColumns * height
+  const rightCount = (width - leftColumns) * height
+  const topCount = topRows * width
+  const bottomCount = (height - topRows) * width
+
+  const leftAvg = leftCount > 0 ? leftTotal / leftCount : 0
+  const rightAvg = rightCount > 0 ? rightTotal / rightCount : 0
+  const topAvg = topCount > 0 ? topTotal / topCount : 0
+  const bottomAvg = bottomCount > 0 ? bottomTotal / bottomCount : 0
+  
+  // Calculate gaze influence based on brightness differences (765 = 3 * 255)
+  const horizontalInfluence = (rightAvg - leftAvg) / 765 * 0.5
+  const verticalInfluence = (bottomAvg - topAvg) / 765 * 0.5
+  
+  return {
+    x: horizontalInfluence,
+    y: verticalInfluence,
+    confidence: Math.min(1, Math.abs(horizontalInfluence) + Math.abs(verticalInfluence))
+  }
+}
+
+// Full face -> eyes -> gaze pass over one frame. Faces already found by a platform
+// detector can be passed in, which skips the whole-frame statistics pass.
+export const analyzeFrame = (imageData: FrameData, detectedFaces?: FaceBox[]): EyeTrackingResult => {
+  const startTime = performance.now()
+
+  try {
+    // Detect faces (simplified) unless the caller already has them
+    const faces = detectedFaces ?? detectFaces(processImageData(imageData))
+    
+    if (faces.length === 0) {
+      return {
+        success: false,
+        gaze: null,
+        confidence: 0,
+        faceDetected: false,
+        processingTime: performance.now() - startTime
+      }
+    }
+
+    // Use the most confident face
+    const primaryFace = faces[0]
+
+    // Detect eyes (simplified) and calculate gaze. Every simulated pupil is valid, so
+    // this is calculateGaze(detectEyes(face)) without the intermediate eye regions.
+    const gaze = gazeFromFace(primaryFace, imageData)
+
+    return {
+      success: true,
+      gaze,
+      confidence: gaze.confidence,
+      faceDetected: true,
+      processingTime: performance.now() - startTime
+    }
+
+  } catch (error) {
+    console.error('Frame processing error:', error)
+    return {
+      success: false,
+      gaze: null,
+      confidence: 0,
+      faceDetected: false,
+      processingTime: performance.now() - startTime
+    }
+  }
+}
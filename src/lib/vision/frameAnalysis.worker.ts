@@ -0,0 +1,321 @@
+import { analyzeFrame, detectFaces, isFacePresent, processImageData, type FrameData } from './frameAnalysis'
+import type { FaceBox, EyeTrackingResult } from '../../types/eyeTracking'
+
+// Runs the frame analysis pipeline off the main thread. Each message is one frame,
+// either its pixel buffer or an ImageBitmap still to be read back (both transferred,
+// not copied); the reply is its EyeTrackingResult. Bitmaps go through the platform
+// face detector first where one exists.
+type FrameMessage = FrameData | { bitmap: ImageBitmap }
+
+// Shape Detection API face detector (Chromium / WebView2), backed by the platform's
+// accelerated detector. Not in the TS DOM lib yet, hence the local types.
+interface PlatformFaceDetector {
+  detect(image: ImageBitmapSource): Promise<Array<{ boundingBox: DOMRectReadOnly }>>
+}
+type FaceDetectorConstructor = new (options?: { maxDetectedFaces?: number, fastMode?: boolean }) => PlatformFaceDetector
+
+// undefined until first use, null where the platform has no detector
+let faceDetector: PlatformFaceDetector | null | undefined
+
+// Face found in the previous frame. The next frame's detection first searches only
+// the area around it, padded by this fraction of the box on each side, and falls
+// back to the whole frame when the face isn't there.
+let lastFaceBox: FaceBox | null = null
+const FACE_SEARCH_MARGIN = 0.5
+
+// A face barely moves between frames at tracking rates, so the detector only runs on
+// every Nth frame. The frames in between reuse its box as long as isFacePresent still
+// finds a face inside it.
+const FACE_REDETECT_INTERVAL = 5
+let framesSinceDetect = 0
+
+// Widest image handed to the face detector. Detection cost grows with pixel count and
+// a face is still tens of pixels wide at this size, so larger searches are scaled
+// down on the GPU first; the pixels analysed afterwards keep the full resolution.
+const DETECTION_MAX_WIDTH = 160
+
+// Region of a bitmap to read back
+interface PixelRect {
+  x: number
+  y: number
+  width: number
+  height: number
+}
+
+// WebCodecs VideoFrame with RGBA conversion in copyTo (Chromium 127+). The format
+// option isn't in the TS DOM lib yet, hence the local types.
+interface RGBACopyOptions { format?: 'RGBA', colorSpace?: 'srgb', rect?: PixelRect }
+interface RGBAFrame {
+  readonly format: string | null
+  allocationSize(options: RGBACopyOptions): number
+  copyTo(destination: Uint8ClampedArray, options: RGBACopyOptions): Promise<unknown>
+  close(): void
+}
+type RGBAFrameConstructor = new (image: ImageBitmap, init: { timestamp: number }) => RGBAFrame
+
+const RGBA_COPY: RGBACopyOptions = { format: 'RGBA', colorSpace: 'srgb' }
+
+// Frame layouts copied as they are. The analysis only ever sums the three colour bytes
+// of each 4-byte pixel and ignores the fourth, so channel order doesn't matter and a
+// BGRA frame needs no swizzle pass into RGBA.
+const INTERLEAVED_FORMATS = new Set(['RGBA', 'RGBX', 'BGRA', 'BGRX'])
+
+// Cleared the first time copyTo can't deliver tightly packed 4-byte pixels, after which every
+// bitmap goes through the canvas readback
+let CopyableVideoFrame = (self as unknown as { VideoFrame?: RGBAFrameConstructor }).VideoFrame ?? null
+
+// Pixel buffer bitmaps are copied into, reused across frames and grown only when a
+// larger region comes along (face crops change size with nearly every detection).
+// Only ever read by the synchronous analyzeFrame call for the frame it holds.
+let frameBuffer = new Uint8ClampedArray(0)
+
+// Offscreen readback surface, created on first use and reused for every bitmap
+let readbackContext: OffscreenCanvasRenderingContext2D | null = null
+
+// Copy the rect's pixels into the front of frameBuffer. null if the platform can't,
+// in which case the caller falls back to the canvas.
+const copyBitmap = async (bitmap: ImageBitmap, rect: PixelRect): Promise<FrameData | null> => {
+  if (!CopyableVideoFrame) return null
+
+  let frame: RGBAFrame | null = null
+  try {
+    frame = new CopyableVideoFrame(bitmap, { timestamp: 0 })
+    const nativeLayout = frame.format !== null && INTERLEAVED_FORMATS.has(frame.format)
+    const options: RGBACopyOptions = nativeLayout ? { rect } : { ...RGBA_COPY, rect }
+    const size = frame.allocationSize(options)
+    if (size !== rect.width * rect.height * 4) {
+      // Padded rows; the analysis expects a tightly packed frame
+      CopyableVideoFrame = null
+      return null
+    }
+
+    if (frameBuffer.length < size) {
+      frameBuffer = new Uint8ClampedArray(size)
+    }
+    const data = frameBuffer.subarray(0, size)
+    await frame.copyTo(data, options)
+    return { width: rect.width, height: rect.height, data }
+  } catch (error) {
+    console.warn('VideoFrame copy unavailable, reading frames back through a canvas:', error)
+    CopyableVideoFrame = null
+    return null
+  } finally {
+    frame?.close()
+  }
+}
+
+// Canvas readback: allocates a fresh ImageData per frame
+const readBitmap = (bitmap: ImageBitmap, rect: PixelRect): FrameData | null => {
+  if (!readbackContext) {
+    readbackContext = new OffscreenCanvas(rect.width, rect.height)
+      .getContext('2d', { willReadFrequently: true })
+    if (!readbackContext) return null
+  }
+
+  const canvas = readbackContext.canvas
+  if (canvas.width !== rect.width || canvas.height !== rect.height) {
+    canvas.width = rect.width
+    canvas.height = rect.height
+  }
+
+  readbackContext.drawImage(bitmap, rect.x, rect.y, rect.width, rect.height, 0, 0, rect.width, rect.height)
+  const { width, height, data } = readbackContext.getImageData(0, 0, canvas.width, canvas.height)
+  return { width, height, data }
+}
+
+// Read back the whole bitmap, or just `rect` of it
+const readBitmapPixels = async (bitmap: ImageBitmap, rect?: PixelRect): Promise<FrameData | null> => {
+  const region = rect ?? { x: 0, y: 0, width: bitmap.width, height: bitmap.height }
+  return (await copyBitmap(bitmap, region)) ?? readBitmap(bitmap, region)
+}
+
+const getFaceDetector = (): PlatformFaceDetector | null => {
+  if (faceDetector === undefined) {
+    const FaceDetector = (self as unknown as { FaceDetector?: FaceDetectorConstructor }).FaceDetector
+    try {
+      faceDetector = FaceDetector ? new FaceDetector({ maxDetectedFaces: 1, fastMode: true }) : null
+    } catch {
+      faceDetector = null
+    }
+  }
+  return faceDetector
+}
+
+// Area around the previous face to search first, clamped to the frame
+const faceSearchRegion = (face: FaceBox, bitmap: ImageBitmap): PixelRect => {
+  const marginX = Math.round(face.width * FACE_SEARCH_MARGIN)
+  const marginY = Math.round(face.height * FACE_SEARCH_MARGIN)
+  const x = Math.max(0, face.x - marginX)
+  const y = Math.max(0, face.y - marginY)
+  return {
+    x,
+    y,
+    width: Math.min(bitmap.width, face.x + face.width + marginX) - x,
+    height: Math.min(bitmap.height, face.y + face.height + marginY) - y
+  }
+}
+
+// Face boxes from the platform detector, run on the bitmap (or just `region` of it,
+// cropped and scaled down on the GPU) before it is read back, in full-frame
+// coordinates. undefined means no detector, and analyzeFrame falls back to its own
+// heuristic.
+const detectFacesOnBitmap = async (bitmap: ImageBitmap, region?: PixelRect): Promise<FaceBox[] | undefined> => {
+  const detector = getFaceDetector()
+  if (!detector) return undefined
+
+  // Detector boxes and bitmap sizes are host-object accessors: read each field once
+  // into plain numbers
+  const frameWidth = bitmap.width
+  const frameHeight = bitmap.height
+  const source = region ?? { x: 0, y: 0, width: frameWidth, height: frameHeight }
+  const scale = Math.min(1, DETECTION_MAX_WIDTH / source.width)
+  let crop: ImageBitmap | null = null
+  try {
+    if (region || scale < 1) {
+      crop = await createImageBitmap(bitmap, source.x, source.y, source.width, source.height, {
+        resizeWidth: Math.max(1, Math.round(source.width * scale)),
+        resizeHeight: Math.max(1, Math.round(source.height * scale)),
+        resizeQuality: 'low'
+      })
+    }
+    const detections = await detector.detect(crop ?? bitmap)
+
+    // Boxes back to full-frame pixels, built in a single pass
+    const faces: FaceBox[] = []
+    for (let i = 0; i < detections.length; i++) {
+      const { x: boxX, y: boxY, width: boxWidth, height: boxHeight } = detections[i].boundingBox
+      const x = Math.max(0, Math.round(boxX / scale) + source.x)
+      const y = Math.max(0, Math.round(boxY / scale) + source.y)
+      const width = Math.min(frameWidth - x, Math.round(boxWidth / scale))
+      const height = Math.min(frameHeight - y, Math.round(boxHeight / scale))
+      if (width > 0 && height > 0) {
+        faces.push({
+          x,
+          y,
+          width,
+          height,
+          confidence: 0.9 // The detector reports no score; match the heuristic's ceiling
+        })
+      }
+    }
+    return faces
+  } catch (error) {
+    // Exposed but unsupported on this platform (e.g. no backend on Linux)
+    console.warn('Platform face detector unavailable, using heuristic detection:', error)
+    faceDetector = null
+    return undefined
+  } finally {
+    crop?.close()
+  }
+}
+
+// The last face box while it is fresh and still inside a width x height frame. The
+// caller still has to confirm the face is there (isFacePresent) before using it.
+const reusableFaceBox = (width: number, height: number): FaceBox | null => {
+  if (
+    lastFaceBox &&
+    framesSinceDetect < FACE_REDETECT_INTERVAL - 1 &&
+    lastFaceBox.x + lastFaceBox.width <= width &&
+    lastFaceBox.y + lastFaceBox.height <= height
+  ) {
+    framesSinceDetect++
+    return lastFaceBox
+  }
+  return null
+}
+
+// Drop the tracked face, so the next lookup runs a full detection
+const forgetFace = (): void => {
+  lastFaceBox = null
+  framesSinceDetect = 0
+}
+
+// New detection on this bitmap: around the last box first, then the whole frame
+const locateFaces = async (bitmap: ImageBitmap): Promise<FaceBox[] | undefined> => {
+  let faces: FaceBox[] | undefined
+  if (lastFaceBox) {
+    faces = await detectFacesOnBitmap(bitmap, faceSearchRegion(lastFaceBox, bitmap))
+  }
+  if (!faces || faces.length === 0) {
+    faces = await detectFacesOnBitmap(bitmap)
+  }
+  lastFaceBox = faces?.[0] ?? null
+  framesSinceDetect = 0
+  return faces
+}
+
+// Faces for a full frame of pixels when no platform detector ran: the heuristic's
+// whole-frame statistics pass is gated the same way, so it only runs every
+// FACE_REDETECT_INTERVAL frames, or as soon as the face leaves the reused box
+const locateFacesInPixels = (frame: FrameData): FaceBox[] => {
+  const reused = reusableFaceBox(frame.width, frame.height)
+  if (reused) {
+    if (isFacePresent(frame, reused)) return [reused]
+    forgetFace()
+  }
+
+  const faces = detectFaces(processImageData(frame))
+  lastFaceBox = faces[0] ?? null
+  framesSinceDetect = 0
+  return faces
+}
+
+self.onmessage = async (event: MessageEvent<FrameMessage>) => {
+  let frame: FrameData | null = null
+  let faces: FaceBox[] | undefined
+
+  if ('bitmap' in event.data) {
+    const { bitmap } = event.data
+    try {
+      // Past detection only the face is analysed, and the eye/gaze maths is relative
+      // to the face box: read back just that region and analyse it as its own frame
+      const reused = reusableFaceBox(bitmap.width, bitmap.height)
+      if (reused) {
+        frame = await readBitmapPixels(bitmap, reused)
+        const face = { ...reused, x: 0, y: 0 }
+        if (frame && isFacePresent(frame, face)) {
+          faces = [face]
+        } else {
+          forgetFace()
+        }
+      }
+
+      if (!faces) {
+        faces = await locateFaces(bitmap)
+        if (faces && faces.length > 0) {
+          const face = faces[0]
+          frame = await readBitmapPixels(bitmap, face)
+          faces = [{ ...face, x: 0, y: 0 }]
+        } else if (faces) {
+          // The detector saw no face, so there is nothing to read back
+          self.postMessage({ success: false, gaze: null, confidence: 0, faceDetected: false })
+          return
+        } else {
+          frame = await readBitmapPixels(bitmap)
+        }
+      }
+    } finally {
+      bitmap.close()
+    }
+  } else {
+    frame = event.data
+  }
+
+  if (frame && !faces) {
+    faces = locateFacesInPixels(frame)
+  }
+
+  const result: EyeTrackingResult = frame ? analyzeFrame(frame, faces) : {
+    success: false,
+    gaze: null,
+    confidence: 0,
+    faceDetected: false
+  }
+
+  // A failed pass means the box is stale: detect from scratch next frame
+  if (!result.success) {
+    forgetFace()
+  }
+
+  self.postMessage(result)
+}
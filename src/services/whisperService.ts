@@ -1,7 +1,8 @@
 import { invoke } from '@tauri-apps/api/core'
+import type { WhisperModelSize } from '../types/speechTranscription'
 
 export interface TranscriptionOptions {
-  modelSize?: 'tiny' | 'base' | 'small' | 'medium' | 'large'
+  modelSize?: WhisperModelSize
   language?: string
   translate?: boolean
   sampleRate?: number
@@ -1,6 +1,7 @@
 import { defineStore } from 'pinia'
 import { ref, computed } from 'vue'
 import type { ChatMessage, WindowPosition } from '../types'
+import type { WhisperModelSize } from '../types/speechTranscription'
 import { useSpeechTranscription } from '../composables/useSpeechTranscription'
 
 export const useAppStore = defineStore('app', () => {
@@ -132,7 +133,7 @@ export const useAppStore = defineStore('app', () => {
   }
 
   // Speech transcription actions
-  const initializeSpeechTranscription = async (modelSize: 'tiny' | 'base' | 'small' | 'medium' | 'large' = 'tiny') => {
+  const initializeSpeechTranscription = async (modelSize: WhisperModelSize = 'tiny') => {
     try {
       await speechTranscription.initialize({ modelSize })
       isTranscriptionEnabled.value = true
@@ -0,0 +1,59 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest'
+import { invoke } from '@tauri-apps/api/core'
+import { useMLEyeTracking } from '@/composables/useMLEyeTracking'
+
+vi.mock('@tauri-apps/api/event', () => ({
+  listen: vi.fn(() => Promise.resolve(() => {})),
+}))
+
+type BatchSample = { x: number, y: number, confidence: number, timestamp: number }
+
+const steadyBatch = (count: number): BatchSample[] =>
+  Array.from({ length: count }, (_, i) => ({ x: 960, y: 540, confidence: 0.9, timestamp: i }))
+
+// Alternates 60px either side of the centre on both axes: inside the outlier
+// threshold, but far too spread out to count as stable
+const jitteryBatch = (count: number): BatchSample[] =>
+  Array.from({ length: count }, (_, i) => {
+    const offset = i % 2 ? 60 : -60
+    return { x: 960 + offset, y: 540 + offset, confidence: 0.9, timestamp: i }
+  })
+
+const trackBatch = async (batch: BatchSample[]) => {
+  vi.mocked(invoke).mockImplementation(async (command: string) => {
+    switch (command) {
+      case 'get_virtual_desktop_size': return [1920, 1080]
+      case 'get_ml_gaze_batch': return batch
+      default: return 'ok'
+    }
+  })
+
+  const tracking = useMLEyeTracking()
+  await tracking.startTracking()
+  await vi.waitFor(() => expect(tracking.smoothedGaze.value).not.toBeNull())
+  return tracking
+}
+
+describe('useMLEyeTracking', () => {
+  beforeEach(() => {
+    vi.mocked(invoke).mockReset()
+  })
+
+  it('reports a steady gaze as stable once the history is full', async () => {
+    const tracking = await trackBatch(steadyBatch(10))
+    expect(tracking.isStable.value).toBe(true)
+    await tracking.stopTracking()
+  })
+
+  it('does not report stability before the history holds a full window', async () => {
+    const tracking = await trackBatch(steadyBatch(2))
+    expect(tracking.isStable.value).toBe(false)
+    await tracking.stopTracking()
+  })
+
+  it('does not report a jittery gaze as stable', async () => {
+    const tracking = await trackBatch(jitteryBatch(10))
+    expect(tracking.isStable.value).toBe(false)
+    await tracking.stopTracking()
+  })
+})
@@ -1,5 +1,16 @@
 import { describe, it, expect, vi, beforeEach } from 'vitest'
 import { ref } from 'vue'
+import { invoke } from '@tauri-apps/api/core'
+import { useWindowManager } from '@/composables/useWindowManager'
+import type { MonitorInfo } from '@/types/monitor'
+
+vi.mock('@tauri-apps/api/window', () => ({
+  Window: { getCurrent: vi.fn(() => ({})) },
+}))
+
+vi.mock('@/stores/app', () => ({
+  useAppStore: vi.fn(() => ({})),
+}))
 
 // Mock the actual composable for testing
 const createMockUseWindowManager = () => {
@@ -126,4 +137,77 @@ describe('useWindowManager', () => {
       expect(failingWindowManager.openWindow).toHaveBeenCalledWith('chat')
     })
   })
-})
\ No newline at end of file
+})
+
+describe('useWindowManager getMonitorAt', () => {
+  const monitor = (name: string, x: number, y: number, width: number, height: number): MonitorInfo => ({
+    x, y, width, height, is_primary: name === 'A', name,
+  })
+
+  // The lookup getMonitorAt replaced
+  const findMonitorName = (monitors: MonitorInfo[], x: number, y: number) =>
+    monitors.find(m => x >= m.x && x < m.x + m.width && y >= m.y && y < m.y + m.height)?.name ?? null
+
+  const loadLayout = async (monitors: MonitorInfo[]) => {
+    vi.mocked(invoke).mockResolvedValueOnce(monitors)
+    const windowManager = useWindowManager()
+    await windowManager.loadMonitorLayout()
+    return windowManager
+  }
+
+  // Every monitor edge and corner (and just either side of them), plus a lattice
+  // spanning past the layout's bounding box
+  const probePoints = (monitors: MonitorInfo[]) => {
+    const xs = new Set<number>()
+    const ys = new Set<number>()
+    for (const m of monitors) {
+      for (const x of [m.x, m.x + m.width]) [x - 1, x - 0.5, x, x + 0.5].forEach(v => xs.add(v))
+      for (const y of [m.y, m.y + m.height]) [y - 1, y - 0.5, y, y + 0.5].forEach(v => ys.add(v))
+    }
+    const left = Math.min(...monitors.map(m => m.x)) - 200
+    const top = Math.min(...monitors.map(m => m.y)) - 200
+    const right = Math.max(...monitors.map(m => m.x + m.width)) + 200
+    const bottom = Math.max(...monitors.map(m => m.y + m.height)) + 200
+    for (let i = 0; i <= 97; i++) {
+      xs.add(left + (right - left) * i / 97)
+      ys.add(top + (bottom - top) * i / 97)
+    }
+    const points: [number, number][] = []
+    for (const x of xs) for (const y of ys) points.push([x, y])
+    return points
+  }
+
+  const layouts: Record<string, MonitorInfo[]> = {
+    'adjacent monitors': [monitor('A', 0, 0, 1920, 1080), monitor('B', 1920, 0, 2560, 1440)],
+    'negative origins': [monitor('A', 0, 0, 1920, 1080), monitor('B', -1280, -1024, 1280, 1024), monitor('C', -1280, 0, 1280, 720)],
+    'edges crossing cells': [monitor('A', 0, 0, 1366, 768), monitor('B', 1366, 137, 1003, 777), monitor('C', 411, 768, 1777, 999)],
+    'gaps between monitors': [monitor('A', 0, 0, 1000, 800), monitor('B', 1300, 450, 640, 480), monitor('C', 100, 1500, 800, 600)],
+  }
+
+  for (const [label, monitors] of Object.entries(layouts)) {
+    it(`matches the linear lookup for ${label}`, async () => {
+      const windowManager = await loadLayout(monitors)
+      for (const [x, y] of probePoints(monitors)) {
+        expect(windowManager.getMonitorAt(x, y)?.name ?? null, `(${x}, ${y})`).toBe(findMonitorName(monitors, x, y))
+      }
+    })
+  }
+
+  it('treats right and bottom edges as outside the monitor', async () => {
+    const windowManager = await loadLayout(layouts['adjacent monitors'])
+    expect(windowManager.getMonitorAt(1920, 500)?.name).toBe('B')
+    expect(windowManager.getMonitorAt(1919.999, 500)?.name).toBe('A')
+    expect(windowManager.getMonitorAt(100, 1080)).toBeNull()
+    expect(windowManager.getMonitorAt(4480, 100)).toBeNull()
+    expect(windowManager.getMonitorAt(100, 1440)).toBeNull()
+  })
+
+  it('returns null for points outside every monitor or not a number', async () => {
+    const windowManager = await loadLayout(layouts['gaps between monitors'])
+    expect(windowManager.getMonitorAt(1100, 100)).toBeNull()
+    expect(windowManager.getMonitorAt(-5000, -5000)).toBeNull()
+    expect(windowManager.getMonitorAt(9000, 9000)).toBeNull()
+    expect(windowManager.getMonitorAt(NaN, 100)).toBeNull()
+    expect(windowManager.getMonitorAt(100, NaN)).toBeNull()
+  })
+})
@@ -0,0 +1,154 @@
+import { describe, it, expect } from 'vitest'
+import {
+  analyzeFrame,
+  calculateGaze,
+  detectEyes,
+  detectFaces,
+  processImageData,
+  type FrameData,
+} from '@/lib/vision/frameAnalysis'
+
+type Shade = (x: number, y: number) => [number, number, number]
+
+const makeFrame = (width: number, height: number, shade: Shade): FrameData => {
+  const data = new Uint8ClampedArray(width * height * 4)
+  for (let y = 0; y < height; y++) {
+    for (let x = 0; x < width; x++) {
+      const i = (y * width + x) * 4
+      const [r, g, b] = shade(x, y)
+      data[i] = r
+      data[i + 1] = g
+      data[i + 2] = b
+      data[i + 3] = 255
+    }
+  }
+  return { width, height, data }
+}
+
+const gray = (value: number): [number, number, number] => [value, value, value]
+
+// Deterministic per-channel noise, so failures reproduce
+const noise: Shade = (x, y) => {
+  const hash = ((x * 73856093) ^ (y * 19349663)) >>> 0
+  return [hash & 255, (hash >>> 8) & 255, (hash >>> 16) & 255]
+}
+
+// Straightforward per-pixel version of the pipeline: float gray values, one branch per
+// pixel for the halves. analyzeFrame must agree with it.
+const referenceAnalyzeFrame = (frame: FrameData) => {
+  const { width, height, data } = frame
+  const grayAt = (x: number, y: number) => {
+    const i = (y * width + x) * 4
+    return (data[i] + data[i + 1] + data[i + 2]) / 3
+  }
+
+  let sum = 0
+  let sumOfSquares = 0
+  for (let y = 0; y < height; y++) {
+    for (let x = 0; x < width; x++) {
+      sum += grayAt(x, y)
+      sumOfSquares += grayAt(x, y) ** 2
+    }
+  }
+  const brightness = sum / (width * height)
+  const variation = Math.sqrt(Math.max(0, sumOfSquares / (width * height) - brightness ** 2))
+  if (variation <= 20) return { faceDetected: false, gaze: null }
+
+  const face = {
+    x: Math.floor((width - Math.floor(width * 0.4)) / 2),
+    y: Math.floor((height - Math.floor(height * 0.5)) / 3),
+    width: Math.floor(width * 0.4),
+    height: Math.floor(height * 0.5),
+  }
+
+  const eyeWidth = Math.floor(face.width * 0.4)
+  const eyeHeight = Math.floor(face.height * 0.4)
+  const eyeY = face.y + Math.floor(face.height * 0.2)
+  const leftPupilX = face.x + Math.floor(face.width * 0.1) + eyeWidth / 2
+  const rightPupilX = face.x + Math.floor(face.width * 0.5) + eyeWidth / 2
+  const pupilY = eyeY + eyeHeight / 2
+
+  const totals = { left: 0, right: 0, top: 0, bottom: 0 }
+  const counts = { left: 0, right: 0, top: 0, bottom: 0 }
+  for (let py = 0; py < face.height; py++) {
+    for (let px = 0; px < face.width; px++) {
+      const value = grayAt(face.x + px, face.y + py)
+      const side = px < face.width / 2 ? 'left' : 'right'
+      const half = py < face.height / 2 ? 'top' : 'bottom'
+      totals[side] += value
+      counts[side]++
+      totals[half] += value
+      counts[half]++
+    }
+  }
+  const influenceX = (totals.right / counts.right - totals.left / counts.left) / 255 * 0.5
+  const influenceY = (totals.bottom / counts.bottom - totals.top / counts.top) / 255 * 0.5
+
+  const relativeX = ((leftPupilX + rightPupilX) / 2 - face.x) / face.width + influenceX * 0.3
+  const relativeY = (pupilY - face.y) / face.height + influenceY * 0.3
+  return {
+    faceDetected: true,
+    gaze: {
+      x: Math.max(-1, Math.min(1, (relativeX - 0.5) * 2)),
+      y: Math.max(-1, Math.min(1, (relativeY - 0.5) * 2)),
+      confidence: 0.8 * Math.min(1, Math.abs(influenceX) + Math.abs(influenceY)),
+    },
+  }
+}
+
+describe('frameAnalysis', () => {
+  const frames: Record<string, FrameData> = {
+    'horizontal gradient': makeFrame(160, 120, (x) => gray(Math.floor(x * 255 / 159))),
+    'bright top half': makeFrame(160, 120, (_x, y) => gray(y < 50 ? 230 : 20)),
+    'odd-sized noise': makeFrame(157, 93, noise),
+    'checkerboard': makeFrame(64, 48, (x, y) => gray(((x >> 2) + (y >> 2)) % 2 ? 250 : 5)),
+  }
+
+  for (const [label, frame] of Object.entries(frames)) {
+    it(`matches the per-pixel reference on a ${label}`, () => {
+      const expected = referenceAnalyzeFrame(frame)
+      const result = analyzeFrame(frame)
+
+      expect(result.faceDetected).toBe(expected.faceDetected)
+      expect(result.success).toBe(expected.faceDetected)
+      if (!expected.gaze) return
+      expect(result.gaze!.x).toBeCloseTo(expected.gaze.x, 9)
+      expect(result.gaze!.y).toBeCloseTo(expected.gaze.y, 9)
+      expect(result.gaze!.confidence).toBeCloseTo(expected.gaze.confidence, 9)
+      expect(result.confidence).toBe(result.gaze!.confidence)
+    })
+  }
+
+  it('reports no face on a flat frame', () => {
+    const result = analyzeFrame(makeFrame(80, 60, () => gray(128)))
+    expect(result).toMatchObject({ success: false, faceDetected: false, gaze: null })
+  })
+
+  it('agrees with the staged detectFaces -> detectEyes -> calculateGaze path', () => {
+    const frame = frames['odd-sized noise']
+    const [face] = detectFaces(processImageData(frame))
+    const staged = calculateGaze(detectEyes(face), face, frame)
+    const { gaze } = analyzeFrame(frame)
+
+    expect(gaze!.x).toBe(staged.x)
+    expect(gaze!.y).toBe(staged.y)
+    expect(gaze!.confidence).toBe(staged.confidence)
+  })
+
+  it('uses faces passed in by a platform detector', () => {
+    const frame = frames['horizontal gradient']
+    const face = { x: 10, y: 10, width: 40, height: 30, confidence: 0.9 }
+    const staged = calculateGaze(detectEyes(face), face, frame)
+    const { gaze } = analyzeFrame(frame, [face])
+
+    expect(gaze!.x).toBe(staged.x)
+    expect(gaze!.y).toBe(staged.y)
+    expect(analyzeFrame(frame, []).faceDetected).toBe(false)
+  })
+
+  it('leans the gaze toward the brighter side of the face', () => {
+    const { gaze } = analyzeFrame(frames['horizontal gradient'])
+    expect(gaze!.x).toBeGreaterThan(0)
+    expect(analyzeFrame(frames['bright top half']).gaze!.y).toBeLessThan(0)
+  })
+})
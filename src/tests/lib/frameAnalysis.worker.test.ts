@@ -0,0 +1,50 @@
+import { describe, it, expect, beforeAll, afterAll, vi } from 'vitest'
+import type { FrameData } from '@/lib/vision/frameAnalysis'
+import type { EyeTrackingResult } from '@/types/eyeTracking'
+
+const makeFrame = (width: number, height: number, shade: (x: number, y: number) => number): FrameData => {
+  const data = new Uint8ClampedArray(width * height * 4)
+  for (let i = 0; i < width * height; i++) {
+    const value = shade(i % width, Math.floor(i / width))
+    data.fill(value, i * 4, i * 4 + 3)
+    data[i * 4 + 3] = 255
+  }
+  return { width, height, data }
+}
+
+const faceFrame = () => makeFrame(160, 120, (x, y) => ((x >> 3) + (y >> 3)) % 2 ? 220 : 30)
+const blankFrame = () => makeFrame(160, 120, () => 128)
+
+describe('frameAnalysis worker', () => {
+  const posted: EyeTrackingResult[] = []
+  let onmessage: (event: MessageEvent<FrameData>) => Promise<void>
+
+  beforeAll(async () => {
+    vi.spyOn(self, 'postMessage').mockImplementation((result: unknown) => {
+      posted.push(result as EyeTrackingResult)
+    })
+    await import('@/lib/vision/frameAnalysis.worker')
+    onmessage = self.onmessage as unknown as typeof onmessage
+  })
+
+  afterAll(() => {
+    vi.restoreAllMocks()
+  })
+
+  const analyze = async (frame: FrameData) => {
+    await onmessage({ data: frame } as MessageEvent<FrameData>)
+    return posted[posted.length - 1]
+  }
+
+  it('stops reporting a face as soon as it leaves the tracked box', async () => {
+    expect((await analyze(faceFrame())).faceDetected).toBe(true)
+    // Inside the redetect interval, where the previous box would be reused
+    expect((await analyze(faceFrame())).faceDetected).toBe(true)
+
+    const blank = await analyze(blankFrame())
+    expect(blank.faceDetected).toBe(false)
+    expect(blank.success).toBe(false)
+
+    expect((await analyze(faceFrame())).faceDetected).toBe(true)
+  })
+})
@@ -12,8 +12,13 @@ export interface AudioChunk {
   duration: number;
 }
 
+// Models list_available_models offers; the -q8_0 variants are INT8-quantized weights
+export type WhisperModelSize =
+  | 'tiny' | 'base' | 'small' | 'medium' | 'large'
+  | 'tiny-q8_0' | 'base-q8_0' | 'small-q8_0';
+
 export interface WhisperConfig {
-  modelSize: 'tiny' | 'base' | 'small' | 'medium' | 'large';
+  modelSize: WhisperModelSize;
   language?: string;
   enableVAD: boolean;
   silenceThreshold: number;
@@ -1,5 +1,11 @@
 /// <reference types="vite/client" />
 
+interface ImportMetaEnv {
+  // Developer switches read by src/lib/debugFlags.ts
+  readonly VITE_VERBOSE_TRACKING_LOGS?: string
+  readonly VITE_SIMULATE_GAZE?: string
+}
+
 declare module "*.vue" {
   import type { DefineComponent } from "vue";
   const component: DefineComponent<{}, {}, any>;